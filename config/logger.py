@@ -203,8 +203,7 @@ def setup_logging():
 
 def trace_function(func):
     """Decorator to trace function calls"""
-    @functools.wraps(func)
-    def wrapper(*args, **kwargs):
+    def _log_entry(args, kwargs):
         # Get function info
         func_name = func.__name__
         file_path = inspect.getfile(func)
@@ -218,8 +217,28 @@ def trace_function(func):
             inputs['kwargs'] = kwargs
         
         # Log function entry
-        start_time = datetime.now()
         request_tracer.log_function_entry(func_name, relative_path, inputs)
+        return datetime.now()
+    
+    if inspect.iscoroutinefunction(func):
+        # Async functions are traced around the awaited result, not the coroutine object
+        @functools.wraps(func)
+        async def async_wrapper(*args, **kwargs):
+            start_time = _log_entry(args, kwargs)
+            try:
+                result = await func(*args, **kwargs)
+                execution_time = (datetime.now() - start_time).total_seconds()
+                request_tracer.log_function_exit(func.__name__, result, execution_time)
+                return result
+            except Exception as e:
+                request_tracer.log_error(e, func.__name__)
+                raise
+        
+        return async_wrapper
+    
+    @functools.wraps(func)
+    def wrapper(*args, **kwargs):
+        start_time = _log_entry(args, kwargs)
         
         try:
             # Execute function
@@ -227,13 +246,13 @@ def trace_function(func):
             
             # Log function exit
             execution_time = (datetime.now() - start_time).total_seconds()
-            request_tracer.log_function_exit(func_name, result, execution_time)
+            request_tracer.log_function_exit(func.__name__, result, execution_time)
             
             return result
             
         except Exception as e:
             # Log error
-            request_tracer.log_error(e, func_name)
+            request_tracer.log_error(e, func.__name__)
             raise
     
     return wrapper
@@ -241,6 +260,24 @@ def trace_function(func):
 def trace_api_call(api_name: str, method: str):
     """Decorator to trace API calls"""
     def decorator(func):
+        if inspect.iscoroutinefunction(func):
+            @functools.wraps(func)
+            async def async_wrapper(*args, **kwargs):
+                params = {
+                    'args': args if args else None,
+                    'kwargs': kwargs if kwargs else None
+                }
+                
+                try:
+                    result = await func(*args, **kwargs)
+                    request_tracer.log_api_call(api_name, method, params, result)
+                    return result
+                except Exception as e:
+                    request_tracer.log_api_call(api_name, method, params, f"ERROR: {str(e)}")
+                    raise
+            
+            return async_wrapper
+        
         @functools.wraps(func)
         def wrapper(*args, **kwargs):
             # Log API call
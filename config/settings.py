@@ -11,18 +11,56 @@ class Config:
     
     # Google Calendar API
     CALENDAR_ID = os.getenv('GOOGLE_CALENDAR_ID', 'primary')
+    EXTRA_CALENDAR_IDS = [c.strip() for c in os.getenv('EXTRA_CALENDAR_IDS', '').split(',') if c.strip()]  # other own calendars counted as busy time
+    FREEBUSY_TTL_SECONDS = int(os.getenv('FREEBUSY_TTL_SECONDS', '60'))  # per-calendar free/busy cache lifetime
     GOOGLE_CREDENTIALS_PATH = os.getenv('GOOGLE_CREDENTIALS_PATH', 'credentials.json')
     TOKEN_PATH = os.getenv('TOKEN_PATH', 'token.json')
+    CALENDAR_API_BASE_URL = os.getenv('CALENDAR_API_BASE_URL', '')  # e.g. http://localhost:8085 for the fake server
+    CALENDAR_HTTP_TIMEOUT = int(os.getenv('CALENDAR_HTTP_TIMEOUT', '30'))  # seconds
+    CALENDAR_MAX_WORKERS = int(os.getenv('CALENDAR_MAX_WORKERS', '4'))  # pooled threads, one HTTP connection each
+    EVENT_PAGE_SIZE = int(os.getenv('EVENT_PAGE_SIZE', '250'))  # events per list page (API max 2500)
+    MEETING_INDEX_TTL_SECONDS = int(os.getenv('MEETING_INDEX_TTL_SECONDS', '120'))  # reuse indexed events this long
+    CALENDAR_MIRROR_PATH = os.getenv('CALENDAR_MIRROR_PATH', 'calendar_mirror.db')  # empty disables the mirror
+    MIRROR_PAST_DAYS = int(os.getenv('MIRROR_PAST_DAYS', '7'))
+    MIRROR_FUTURE_DAYS = int(os.getenv('MIRROR_FUTURE_DAYS', '60'))
+    CALENDAR_MAX_CONCURRENCY = int(os.getenv('CALENDAR_MAX_CONCURRENCY', '4'))  # in-flight async calendar calls
+    PREFETCH_INTERVAL_SECONDS = int(os.getenv('PREFETCH_INTERVAL_SECONDS', '60'))  # 0 disables the prefetcher
+    PREFETCH_FUTURE_DAYS = int(os.getenv('PREFETCH_FUTURE_DAYS', '14'))
+    PREFETCH_MAX_AGE_SECONDS = int(os.getenv('PREFETCH_MAX_AGE_SECONDS', '180'))  # prefetched data served this long
+    CALENDAR_QPS = float(os.getenv('CALENDAR_QPS', '5'))  # sustained requests/second per calendar
+    CALENDAR_BURST = int(os.getenv('CALENDAR_BURST', '10'))  # requests allowed back-to-back per calendar
+    CALENDAR_QUOTA_PER_MINUTE = int(os.getenv('CALENDAR_QUOTA_PER_MINUTE', '600'))  # shared across all calendars
+    CALENDAR_MAX_RETRIES = int(os.getenv('CALENDAR_MAX_RETRIES', '5'))
+    CALENDAR_BACKOFF_BASE = float(os.getenv('CALENDAR_BACKOFF_BASE', '0.5'))  # seconds, doubled per retry
+    CALENDAR_BACKOFF_MAX = float(os.getenv('CALENDAR_BACKOFF_MAX', '32'))  # cap on a single backoff sleep
     
     # Gemini API
     GEMINI_API_KEY = os.getenv('GEMINI_API_KEY')
     GEMINI_MODEL = 'gemini-2.0-flash'
+    LLM_TIMEOUT_SECONDS = float(os.getenv('LLM_TIMEOUT_SECONDS', '15'))  # per Gemini call; the fallback reply is used after this
+    INTENT_ROUTER_MIN_CONFIDENCE = float(os.getenv('INTENT_ROUTER_MIN_CONFIDENCE', '0.85'))  # below this the LLM classifies
+    RESPONSE_MODE = os.getenv('RESPONSE_MODE', 'template')  # 'template' renders known situations locally, 'llm' always asks Gemini
+    STREAM_LLM_SPEECH = os.getenv('STREAM_LLM_SPEECH', 'true').lower() in ['true', '1', 'yes', 'on']  # speak LLM replies sentence by sentence as they stream
+    SPECULATIVE_CLASSIFICATION = os.getenv('SPECULATIVE_CLASSIFICATION', 'true').lower() in ['true', '1', 'yes', 'on']  # classify at pauses while the user speaks
+    LLM_PROMPT_TOKEN_BUDGET = int(os.getenv('LLM_PROMPT_TOKEN_BUDGET', '600'))  # per-request prompt, excluding the system instruction
+    MEMORY_RECENT_MESSAGES = int(os.getenv('MEMORY_RECENT_MESSAGES', '8'))  # kept verbatim; older ones are summarized
+    MEMORY_SUMMARY_TOKENS = int(os.getenv('MEMORY_SUMMARY_TOKENS', '150'))  # cap on the running summary
+    LLM_CACHE_SIZE = int(os.getenv('LLM_CACHE_SIZE', '256'))  # cached LLM results (least recently used evicted)
+    LLM_CACHE_TTL_SECONDS = int(os.getenv('LLM_CACHE_TTL_SECONDS', '300'))
+    LLM_CACHE_SEMANTIC = os.getenv('LLM_CACHE_SEMANTIC', 'false').lower() in ['true', '1', 'yes', 'on']  # also match paraphrases by embedding
+    LLM_CACHE_SIMILARITY = float(os.getenv('LLM_CACHE_SIMILARITY', '0.95'))  # cosine similarity needed for a paraphrase hit
+    LLM_EMBEDDING_MODEL = os.getenv('LLM_EMBEDDING_MODEL', 'models/text-embedding-004')
     
     # Scheduling Settings
     DEFAULT_TIMEZONE = os.getenv('TIMEZONE', 'UTC')
     DEFAULT_MEETING_DURATION = timedelta(hours=1)
     BUSINESS_HOURS_START = 9  # 9 AM
     BUSINESS_HOURS_END = 17   # 5 PM
+    SLOT_STEP_MINUTES = int(os.getenv('SLOT_STEP_MINUTES', '15'))  # suggested starts fall on this grid
+    MEETING_BUFFER_MINUTES = int(os.getenv('MEETING_BUFFER_MINUTES', '0'))  # free time kept around meetings
+    MAX_MEETINGS_PER_DAY = int(os.getenv('MAX_MEETINGS_PER_DAY', '0'))  # 0 means no limit
+    OPTIMIZER_TIME_BUDGET_MS = int(os.getenv('OPTIMIZER_TIME_BUDGET_MS', '50'))
+    BATCH_SEARCH_DAYS = int(os.getenv('BATCH_SEARCH_DAYS', '5'))  # how far batch-scheduled meetings may move
     
     # Calendar Scopes
     SCOPES = ['https://www.googleapis.com/auth/calendar']
\ No newline at end of file
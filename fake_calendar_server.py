@@ -0,0 +1,374 @@
+#!/usr/bin/env python3
+"""
+Fake Google Calendar Server - a local stand-in for the Calendar v3 API
+Implements the subset the bot uses (events list/get/insert/patch/delete, freeBusy,
+batch requests and sync tokens) over synthetic, seedable calendars, with optional
+latency and error injection, for offline latency/throughput benchmarks.
+
+Point the bot at it with CALENDAR_API_BASE_URL=http://localhost:8085 (OAuth is skipped).
+Partial-response `fields` masks are accepted but ignored - full events are returned.
+"""
+
+import argparse
+import json
+import random
+import re
+import threading
+import time
+import uuid
+from datetime import datetime, timedelta, timezone
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any, Dict, List, Optional, Tuple
+from urllib.parse import parse_qs, unquote, urlparse
+
+API_PREFIX = '/calendar/v3'
+BATCH_PATH = '/batch/calendar/v3'
+
+TITLES = ['Standup', 'Sprint Planning', 'Design Review', 'One on One', 'Quarterly Business Review',
+          'Customer Call', 'Interview', 'Lunch and Learn', 'Retrospective', 'Budget Sync',
+          'Roadmap Review', 'Team Sync', 'Architecture Deep Dive', 'Hiring Debrief', 'Demo']
+PEOPLE = ['alice', 'bob', 'carol', 'dave', 'erin', 'frank', 'grace', 'heidi', 'ivan', 'judy']
+
+
+class ApiError(Exception):
+    def __init__(self, status: int, reason: str, message: str):
+        super().__init__(message)
+        self.status = status
+        self.reason = reason
+
+
+def to_rfc3339(value: datetime) -> str:
+    return value.astimezone(timezone.utc).strftime('%Y-%m-%dT%H:%M:%SZ')
+
+
+def parse_rfc3339(value: str) -> datetime:
+    return datetime.fromisoformat(value.replace('Z', '+00:00'))
+
+
+def event_bounds(event: Dict[str, Any]) -> Tuple[datetime, datetime]:
+    def bound(value):
+        if 'dateTime' in value:
+            return parse_rfc3339(value['dateTime'])
+        return datetime.fromisoformat(value['date']).replace(tzinfo=timezone.utc)
+    return bound(event['start']), bound(event['end'])
+
+
+class FakeCalendarStore:
+    """Calendars held in memory; every change gets a sequence number used for sync tokens"""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._calendars: Dict[str, Dict[str, Dict[str, Any]]] = {}
+        self._sequence = 0
+
+    def _calendar(self, calendar_id: str) -> Dict[str, Dict[str, Any]]:
+        return self._calendars.setdefault(calendar_id, {})
+
+    def _stamp(self, event: Dict[str, Any]):
+        self._sequence += 1
+        event['etag'] = f'"{self._sequence}"'
+        event['updated'] = to_rfc3339(datetime.now(timezone.utc))
+        event['_seq'] = self._sequence
+
+    @staticmethod
+    def _public(event: Dict[str, Any]) -> Dict[str, Any]:
+        return {key: value for key, value in event.items() if not key.startswith('_')}
+
+    def seed(self, calendars: int, days: int, events_per_day: float, rng: random.Random,
+             start: Optional[datetime] = None, calendar_ids: Optional[List[str]] = None):
+        """Fill calendars with business-hours meetings around `start` (today by default)"""
+        start = start or datetime.now(timezone.utc).replace(hour=0, minute=0, second=0, microsecond=0)
+        calendar_ids = calendar_ids or ['primary'] + [f'calendar-{i}@example.com' for i in range(1, calendars)]
+        for calendar_id in calendar_ids[:calendars]:
+            for day in range(-days // 2, days - days // 2):
+                date = start + timedelta(days=day)
+                if date.weekday() >= 5:
+                    continue
+                count = int(events_per_day) + (rng.random() < events_per_day % 1)
+                for _ in range(count):
+                    begin = date + timedelta(hours=8, minutes=15 * rng.randrange(40))
+                    duration = timedelta(minutes=rng.choice([15, 30, 30, 45, 60, 60, 90]))
+                    self.insert(calendar_id, {
+                        'summary': rng.choice(TITLES),
+                        'description': '',
+                        'start': {'dateTime': to_rfc3339(begin)},
+                        'end': {'dateTime': to_rfc3339(begin + duration)},
+                        'attendees': [{'email': f'{name}@example.com'} for name in rng.sample(PEOPLE, rng.randint(0, 3))],
+                    })
+
+    def insert(self, calendar_id: str, body: Dict[str, Any]) -> Dict[str, Any]:
+        with self._lock:
+            event = dict(body)
+            event['id'] = body.get('id') or uuid.uuid4().hex
+            event['status'] = 'confirmed'
+            event_bounds(event)  # reject malformed times up front
+            self._stamp(event)
+            self._calendar(calendar_id)[event['id']] = event
+            return self._public(event)
+
+    def get(self, calendar_id: str, event_id: str) -> Dict[str, Any]:
+        with self._lock:
+            return self._public(self._live_event(calendar_id, event_id))
+
+    def patch(self, calendar_id: str, event_id: str, body: Dict[str, Any],
+              if_match: Optional[str] = None) -> Dict[str, Any]:
+        with self._lock:
+            event = self._live_event(calendar_id, event_id)
+            if if_match and if_match != event['etag']:
+                raise ApiError(412, 'conditionNotMet', 'Precondition Failed')
+            event.update(body)
+            self._stamp(event)
+            return self._public(event)
+
+    def delete(self, calendar_id: str, event_id: str):
+        with self._lock:
+            event = self._live_event(calendar_id, event_id)
+            event['status'] = 'cancelled'  # kept as a tombstone for incremental sync
+            self._stamp(event)
+
+    def _live_event(self, calendar_id: str, event_id: str) -> Dict[str, Any]:
+        event = self._calendar(calendar_id).get(event_id)
+        if event is None:
+            raise ApiError(404, 'notFound', 'Not Found')
+        if event['status'] == 'cancelled':
+            raise ApiError(410, 'deleted', 'Resource has been deleted')
+        return event
+
+    def list(self, calendar_id: str, params: Dict[str, str]) -> Dict[str, Any]:
+        max_results = min(int(params.get('maxResults', 250)), 2500)
+        offset = int(params.get('pageToken', 0))
+        sync_token = params.get('syncToken')
+
+        with self._lock:
+            events = list(self._calendar(calendar_id).values())
+            if sync_token:
+                since = self._parse_sync_token(calendar_id, sync_token)
+                matches = [event for event in events if event['_seq'] > since]
+            else:
+                time_min = parse_rfc3339(params['timeMin']) if 'timeMin' in params else None
+                time_max = parse_rfc3339(params['timeMax']) if 'timeMax' in params else None
+                matches = []
+                for event in events:
+                    if event['status'] == 'cancelled' and params.get('showDeleted') != 'true':
+                        continue
+                    start, end = event_bounds(event)
+                    if (time_min is None or end > time_min) and (time_max is None or start < time_max):
+                        matches.append(event)
+            matches.sort(key=lambda event: (event_bounds(event)[0], event['id']))
+            page = [self._public(event) for event in matches[offset:offset + max_results]]
+            sequence = self._sequence
+
+        result = {'kind': 'calendar#events', 'items': page}
+        if offset + max_results < len(matches):
+            result['nextPageToken'] = str(offset + max_results)
+        else:
+            result['nextSyncToken'] = f'{calendar_id}|{sequence}'
+        return result
+
+    @staticmethod
+    def _parse_sync_token(calendar_id: str, token: str) -> int:
+        token_calendar, _, sequence = token.rpartition('|')
+        if token_calendar != calendar_id or not sequence.isdigit():
+            raise ApiError(410, 'fullSyncRequired', 'Sync token is no longer valid, a full sync is required.')
+        return int(sequence)
+
+    def free_busy(self, body: Dict[str, Any]) -> Dict[str, Any]:
+        time_min, time_max = parse_rfc3339(body['timeMin']), parse_rfc3339(body['timeMax'])
+        calendars = {}
+        with self._lock:
+            for item in body.get('items', []):
+                busy = []
+                for event in self._calendar(item['id']).values():
+                    if event['status'] == 'cancelled':
+                        continue
+                    start, end = event_bounds(event)
+                    if end > time_min and start < time_max:
+                        busy.append((max(start, time_min), min(end, time_max)))
+                busy.sort()
+                calendars[item['id']] = {'busy': [{'start': to_rfc3339(s), 'end': to_rfc3339(e)} for s, e in busy]}
+        return {'kind': 'calendar#freeBusy', 'timeMin': body['timeMin'], 'timeMax': body['timeMax'],
+                'calendars': calendars}
+
+
+class FakeCalendarHandler(BaseHTTPRequestHandler):
+    protocol_version = 'HTTP/1.1'  # keep-alive, like the real API
+    server: 'FakeCalendarServer'
+
+    def log_message(self, format, *args):
+        if self.server.verbose:
+            super().log_message(format, *args)
+
+    def do_GET(self):
+        self._handle()
+
+    def do_POST(self):
+        self._handle()
+
+    def do_PATCH(self):
+        self._handle()
+
+    def do_DELETE(self):
+        self._handle()
+
+    def _handle(self):
+        self.server.inject_latency()
+        length = int(self.headers.get('Content-Length') or 0)
+        body = self.rfile.read(length) if length else b''
+
+        if self.path.startswith(BATCH_PATH):
+            payload, content_type = self.server.handle_batch(self.headers.get('Content-Type', ''), body)
+            self._send(200, payload, content_type)
+            return
+
+        status, result = self.server.dispatch(self.command, self.path, dict(self.headers), body)
+        self._send(status, json.dumps(result).encode('utf-8') if result is not None else b'', 'application/json')
+
+    def _send(self, status: int, payload: bytes, content_type: str):
+        self.send_response(status)
+        self.send_header('Content-Type', content_type)
+        self.send_header('Content-Length', str(len(payload)))
+        self.end_headers()
+        self.wfile.write(payload)
+
+
+class FakeCalendarServer(ThreadingHTTPServer):
+    """Threaded HTTP server over a FakeCalendarStore; start() runs it on a daemon thread"""
+
+    daemon_threads = True
+
+    def __init__(self, host: str = 'localhost', port: int = 8085, store: Optional[FakeCalendarStore] = None,
+                 latency_ms: float = 0.0, jitter_ms: float = 0.0, error_rate: float = 0.0,
+                 seed: Optional[int] = None, verbose: bool = False):
+        super().__init__((host, port), FakeCalendarHandler)
+        self.store = store or FakeCalendarStore()
+        self.latency_ms = latency_ms
+        self.jitter_ms = jitter_ms
+        self.error_rate = error_rate
+        self.verbose = verbose
+        self._rng = random.Random(seed)
+        self._thread = None
+
+    @property
+    def url(self) -> str:
+        host, port = self.server_address[:2]
+        return f'http://{host}:{port}'
+
+    def start(self) -> 'FakeCalendarServer':
+        self._thread = threading.Thread(target=self.serve_forever, name='fake-calendar', daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self):
+        self.shutdown()
+        self.server_close()
+
+    def inject_latency(self):
+        delay = self.latency_ms + self._rng.uniform(0, self.jitter_ms)
+        if delay > 0:
+            time.sleep(delay / 1000.0)
+
+    def dispatch(self, method: str, path: str, headers: Dict[str, str], body: bytes) -> Tuple[int, Optional[Dict]]:
+        """Route one API call; returns (status, JSON body or None)"""
+        if self.error_rate and self._rng.random() < self.error_rate:
+            return self._error(ApiError(503, 'backendError', 'Backend Error'))
+
+        url = urlparse(path)
+        params = {key: values[-1] for key, values in parse_qs(url.query).items()}
+        route = url.path[len(API_PREFIX):] if url.path.startswith(API_PREFIX) else None
+        try:
+            data = json.loads(body) if body else {}
+            if route == '/freeBusy' and method == 'POST':
+                return 200, self.store.free_busy(data)
+
+            match = re.fullmatch(r'/calendars/([^/]+)/events(?:/([^/]+))?', route or '')
+            if not match:
+                raise ApiError(404, 'notFound', f'No route for {method} {url.path}')
+            calendar_id, event_id = unquote(match.group(1)), match.group(2) and unquote(match.group(2))
+
+            if event_id is None and method == 'GET':
+                return 200, self.store.list(calendar_id, params)
+            if event_id is None and method == 'POST':
+                return 200, self.store.insert(calendar_id, data)
+            if method == 'GET':
+                return 200, self.store.get(calendar_id, event_id)
+            if method == 'PATCH':
+                if_match = next((value for key, value in headers.items() if key.lower() == 'if-match'), None)
+                return 200, self.store.patch(calendar_id, event_id, data, if_match)
+            if method == 'DELETE':
+                self.store.delete(calendar_id, event_id)
+                return 204, None
+            raise ApiError(405, 'methodNotAllowed', f'{method} not supported')
+        except ApiError as error:
+            return self._error(error)
+        except (ValueError, KeyError) as error:
+            return self._error(ApiError(400, 'badRequest', str(error)))
+
+    @staticmethod
+    def _error(error: ApiError) -> Tuple[int, Dict]:
+        return error.status, {'error': {'code': error.status, 'message': str(error),
+                                        'errors': [{'reason': error.reason, 'message': str(error)}]}}
+
+    def handle_batch(self, content_type: str, body: bytes) -> Tuple[bytes, str]:
+        """Run each application/http part of a multipart/mixed batch and answer in kind"""
+        match = re.search(r'boundary="?([^";]+)"?', content_type)
+        if not match:
+            status, result = self._error(ApiError(400, 'badRequest', 'Missing multipart boundary'))
+            return json.dumps(result).encode('utf-8'), 'application/json'
+
+        boundary = match.group(1)
+        responses = []
+        text = body.decode('utf-8').replace('\r\n', '\n')  # clients differ in line endings
+        for part in text.split(f'--{boundary}')[1:]:
+            if part.startswith('--'):
+                break
+            outer_headers, _, inner = part.lstrip('\n').partition('\n\n')
+            content_id = re.search(r'Content-ID:\s*<?([^>\n]+)>?', outer_headers, re.I)
+            request_head, _, request_body = inner.partition('\n\n')
+            request_line, *header_lines = request_head.split('\n')
+            method, path = request_line.split(' ')[:2]
+            headers = dict(line.split(': ', 1) for line in header_lines if ': ' in line)
+
+            status, result = self.dispatch(method, path, headers, request_body.strip().encode('utf-8'))
+            payload = json.dumps(result) if result is not None else ''
+            response_id = f"response-{content_id.group(1)}" if content_id else 'response'
+            responses.append(
+                f'Content-Type: application/http\r\nContent-ID: <{response_id}>\r\n\r\n'
+                f'HTTP/1.1 {status} {"OK" if status < 400 else "Error"}\r\n'
+                f'Content-Type: application/json\r\nContent-Length: {len(payload)}\r\n\r\n{payload}\r\n'
+            )
+
+        response_boundary = f'batch_{uuid.uuid4().hex}'
+        payload = ''.join(f'--{response_boundary}\r\n{part}' for part in responses) + f'--{response_boundary}--\r\n'
+        return payload.encode('utf-8'), f'multipart/mixed; boundary={response_boundary}'
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Local fake Google Calendar v3 server')
+    parser.add_argument('--host', default='localhost')
+    parser.add_argument('--port', type=int, default=8085)
+    parser.add_argument('--calendars', type=int, default=1, help='number of synthetic calendars')
+    parser.add_argument('--days', type=int, default=60, help='days of events, centred on today')
+    parser.add_argument('--events-per-day', type=float, default=4.0, help='average meetings per weekday')
+    parser.add_argument('--seed', type=int, default=42, help='random seed for reproducible calendars')
+    parser.add_argument('--latency-ms', type=float, default=0.0, help='fixed delay added to every request')
+    parser.add_argument('--jitter-ms', type=float, default=0.0, help='extra uniform random delay per request')
+    parser.add_argument('--error-rate', type=float, default=0.0, help='fraction of calls answered with a 503')
+    parser.add_argument('--verbose', action='store_true', help='log every request')
+    args = parser.parse_args()
+
+    store = FakeCalendarStore()
+    store.seed(args.calendars, args.days, args.events_per_day, random.Random(args.seed))
+    server = FakeCalendarServer(args.host, args.port, store, args.latency_ms, args.jitter_ms,
+                                args.error_rate, seed=args.seed, verbose=args.verbose)
+    print(f"🗓️  Fake Google Calendar listening on {server.url} "
+          f"({args.calendars} calendar(s), ~{args.events_per_day} events/weekday over {args.days} days)")
+    print(f"   Set CALENDAR_API_BASE_URL={server.url} to point the bot at it")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        print("\nShutting down")
+        server.server_close()
+
+
+if __name__ == '__main__':
+    main()
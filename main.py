@@ -4,9 +4,10 @@ import json
 import pytz
 from datetime import datetime, timedelta
 from colorama import init, Fore, Style
-from services.calendar_manager import CalendarManager
+from services.calendar_manager import CalendarManager, CalendarUnavailableError
 from services.conversation_handler import ConversationHandler
 from services.scheduler_logic import SchedulerLogic
+from services.async_calendar_client import AsyncCalendarClient
 import asyncio
 from dotenv import load_dotenv
 
@@ -26,7 +27,10 @@ class MeetingSchedulerBot:
         
         # try:
         self.calendar_manager = CalendarManager()
+        self.async_calendar = AsyncCalendarClient(self.calendar_manager)
         self.conversation_handler = ConversationHandler()
+        self.conversation_handler.calendar_version = self.calendar_manager.calendar_version
+        self.conversation_handler.prefetch_calendar = self._prefetch_calendar
         self.scheduler = SchedulerLogic(self.calendar_manager)
         self.pending_context = {}  # Store context for multi-turn conversations
         print(f"{Fore.GREEN}✅ Bot initialized successfully!{Style.RESET_ALL}")
@@ -56,7 +60,7 @@ class MeetingSchedulerBot:
                 await self.conversation_handler.speak_response_in_terminal("How can I help you with your calendar?")
             
                 # 🎤 Get user voice input
-                user_input = self.conversation_handler.get_user_voice_input()
+                user_input = await self.conversation_handler.listen(self.pending_context)
                 print(f"{Fore.WHITE}You (spoken): {user_input}{Style.RESET_ALL}")
 
                 if user_input.lower() in ['exit', 'quit', 'bye']:
@@ -69,14 +73,15 @@ class MeetingSchedulerBot:
                 # Start request tracing
                 request_id = request_tracer.start_request(user_input)
                 
-                # Process user input
+                # Process user input (LLM replies start playing while they are generated)
+                self.conversation_handler.start_speech()
                 response = await self._process_user_request(user_input)
                 
                 # End request tracing
                 request_tracer.end_request(response)
                 
                 print(f"{Fore.GREEN}Bot: {response}{Style.RESET_ALL}\n")
-                await self.conversation_handler.speak_response_in_terminal(response)
+                await self.conversation_handler.finish_speech(response)
                 
             except KeyboardInterrupt:
                 print(f"\n\n{Fore.BLUE}👋 Thanks for using me! Hope I made your day a little easier! Take care! ✨{Style.RESET_ALL}")
@@ -84,6 +89,8 @@ class MeetingSchedulerBot:
             except Exception as e:
                 request_tracer.log_error(e, "main_loop")
                 print(f"{Fore.RED}❌ An error occurred: {e}{Style.RESET_ALL}")
+        
+        self.async_calendar.close()
     
     @trace_function
     async def _process_user_request(self, user_input: str) -> str:
@@ -91,9 +98,12 @@ class MeetingSchedulerBot:
         if user_input.lower() in ['debug history', 'show history', 'chat history']:
             return self.conversation_handler.get_history_summary()
         
+        if user_input.lower() in ['cache stats', 'debug cache']:
+            return self.conversation_handler.get_cache_summary()
+        
         if user_input.lower() in ['clear history', 'reset history']:
             self.conversation_handler.clear_history()
-            return self.conversation_handler.generate_dynamic_response(
+            return await self.conversation_handler.generate_dynamic_response(
                 situation="User requested to clear conversation history and it was successfully cleared",
                 context_data={'action': 'clear_history'}
             )
@@ -148,29 +158,29 @@ class MeetingSchedulerBot:
         
         # Handle different intents
         if result['intent'] == 'ADD_MEETING':
-            response = self._handle_add_meeting(result)
+            response = await self._handle_add_meeting(result)
         elif result['intent'] == 'DELETE_MEETING':
-            response = self._handle_delete_meeting(result)
+            response = await self._handle_delete_meeting(result)
         elif result['intent'] == 'VIEW_SCHEDULE':
-            response = self._handle_view_schedule(result, user_input)
+            response = await self._handle_view_schedule(result, user_input)
         elif result['intent'] == 'VIEW_CALENDAR':
-            response = self._handle_view_schedule(result, user_input)
+            response = await self._handle_view_schedule(result, user_input)
         elif result['intent'] == 'CHECK_AVAILABILITY':
-            response = self._handle_check_availability(result)
+            response = await self._handle_check_availability(result)
         elif result['intent'] == 'RESCHEDULE_MEETING':
-            response = self._handle_reschedule_meeting(result)
+            response = await self._handle_reschedule_meeting(result)
         elif result['intent'] == 'FIND_MEETINGS':
-            response = self._handle_find_meetings(result)
+            response = await self._handle_find_meetings(result)
         elif result['intent'] == 'CONFIRMATION':
-            response = self._handle_confirmation(result)
+            response = await self._handle_confirmation(result)
         elif result['intent'] == 'PROVIDE_INFO':
-            response = self._handle_provide_info(result)
+            response = await self._handle_provide_info(result)
         elif result['intent'] == 'GREETING':
             response = result.get('response', 'Hello! How can I help you with your schedule today?')
             # Clear any pending context on greeting
             self.pending_context = {}
         elif result['intent'] == 'HELP':
-            response = self._get_help_message()
+            response = await self._get_help_message()
             # Clear any pending context on help request
             self.pending_context = {}
         else:
@@ -187,8 +197,29 @@ class MeetingSchedulerBot:
         
         return response
     
+    async def _prefetch_calendar(self, result: dict):
+        """Warm the meeting index for what a speculatively classified request will read"""
+        data = result.get('extracted_data', {})
+        if result.get('intent') == 'DELETE_MEETING' and data.get('meeting_identifier'):
+            await self.async_calendar.find_meetings(data['meeting_identifier'], data.get('query_date'))
+            return
+        if result.get('intent') != 'VIEW_CALENDAR':
+            return
+        today = datetime.now().replace(hour=0, minute=0, second=0, microsecond=0)
+        if data.get('date_range') in ['this_week', 'next_week']:
+            start = today - timedelta(days=today.weekday())
+            if data['date_range'] == 'next_week':
+                start += timedelta(days=7)
+            end = start + timedelta(days=6, hours=23, minutes=59, seconds=59)
+        elif 'query_date' in data:
+            start = datetime.fromisoformat(data['query_date'])
+            end = start + timedelta(days=1)
+        else:
+            return  # today is always in the prefetcher's window
+        await self.async_calendar.get_events(start, end, max_age=self.calendar_manager.config.PREFETCH_MAX_AGE_SECONDS)
+
     @trace_function
-    def _handle_view_schedule(self, result: dict, user_input: str) -> str:
+    async def _handle_view_schedule(self, result: dict, user_input: str) -> str:
         """Handle viewing schedule requests"""
         try:
             data = result.get('extracted_data', {})
@@ -223,22 +254,22 @@ class MeetingSchedulerBot:
                 start_of_week = monday.replace(hour=0, minute=0, second=0, microsecond=0)
                 end_of_week = start_of_week + timedelta(days=6, hours=23, minutes=59, seconds=59)
                 
-                events = self.calendar_manager.get_events(start_of_week, end_of_week)
+                events = await self.async_calendar.get_events(start_of_week, end_of_week, max_age=self.calendar_manager.config.PREFETCH_MAX_AGE_SECONDS)
                 date_str = f"{week_label} ({start_of_week.strftime('%B %d')} - {end_of_week.strftime('%B %d, %Y')})"
                 
             elif 'query_date' in data:
                 # Single day request
                 query_date = datetime.fromisoformat(data['query_date'])
                 end_date = query_date + timedelta(days=1)
-                events = self.calendar_manager.get_events(query_date, end_date)
+                events = await self.async_calendar.get_events(query_date, end_date, max_age=self.calendar_manager.config.PREFETCH_MAX_AGE_SECONDS)
                 date_str = query_date.strftime('%B %d, %Y')
             else:
                 # Default to today
-                events = self.calendar_manager.get_todays_events()
+                events = await self.async_calendar.get_todays_events()
                 date_str = "today"
             
             if not events:
-                return self.conversation_handler.generate_dynamic_response(
+                return await self.conversation_handler.generate_dynamic_response(
                     situation="User requested to view schedule but no meetings found",
                     context_data={
                         'date_requested': date_str,
@@ -262,7 +293,7 @@ class MeetingSchedulerBot:
                 }
                 formatted_events.append(event_info)
             
-            return self.conversation_handler.generate_dynamic_response(
+            return await self.conversation_handler.generate_dynamic_response(
                 situation="Showing user their schedule with meetings",
                 context_data={
                     'date_requested': date_str,
@@ -273,13 +304,13 @@ class MeetingSchedulerBot:
             )
             
         except Exception as e:
-            return self.conversation_handler.generate_dynamic_response(
+            return await self.conversation_handler.generate_dynamic_response(
                 situation="Error occurred while trying to retrieve schedule",
                 context_data={'error': str(e)}
             )
     
     @trace_function
-    def _handle_add_meeting(self, result: dict) -> str:
+    async def _handle_add_meeting(self, result: dict) -> str:
         """Handle meeting creation requests"""
         try:
             data = result.get('extracted_data', {})
@@ -298,7 +329,7 @@ class MeetingSchedulerBot:
                 }
                 
                 # Generate dynamic response for missing information
-                return self.conversation_handler.generate_dynamic_response(
+                return await self.conversation_handler.generate_dynamic_response(
                     situation="User wants to schedule a meeting but some required information is missing",
                     context_data={
                         'missing_fields': missing_fields,
@@ -309,12 +340,14 @@ class MeetingSchedulerBot:
             
             # All required fields are present - try to schedule immediately
             print(f"DEBUG: All fields present, attempting to schedule...")  # Debug print
-            success, message, alternatives = self.scheduler.schedule_meeting(data)
+            if self._wants_separate_meetings(data):
+                return await self._schedule_separately(data)
+            success, message, alternatives = await self.async_calendar.run(self.scheduler.schedule_meeting, data)
             print(f"DEBUG: Schedule result - Success: {success}, Message: {message}")  # Debug print
             
             if success:
                 self.pending_context = {}  # Clear context after successful action
-                return self.conversation_handler.generate_dynamic_response(
+                return await self.conversation_handler.generate_dynamic_response(
                     situation="Meeting was successfully scheduled",
                     context_data={
                         'meeting_title': data.get('meeting_title', 'Untitled Meeting'),
@@ -330,7 +363,7 @@ class MeetingSchedulerBot:
                     'context': {'conflict': True, 'suggestions': alternatives}
                 }
                 
-                return self.conversation_handler.generate_dynamic_response(
+                return await self.conversation_handler.generate_dynamic_response(
                     situation="Requested meeting time conflicts with existing schedule, offering alternatives",
                     context_data={
                         'requested_time': data.get('start_datetime'),
@@ -340,7 +373,7 @@ class MeetingSchedulerBot:
                 )
             else:
                 self.pending_context = {}
-                return self.conversation_handler.generate_dynamic_response(
+                return await self.conversation_handler.generate_dynamic_response(
                     situation="Failed to schedule meeting",
                     context_data={
                         'error_message': message,
@@ -351,13 +384,13 @@ class MeetingSchedulerBot:
         except Exception as e:
             print(f"DEBUG: Exception in _handle_add_meeting: {e}")  # Debug print
             self.pending_context = {}
-            return self.conversation_handler.generate_dynamic_response(
+            return await self.conversation_handler.generate_dynamic_response(
                 situation="Error occurred while trying to schedule meeting",
                 context_data={'error': str(e)}
             )
     
     @trace_function
-    def _handle_delete_meeting(self, result: dict) -> str:
+    async def _handle_delete_meeting(self, result: dict) -> str:
         """Handle meeting deletion requests"""
         try:
             data = result.get('extracted_data', {})
@@ -370,13 +403,13 @@ class MeetingSchedulerBot:
                     # Check meetings for the specific date
                     start_date = datetime.fromisoformat(query_date)
                     end_date = start_date + timedelta(days=1)
-                    meetings_on_date = self.calendar_manager.get_events(start_date, end_date)
+                    meetings_on_date = await self.async_calendar.get_events(start_date, end_date)
                     date_str = start_date.strftime('%B %d, %Y')
                     
                     if not meetings_on_date:
                         # No meetings on that date
                         self.pending_context = {}
-                        return self.conversation_handler.generate_dynamic_response(
+                        return await self.conversation_handler.generate_dynamic_response(
                             situation="User wants to cancel meetings on a specific date but no meetings exist on that date",
                             context_data={
                                 'query_date': date_str,
@@ -402,7 +435,7 @@ class MeetingSchedulerBot:
                             }
                             meeting_list.append(meeting_info)
                         
-                        return self.conversation_handler.generate_dynamic_response(
+                        return await self.conversation_handler.generate_dynamic_response(
                             situation="User wants to cancel meetings on a specific date, showing actual meetings that exist",
                             context_data={
                                 'query_date': date_str,
@@ -418,18 +451,19 @@ class MeetingSchedulerBot:
                         'data': data,
                         'context': {'needs_identifier': True}
                     }
-                    return self.conversation_handler.generate_dynamic_response(
+                    return await self.conversation_handler.generate_dynamic_response(
                         situation="User wants to cancel a meeting but didn't specify which one or when",
                         context_data={'action': 'delete_meeting'}
                     )
             
-            # Search for meetings that match the identifier
-            matching_meetings = self._find_meetings_by_identifier(meeting_identifier, query_date)
+            # Search for exact and similar matches concurrently - the fuzzy results are only
+            # used when nothing matches exactly, but fetching both at once saves a round-trip
+            matching_meetings, similar_meetings = await self.async_calendar.gather(
+                self.async_calendar.run(self._find_meetings_by_identifier, meeting_identifier, query_date),
+                self.async_calendar.find_similar_meetings(meeting_identifier, query_date)
+            )
             
             if not matching_meetings:
-                # Try fuzzy matching for similar meetings
-                similar_meetings = self.calendar_manager.find_similar_meetings(meeting_identifier, query_date)
-                
                 if similar_meetings:
                     # Found similar meetings, ask user to clarify
                     self.pending_context = {
@@ -448,7 +482,7 @@ class MeetingSchedulerBot:
                         }
                         meeting_list.append(meeting_info)
                     
-                    return self.conversation_handler.generate_dynamic_response(
+                    return await self.conversation_handler.generate_dynamic_response(
                         situation="No exact matches found but found similar meetings, asking user to clarify",
                         context_data={
                             'search_term': meeting_identifier,
@@ -458,7 +492,7 @@ class MeetingSchedulerBot:
                     )
                 else:
                     self.pending_context = {}
-                    return self.conversation_handler.generate_dynamic_response(
+                    return await self.conversation_handler.generate_dynamic_response(
                         situation="No meetings found matching the user's description",
                         context_data={
                             'search_term': meeting_identifier,
@@ -474,7 +508,7 @@ class MeetingSchedulerBot:
                     'context': {'meeting_to_delete': meeting, 'awaiting_confirmation': True}
                 }
                 
-                return self.conversation_handler.generate_dynamic_response(
+                return await self.conversation_handler.generate_dynamic_response(
                     situation="Found specific meeting to delete, asking for user confirmation",
                     context_data={
                         'meeting_title': meeting.title,
@@ -501,7 +535,7 @@ class MeetingSchedulerBot:
                     }
                     meeting_list.append(meeting_info)
                 
-                return self.conversation_handler.generate_dynamic_response(
+                return await self.conversation_handler.generate_dynamic_response(
                     situation="Multiple meetings found matching user's description, need clarification",
                     context_data={
                         'search_term': meeting_identifier,
@@ -512,128 +546,56 @@ class MeetingSchedulerBot:
                 
         except Exception as e:
             self.pending_context = {}
-            return self.conversation_handler.generate_dynamic_response(
+            return await self.conversation_handler.generate_dynamic_response(
                 situation="Error occurred while trying to cancel meeting",
                 context_data={'error': str(e)}
             )
     
+    @staticmethod
+    def _wants_separate_meetings(data: dict) -> bool:
+        return bool(data.get('separate_meetings')) and len(data.get('attendees') or []) > 1
+
+    @trace_function
+    async def _schedule_separately(self, data: dict) -> str:
+        """Schedule one meeting per attendee ("1:1s with each of ..."), placed together without
+        clashing and created in one batch"""
+        requests = [dict(data, attendees=[attendee]) for attendee in data['attendees']]
+        success, message, scheduled = await self.async_calendar.run(self.scheduler.schedule_meetings, requests)
+        self.pending_context = {}
+        placed = [
+            {'attendee': request['attendees'][0], 'time': meeting.start_time.strftime('%I:%M %p on %B %d')}
+            for request, meeting in zip(requests, scheduled) if meeting
+        ]
+        not_scheduled = [request['attendees'][0] for request, meeting in zip(requests, scheduled) if not meeting]
+        return await self.conversation_handler.generate_dynamic_response(
+            situation="Scheduled a separate meeting with each attendee" if success
+                      else "Failed to schedule the separate meetings with each attendee",
+            context_data={
+                'meeting_title': data.get('meeting_title', 'Untitled Meeting'),
+                'meetings': placed,
+                'not_scheduled': not_scheduled,
+                'error_message': None if success else message
+            }
+        )
+
     @trace_function
     def _find_meetings_by_identifier(self, identifier: str, query_date: str = None) -> list:
-        """Find meetings that match the given identifier (title, time, etc.)"""
-        try:
-            # Determine search date range
-            if query_date:
-                start_date = datetime.fromisoformat(query_date)
-                end_date = start_date + timedelta(days=1)
-            else:
-                # Search from beginning of today to 30 days ahead
-                now = datetime.now()
-                start_date = now.replace(hour=0, minute=0, second=0, microsecond=0)
-                end_date = start_date + timedelta(days=30)
-            
-            all_meetings = self.calendar_manager.get_events(start_date, end_date)
-            matching_meetings = []
-            
-            identifier_lower = identifier.lower()
-            
-            # Extract potential email addresses from the identifier
-            import re
-            email_pattern = r'\b[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Z|a-z]{2,}\b'
-            extracted_emails = re.findall(email_pattern, identifier)
-            
-            # Extract potential time patterns from the identifier
-            time_patterns = [
-                r'\b(\d{1,2})\s*pm\b',     # "2 PM", "2PM", "12 pm"
-                r'\b(\d{1,2})\s*am\b',     # "9 AM", "9AM", "10 am"
-                r'\b(\d{1,2}):(\d{2})\s*pm\b',  # "2:30 PM", "2:30PM"
-                r'\b(\d{1,2}):(\d{2})\s*am\b',  # "9:30 AM", "9:30AM"
-            ]
-            
-            extracted_times = []
-            for pattern in time_patterns:
-                matches = re.findall(pattern, identifier_lower)
-                for match in matches:
-                    if isinstance(match, tuple):
-                        if len(match) == 2:  # Hour and minute
-                            hour, minute = match
-                            extracted_times.append(f"{hour}:{minute}")
-                        else:
-                            extracted_times.append(match[0])
-                    else:
-                        extracted_times.append(match)
-            
-            print(f"DEBUG: Identifier: '{identifier}', Extracted times: {extracted_times}, Extracted emails: {extracted_emails}")
-            
-            for meeting in all_meetings:
-                match_found = False
-                
-                # Check if identifier matches title
-                if identifier_lower in meeting.title.lower():
-                    matching_meetings.append(meeting)
-                    match_found = True
-                    print(f"DEBUG: Title match - Meeting: {meeting.title}")
-                
-                # Check if any extracted email addresses match meeting attendees
-                if not match_found and extracted_emails and meeting.attendees:
-                    for email in extracted_emails:
-                        if email.lower() in [attendee.lower() for attendee in meeting.attendees]:
-                            matching_meetings.append(meeting)
-                            match_found = True
-                            print(f"DEBUG: Attendee match - Meeting: {meeting.title}, matched email: {email}")
-                            break
-                
-                # Check if extracted times match meeting time
-                if not match_found and extracted_times:
-                    meeting_time_12h = meeting.start_time.strftime('%I:%M %p').lower()  # "02:00 pm"
-                    meeting_hour_12h = meeting.start_time.strftime('%I %p').lower()     # "02 pm"
-                    meeting_time_24h = meeting.start_time.strftime('%H:%M')             # "14:00"
-                    
-                    for extracted_time in extracted_times:
-                        # Handle different time formats
-                        if ':' in extracted_time:
-                            # Time with minutes (e.g., "2:30")
-                            time_part = extracted_time
-                            # Check if it matches the time part of the meeting
-                            if (time_part in meeting_time_12h or 
-                                time_part in meeting_time_24h):
-                                matching_meetings.append(meeting)
-                                match_found = True
-                                print(f"DEBUG: Time match (with minutes) - Meeting: {meeting.title} at {meeting_time_12h}, matched: {time_part}")
-                                break
-                        else:
-                            # Just hour (e.g., "2")
-                            hour = extracted_time
-                            # Convert to different formats for comparison
-                            try:
-                                hour_int = int(hour)
-                                # Check 12-hour format matches
-                                if (f"{hour_int:02d}" in meeting_time_12h.split(':')[0] or  # "02" in "02:00 pm"
-                                    f"{hour_int}" == meeting.start_time.strftime('%I').lstrip('0')):  # "2" == "2" (no leading zero)
-                                    matching_meetings.append(meeting)
-                                    match_found = True
-                                    print(f"DEBUG: Hour match - Meeting: {meeting.title} at {meeting_time_12h}, matched hour: {hour}")
-                                    break
-                            except ValueError:
-                                continue
-                
-                if match_found:
-                    continue
-            
-            print(f"DEBUG: Found {len(matching_meetings)} matching meetings")
-            return matching_meetings
-        except Exception as e:
-            print(f"Error finding meetings: {e}")
-            return []
+        """Find meetings that match the given identifier (title, attendee email, time, etc.)"""
+        # Title words, attendee emails and spoken times ("2 PM", "9:30am") are all answered
+        # from the calendar manager's meeting index rather than a fetch-and-scan
+        matching_meetings = self.calendar_manager.find_meetings(identifier, query_date)
+        print(f"DEBUG: Found {len(matching_meetings)} matching meetings for identifier '{identifier}'")
+        return matching_meetings
     
     @trace_function
-    def _handle_check_availability(self, result: dict) -> str:
+    async def _handle_check_availability(self, result: dict) -> str:
         """Handle availability checking requests"""
         try:
             data = result.get('extracted_data', {})
             
             # Check if we have the required datetime information
             if 'start_datetime' not in data:
-                return self.conversation_handler.generate_dynamic_response(
+                return await self.conversation_handler.generate_dynamic_response(
                     situation="User wants to check availability but didn't specify when",
                     context_data={'extracted_data': data}
                 )
@@ -649,11 +611,11 @@ class MeetingSchedulerBot:
                 end_time = start_time + timedelta(minutes=duration_minutes)
             
             # Check for conflicts
-            conflicts = self.calendar_manager.get_events(start_time, end_time)
+            conflicts = await self.async_calendar.get_events(start_time, end_time, required=True)
             available = len(conflicts) == 0
             
             if available:
-                return self.conversation_handler.generate_dynamic_response(
+                return await self.conversation_handler.generate_dynamic_response(
                     situation="User checked availability and the time slot is free",
                     context_data={
                         'start_time': start_time.strftime('%I:%M %p'),
@@ -671,7 +633,7 @@ class MeetingSchedulerBot:
                         'time': f"{meeting.start_time.strftime('%I:%M %p')} - {meeting.end_time.strftime('%I:%M %p')}"
                     })
                 
-                return self.conversation_handler.generate_dynamic_response(
+                return await self.conversation_handler.generate_dynamic_response(
                     situation="User checked availability but there are conflicting meetings",
                     context_data={
                         'start_time': start_time.strftime('%I:%M %p'),
@@ -683,27 +645,32 @@ class MeetingSchedulerBot:
                     }
                 )
                 
+        except CalendarUnavailableError as e:
+            return await self.conversation_handler.generate_dynamic_response(
+                situation="Couldn't check availability because the calendar couldn't be reached and there are no saved events for that time",
+                context_data={'error': str(e)}
+            )
         except Exception as e:
-            return self.conversation_handler.generate_dynamic_response(
+            return await self.conversation_handler.generate_dynamic_response(
                 situation="Error occurred while checking availability",
                 context_data={'error': str(e)}
             )
     
     @trace_function
-    def _handle_find_meetings(self, result: dict) -> str:
+    async def _handle_find_meetings(self, result: dict) -> str:
         """Handle finding specific meetings"""
         try:
             data = result.get('extracted_data', {})
             
             if 'person_email' in data:
-                meetings = self.calendar_manager.get_events_with_person(data['person_email'])
+                meetings = await self.async_calendar.get_events_with_person(data['person_email'])
                 person_name = data['person_email'].split('@')[0]
                 context_desc = f"with {person_name}"
             else:
                 # Default to this week's meetings
                 start_date = datetime.now()
                 end_date = start_date + timedelta(days=7)
-                meetings = self.calendar_manager.get_events(start_date, end_date)
+                meetings = await self.async_calendar.get_events(start_date, end_date, max_age=self.calendar_manager.config.PREFETCH_MAX_AGE_SECONDS)
                 context_desc = "for this week"
             
             if not meetings:
@@ -727,13 +694,13 @@ class MeetingSchedulerBot:
             return f"❌ Sorry, I couldn't search for meetings: {str(e)}"
     
     @trace_function
-    def _handle_confirmation(self, result: dict) -> str:
+    async def _handle_confirmation(self, result: dict) -> str:
         """Handle user confirmations (yes/no responses)"""
         try:
             print(f"DEBUG: CONFIRMATION - Pending context: {self.pending_context}")  # Debug print
             
             if not self.pending_context:
-                return self.conversation_handler.generate_dynamic_response(
+                return await self.conversation_handler.generate_dynamic_response(
                     situation="User confirmed something but there's no pending action to confirm",
                     context_data={'user_input': result.get('extracted_data', {})}
                 )
@@ -748,7 +715,7 @@ class MeetingSchedulerBot:
             if pending_action == 'ADD_MEETING':
                 # User confirmed they want to schedule the meeting
                 if pending_context_data.get('conflict'):
-                    return self.conversation_handler.generate_dynamic_response(
+                    return await self.conversation_handler.generate_dynamic_response(
                         situation="User confirmed they want to schedule meeting despite conflict, but need to specify which alternative time",
                         context_data={
                             'meeting_title': pending_data.get('meeting_title', 'meeting'),
@@ -762,7 +729,7 @@ class MeetingSchedulerBot:
                     
                     if current_missing_fields:
                         # Still missing some fields, ask for them
-                        return self.conversation_handler.generate_dynamic_response(
+                        return await self.conversation_handler.generate_dynamic_response(
                             situation="User confirmed they want to schedule meeting but still missing required information",
                             context_data={
                                 'missing_fields': current_missing_fields,
@@ -772,13 +739,15 @@ class MeetingSchedulerBot:
                     else:
                         # Try to schedule with current data - user has confirmed everything
                         print(f"DEBUG: CONFIRMATION - Attempting to schedule with data: {pending_data}")  # Debug print
-                        success, message, alternatives = self.scheduler.schedule_meeting(pending_data)
+                        if self._wants_separate_meetings(pending_data):
+                            return await self._schedule_separately(pending_data)
+                        success, message, alternatives = await self.async_calendar.run(self.scheduler.schedule_meeting, pending_data)
                         self.pending_context = {}  # Clear context after action
                         
                         print(f"DEBUG: CONFIRMATION - Schedule result: Success={success}, Message={message}")  # Debug print
                         
                         if success:
-                            return self.conversation_handler.generate_dynamic_response(
+                            return await self.conversation_handler.generate_dynamic_response(
                                 situation="Meeting successfully scheduled after user confirmation",
                                 context_data={
                                     'meeting_title': pending_data.get('meeting_title', 'Untitled Meeting'),
@@ -793,7 +762,7 @@ class MeetingSchedulerBot:
                                 'context': {'conflict': True, 'suggestions': alternatives}
                             }
                             
-                            return self.conversation_handler.generate_dynamic_response(
+                            return await self.conversation_handler.generate_dynamic_response(
                                 situation="Still conflict after confirmation, offering new alternative times",
                                 context_data={
                                     'meeting_title': pending_data.get('meeting_title', 'meeting'),
@@ -801,7 +770,7 @@ class MeetingSchedulerBot:
                                 }
                             )
                         else:
-                            return self.conversation_handler.generate_dynamic_response(
+                            return await self.conversation_handler.generate_dynamic_response(
                                 situation="Failed to schedule meeting even after user confirmation",
                                 context_data={
                                     'error_message': message,
@@ -812,13 +781,15 @@ class MeetingSchedulerBot:
                     # This else block handles the case where there's no missing_info and no conflict
                     # Try to schedule with current data - user has confirmed everything
                     print(f"DEBUG: CONFIRMATION - Attempting to schedule with data: {pending_data}")  # Debug print
-                    success, message, alternatives = self.scheduler.schedule_meeting(pending_data)
+                    if self._wants_separate_meetings(pending_data):
+                        return await self._schedule_separately(pending_data)
+                    success, message, alternatives = await self.async_calendar.run(self.scheduler.schedule_meeting, pending_data)
                     self.pending_context = {}  # Clear context after action
                     
                     print(f"DEBUG: CONFIRMATION - Schedule result: Success={success}, Message={message}")  # Debug print
                     
                     if success:
-                        return self.conversation_handler.generate_dynamic_response(
+                        return await self.conversation_handler.generate_dynamic_response(
                             situation="Meeting successfully scheduled after user confirmation",
                             context_data={
                                 'meeting_title': pending_data.get('meeting_title', 'Untitled Meeting'),
@@ -833,7 +804,7 @@ class MeetingSchedulerBot:
                             'context': {'conflict': True, 'suggestions': alternatives}
                         }
                         
-                        return self.conversation_handler.generate_dynamic_response(
+                        return await self.conversation_handler.generate_dynamic_response(
                             situation="Still conflict after confirmation, offering new alternative times",
                             context_data={
                                 'meeting_title': pending_data.get('meeting_title', 'meeting'),
@@ -841,7 +812,7 @@ class MeetingSchedulerBot:
                             }
                         )
                     else:
-                        return self.conversation_handler.generate_dynamic_response(
+                        return await self.conversation_handler.generate_dynamic_response(
                             situation="Failed to schedule meeting even after user confirmation",
                             context_data={
                                 'error_message': message,
@@ -862,7 +833,7 @@ class MeetingSchedulerBot:
                     failed_deletions = []
                     
                     for meeting in meetings_to_delete:
-                        success = self.calendar_manager.delete_event(meeting)
+                        success = await self.async_calendar.delete_event(meeting)
                         if success:
                             deleted_count += 1
                             print(f"DEBUG: Successfully deleted meeting: {meeting.title}")
@@ -874,7 +845,7 @@ class MeetingSchedulerBot:
                     
                     if deleted_count == len(meetings_to_delete):
                         # All meetings deleted successfully
-                        return self.conversation_handler.generate_dynamic_response(
+                        return await self.conversation_handler.generate_dynamic_response(
                             situation="All meetings successfully deleted for the specified date",
                             context_data={
                                 'deleted_count': deleted_count,
@@ -884,7 +855,7 @@ class MeetingSchedulerBot:
                         )
                     elif deleted_count > 0:
                         # Some meetings deleted, some failed
-                        return self.conversation_handler.generate_dynamic_response(
+                        return await self.conversation_handler.generate_dynamic_response(
                             situation="Some meetings deleted successfully but some failed",
                             context_data={
                                 'deleted_count': deleted_count,
@@ -896,7 +867,7 @@ class MeetingSchedulerBot:
                         )
                     else:
                         # All deletions failed
-                        return self.conversation_handler.generate_dynamic_response(
+                        return await self.conversation_handler.generate_dynamic_response(
                             situation="Failed to delete any meetings",
                             context_data={
                                 'failed_count': len(failed_deletions),
@@ -912,11 +883,11 @@ class MeetingSchedulerBot:
                     print(f"DEBUG: CONFIRMATION - Attempting to delete meeting: {meeting.title}")
                     
                     # User confirmed deletion, proceed with deleting the meeting
-                    success = self.calendar_manager.delete_event(meeting)
+                    success = await self.async_calendar.delete_event(meeting)
                     self.pending_context = {}  # Clear context after action
                     
                     if success:
-                        return self.conversation_handler.generate_dynamic_response(
+                        return await self.conversation_handler.generate_dynamic_response(
                             situation="Meeting successfully deleted after user confirmation",
                             context_data={
                                 'meeting_title': meeting.title,
@@ -925,7 +896,7 @@ class MeetingSchedulerBot:
                             }
                         )
                     else:
-                        return self.conversation_handler.generate_dynamic_response(
+                        return await self.conversation_handler.generate_dynamic_response(
                             situation="Failed to delete meeting despite user confirmation",
                             context_data={
                                 'meeting_title': meeting.title,
@@ -958,7 +929,7 @@ class MeetingSchedulerBot:
                                 'data': pending_data,
                                 'context': {'meeting_to_delete': selected_meeting, 'awaiting_confirmation': True}
                             }
-                            return self.conversation_handler.generate_dynamic_response(
+                            return await self.conversation_handler.generate_dynamic_response(
                                 situation="User confirmed they want to delete the suggested meeting, asking for final confirmation",
                                 context_data={
                                     'meeting_title': selected_meeting.title,
@@ -979,7 +950,7 @@ class MeetingSchedulerBot:
                                 'data': pending_data,
                                 'context': {'meeting_to_delete': selected_meeting, 'awaiting_confirmation': True}
                             }
-                            return self.conversation_handler.generate_dynamic_response(
+                            return await self.conversation_handler.generate_dynamic_response(
                                 situation="User selected specific meeting from list, asking for confirmation before deletion",
                                 context_data={
                                     'meeting_title': selected_meeting.title,
@@ -998,7 +969,7 @@ class MeetingSchedulerBot:
                                     'data': pending_data,
                                     'context': {'meeting_to_delete': meeting, 'awaiting_confirmation': True}
                                 }
-                                return self.conversation_handler.generate_dynamic_response(
+                                return await self.conversation_handler.generate_dynamic_response(
                                     situation="User selected specific meeting by name, asking for confirmation before deletion",
                                     context_data={
                                         'meeting_title': meeting.title,
@@ -1011,12 +982,17 @@ class MeetingSchedulerBot:
                 # Try to find meetings with the new information (fallback)
                 identifier = new_data.get('meeting_title') or new_data.get('meeting_identifier')
                 if identifier:
-                    meetings = self.calendar_manager.find_meetings(identifier)
+                    # Fuzzy title matches stand in when nothing matches exactly (deleting still asks first)
+                    meetings, similar_meetings = await self.async_calendar.gather(
+                        self.async_calendar.find_meetings(identifier),
+                        self.async_calendar.find_similar_meetings(identifier)
+                    )
+                    meetings = meetings or similar_meetings
                     if len(meetings) == 1:
                         # Found exactly one meeting - ask for confirmation
                         self.pending_context['context'] = {'meeting_to_delete': meetings[0], 'awaiting_confirmation': True}
                         meeting = meetings[0]
-                        return self.conversation_handler.generate_dynamic_response(
+                        return await self.conversation_handler.generate_dynamic_response(
                             situation="Found specific meeting to delete after user provided more information",
                             context_data={
                                 'meeting_title': meeting.title,
@@ -1028,7 +1004,7 @@ class MeetingSchedulerBot:
                     elif len(meetings) > 1:
                         # Multiple meetings found
                         self.pending_context['context'] = {'multiple_matches': meetings}
-                        return self.conversation_handler.generate_dynamic_response(
+                        return await self.conversation_handler.generate_dynamic_response(
                             situation="Found multiple meetings matching the information, need user to specify which one",
                             context_data={
                                 'meetings': [
@@ -1042,7 +1018,7 @@ class MeetingSchedulerBot:
                         )
                     else:
                         self.pending_context = {}  # Clear context if no meetings found
-                        return self.conversation_handler.generate_dynamic_response(
+                        return await self.conversation_handler.generate_dynamic_response(
                             situation="No meetings found matching the provided information",
                             context_data={
                                 'search_term': identifier,
@@ -1050,13 +1026,13 @@ class MeetingSchedulerBot:
                             }
                         )
                 else:
-                    return self.conversation_handler.generate_dynamic_response(
+                    return await self.conversation_handler.generate_dynamic_response(
                         situation="User provided information but still need meeting identifier for deletion",
                         context_data={'provided_data': new_data}
                     )
             
             # For other actions or unknown actions
-            return self.conversation_handler.generate_dynamic_response(
+            return await self.conversation_handler.generate_dynamic_response(
                 situation="User provided information for unknown or unsupported action",
                 context_data={
                     'pending_action': pending_action,
@@ -1067,13 +1043,13 @@ class MeetingSchedulerBot:
         except Exception as e:
             print(f"DEBUG: CONFIRMATION - Exception: {e}")  # Debug print
             self.pending_context = {}
-            return self.conversation_handler.generate_dynamic_response(
+            return await self.conversation_handler.generate_dynamic_response(
                 situation="Error occurred while processing user confirmation",
                 context_data={'error': str(e)}
             )
     
     @trace_function
-    def _handle_reschedule_meeting(self, result: dict) -> str:
+    async def _handle_reschedule_meeting(self, result: dict) -> str:
         """Handle rescheduling requests"""
         try:
             data = result.get('extracted_data', {})
@@ -1081,21 +1057,21 @@ class MeetingSchedulerBot:
             new_time = data.get('new_datetime')
             
             if not meeting_identifier:
-                return self.conversation_handler.generate_dynamic_response(
+                return await self.conversation_handler.generate_dynamic_response(
                     situation="User wants to reschedule a meeting but didn't specify which meeting",
                     context_data={'extracted_data': data}
                 )
             
             # Find the meeting to reschedule
-            meetings = self.calendar_manager.find_meetings(meeting_identifier)
+            meetings = await self.async_calendar.find_meetings(meeting_identifier)
             
             if not meetings:
-                return self.conversation_handler.generate_dynamic_response(
+                return await self.conversation_handler.generate_dynamic_response(
                     situation="No meetings found matching the identifier for rescheduling",
                     context_data={'search_term': meeting_identifier}
                 )
             elif len(meetings) > 1:
-                return self.conversation_handler.generate_dynamic_response(
+                return await self.conversation_handler.generate_dynamic_response(
                     situation="Multiple meetings found for rescheduling, need user to specify which one",
                     context_data={
                         'meetings': [
@@ -1112,7 +1088,7 @@ class MeetingSchedulerBot:
             meeting = meetings[0]
             
             if not new_time:
-                return self.conversation_handler.generate_dynamic_response(
+                return await self.conversation_handler.generate_dynamic_response(
                     situation="Found meeting to reschedule but no new time specified",
                     context_data={
                         'meeting_title': meeting.title,
@@ -1121,10 +1097,10 @@ class MeetingSchedulerBot:
                 )
             
             # Try to reschedule
-            success = self.calendar_manager.reschedule_event(meeting, new_time)
+            success = await self.async_calendar.reschedule_event(meeting, new_time)
             
             if success:
-                return self.conversation_handler.generate_dynamic_response(
+                return await self.conversation_handler.generate_dynamic_response(
                     situation="Meeting successfully rescheduled",
                     context_data={
                         'meeting_title': meeting.title,
@@ -1133,7 +1109,7 @@ class MeetingSchedulerBot:
                     }
                 )
             else:
-                return self.conversation_handler.generate_dynamic_response(
+                return await self.conversation_handler.generate_dynamic_response(
                     situation="Failed to reschedule meeting",
                     context_data={
                         'meeting_title': meeting.title,
@@ -1142,15 +1118,15 @@ class MeetingSchedulerBot:
                 )
                 
         except Exception as e:
-            return self.conversation_handler.generate_dynamic_response(
+            return await self.conversation_handler.generate_dynamic_response(
                 situation="Error occurred while trying to reschedule meeting",
                 context_data={'error': str(e)}
             )
     
     @trace_function
-    def _get_help_message(self) -> str:
+    async def _get_help_message(self) -> str:
         """Generate help message using LLM"""
-        return self.conversation_handler.generate_dynamic_response(
+        return await self.conversation_handler.generate_dynamic_response(
             situation="User requested help or general information about the meeting scheduler",
             context_data={
                 'available_features': [
@@ -1164,11 +1140,11 @@ class MeetingSchedulerBot:
         )
 
     @trace_function
-    def _handle_provide_info(self, result: dict) -> str:
+    async def _handle_provide_info(self, result: dict) -> str:
         """Handle additional information provided by the user"""
         try:
             if not self.pending_context:
-                return self.conversation_handler.generate_dynamic_response(
+                return await self.conversation_handler.generate_dynamic_response(
                     situation="User provided information but there's no pending action that needs information",
                     context_data={'user_input': result.get('extracted_data', {})}
                 )
@@ -1253,7 +1229,7 @@ class MeetingSchedulerBot:
                 if missing_fields:
                     # Still missing some fields
                     self.pending_context['context'] = {'missing_info': True, 'missing_fields': missing_fields}
-                    return self.conversation_handler.generate_dynamic_response(
+                    return await self.conversation_handler.generate_dynamic_response(
                         situation="User provided some information but still missing required fields for meeting scheduling",
                         context_data={
                             'missing_fields': missing_fields,
@@ -1264,12 +1240,14 @@ class MeetingSchedulerBot:
                 else:
                     # We have all required fields, try to schedule directly
                     print(f"DEBUG: Attempting to schedule meeting with data: {pending_data}")
-                    success, message, alternatives = self.scheduler.schedule_meeting(pending_data)
+                    if self._wants_separate_meetings(pending_data):
+                        return await self._schedule_separately(pending_data)
+                    success, message, alternatives = await self.async_calendar.run(self.scheduler.schedule_meeting, pending_data)
                     print(f"DEBUG: Schedule result - Success: {success}, Message: {message}")
                     
                     if success:
                         self.pending_context = {}  # Clear context after success
-                        return self.conversation_handler.generate_dynamic_response(
+                        return await self.conversation_handler.generate_dynamic_response(
                             situation="Meeting successfully scheduled after user provided missing information",
                             context_data={
                                 'meeting_title': pending_data.get('meeting_title', 'Untitled Meeting'),
@@ -1280,7 +1258,7 @@ class MeetingSchedulerBot:
                     elif alternatives:
                         # Store context for conflict resolution
                         self.pending_context['context'] = {'conflict': True, 'suggestions': alternatives}
-                        return self.conversation_handler.generate_dynamic_response(
+                        return await self.conversation_handler.generate_dynamic_response(
                             situation="Meeting scheduling conflict detected after user provided information, offering alternatives",
                             context_data={
                                 'meeting_title': pending_data.get('meeting_title', 'meeting'),
@@ -1289,7 +1267,7 @@ class MeetingSchedulerBot:
                         )
                     else:
                         self.pending_context = {}  # Clear context after failure
-                        return self.conversation_handler.generate_dynamic_response(
+                        return await self.conversation_handler.generate_dynamic_response(
                             situation="Failed to schedule meeting after user provided all required information",
                             context_data={
                                 'error_message': message,
@@ -1326,7 +1304,7 @@ class MeetingSchedulerBot:
                                 'data': pending_data,
                                 'context': {'meeting_to_delete': selected_meeting, 'awaiting_confirmation': True}
                             }
-                            return self.conversation_handler.generate_dynamic_response(
+                            return await self.conversation_handler.generate_dynamic_response(
                                 situation="User confirmed they want to delete the suggested meeting, asking for final confirmation",
                                 context_data={
                                     'meeting_title': selected_meeting.title,
@@ -1347,7 +1325,7 @@ class MeetingSchedulerBot:
                                 'data': pending_data,
                                 'context': {'meeting_to_delete': selected_meeting, 'awaiting_confirmation': True}
                             }
-                            return self.conversation_handler.generate_dynamic_response(
+                            return await self.conversation_handler.generate_dynamic_response(
                                 situation="User selected specific meeting from list, asking for confirmation before deletion",
                                 context_data={
                                     'meeting_title': selected_meeting.title,
@@ -1366,7 +1344,7 @@ class MeetingSchedulerBot:
                                     'data': pending_data,
                                     'context': {'meeting_to_delete': meeting, 'awaiting_confirmation': True}
                                 }
-                                return self.conversation_handler.generate_dynamic_response(
+                                return await self.conversation_handler.generate_dynamic_response(
                                     situation="User selected specific meeting by name, asking for confirmation before deletion",
                                     context_data={
                                         'meeting_title': meeting.title,
@@ -1379,12 +1357,17 @@ class MeetingSchedulerBot:
                 # Try to find meetings with the new information (fallback)
                 identifier = new_data.get('meeting_title') or new_data.get('meeting_identifier')
                 if identifier:
-                    meetings = self.calendar_manager.find_meetings(identifier)
+                    # Fuzzy title matches stand in when nothing matches exactly (deleting still asks first)
+                    meetings, similar_meetings = await self.async_calendar.gather(
+                        self.async_calendar.find_meetings(identifier),
+                        self.async_calendar.find_similar_meetings(identifier)
+                    )
+                    meetings = meetings or similar_meetings
                     if len(meetings) == 1:
                         # Found exactly one meeting - ask for confirmation
                         self.pending_context['context'] = {'meeting_to_delete': meetings[0], 'awaiting_confirmation': True}
                         meeting = meetings[0]
-                        return self.conversation_handler.generate_dynamic_response(
+                        return await self.conversation_handler.generate_dynamic_response(
                             situation="Found specific meeting to delete after user provided more information",
                             context_data={
                                 'meeting_title': meeting.title,
@@ -1396,7 +1379,7 @@ class MeetingSchedulerBot:
                     elif len(meetings) > 1:
                         # Multiple meetings found
                         self.pending_context['context'] = {'multiple_matches': meetings}
-                        return self.conversation_handler.generate_dynamic_response(
+                        return await self.conversation_handler.generate_dynamic_response(
                             situation="Found multiple meetings matching the information, need user to specify which one",
                             context_data={
                                 'meetings': [
@@ -1410,7 +1393,7 @@ class MeetingSchedulerBot:
                         )
                     else:
                         self.pending_context = {}  # Clear context if no meetings found
-                        return self.conversation_handler.generate_dynamic_response(
+                        return await self.conversation_handler.generate_dynamic_response(
                             situation="No meetings found matching the provided information",
                             context_data={
                                 'search_term': identifier,
@@ -1418,13 +1401,13 @@ class MeetingSchedulerBot:
                             }
                         )
                 else:
-                    return self.conversation_handler.generate_dynamic_response(
+                    return await self.conversation_handler.generate_dynamic_response(
                         situation="User provided information but still need meeting identifier for deletion",
                         context_data={'provided_data': new_data}
                     )
             
             # For other actions or unknown actions
-            return self.conversation_handler.generate_dynamic_response(
+            return await self.conversation_handler.generate_dynamic_response(
                 situation="User provided information for unknown or unsupported action",
                 context_data={
                     'pending_action': pending_action,
@@ -1434,7 +1417,7 @@ class MeetingSchedulerBot:
             
         except Exception as e:
             self.pending_context = {}
-            return self.conversation_handler.generate_dynamic_response(
+            return await self.conversation_handler.generate_dynamic_response(
                 situation="Error occurred while processing additional user information",
                 context_data={'error': str(e)}
             )
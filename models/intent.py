@@ -0,0 +1,98 @@
+from dataclasses import dataclass, field, fields
+from typing import Any, Dict, List, Optional
+
+INTENTS = ('VIEW_CALENDAR', 'ADD_MEETING', 'DELETE_MEETING', 'CHECK_AVAILABILITY',
+           'FIND_MEETINGS', 'CONFIRMATION', 'PROVIDE_INFO', 'GENERAL_QUERY')
+
+@dataclass
+class ExtractedData:
+    """Details the classifier pulled out of a message; None means not mentioned."""
+    meeting_title: Optional[str] = None
+    meeting_description: Optional[str] = None
+    when: Optional[str] = None  # the user's own date/time wording, resolved by TemporalParser
+    attendees: Optional[List[str]] = None
+    location: Optional[str] = None
+    recurrence_pattern: Optional[str] = None
+    recurrence_count: Optional[int] = None
+    recurrence_days: Optional[List[str]] = None
+    person_email: Optional[str] = None
+    meeting_identifier: Optional[str] = None
+    separate_meetings: Optional[bool] = None  # one meeting per attendee ("1:1s with each of ...")
+
+    @classmethod
+    def from_dict(cls, raw: Any) -> 'ExtractedData':
+        if raw is None:
+            return cls()
+        if not isinstance(raw, dict):
+            raise ValueError(f"extracted_data must be an object, got {type(raw).__name__}")
+        values = {}
+        for item in fields(cls):
+            value = raw.get(item.name)
+            if value is None or value == '' or value == [] or value is False:
+                continue
+            if item.name in ('attendees', 'recurrence_days'):
+                if isinstance(value, str):
+                    value = [value]
+                if not isinstance(value, list) or not all(isinstance(v, str) for v in value):
+                    raise ValueError(f"{item.name} must be a list of strings")
+            elif item.name == 'separate_meetings':
+                if not isinstance(value, bool):
+                    raise ValueError("separate_meetings must be true or false")
+            elif item.name == 'recurrence_count':
+                if isinstance(value, bool) or not isinstance(value, (int, float)) or value < 1:
+                    raise ValueError("recurrence_count must be a positive number")
+                value = int(value)
+            elif not isinstance(value, str):
+                raise ValueError(f"{item.name} must be a string")
+            values[item.name] = value
+        return cls(**values)
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Only the fields that were mentioned, as the handlers expect"""
+        return {item.name: getattr(self, item.name) for item in fields(self) if getattr(self, item.name) is not None}
+
+@dataclass
+class IntentResult:
+    """A validated classifier response."""
+    intent: str
+    confidence: float
+    extracted_data: ExtractedData = field(default_factory=ExtractedData)
+    missing_fields: List[str] = field(default_factory=list)
+    context_understood: bool = False
+    response: str = ""
+
+    @classmethod
+    def from_dict(cls, raw: Any) -> 'IntentResult':
+        """Validate a parsed JSON response; raises ValueError describing the first problem"""
+        if not isinstance(raw, dict):
+            raise ValueError(f"expected a JSON object, got {type(raw).__name__}")
+        intent = raw.get('intent')
+        if intent not in INTENTS:
+            raise ValueError(f"unknown intent {intent!r}")
+        confidence = raw.get('confidence', 0.5)
+        if isinstance(confidence, bool) or not isinstance(confidence, (int, float)):
+            raise ValueError("confidence must be a number")
+        missing = raw.get('missing_fields') or []
+        if not isinstance(missing, list) or not all(isinstance(name, str) for name in missing):
+            raise ValueError("missing_fields must be a list of strings")
+        response = raw.get('response')
+        if not isinstance(response, str) or not response.strip():
+            raise ValueError("response must be a non-empty string")
+        return cls(
+            intent=intent,
+            confidence=min(max(float(confidence), 0.0), 1.0),
+            extracted_data=ExtractedData.from_dict(raw.get('extracted_data')),
+            missing_fields=missing,
+            context_understood=bool(raw.get('context_understood', False)),
+            response=response.strip(),
+        )
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            'intent': self.intent,
+            'confidence': self.confidence,
+            'extracted_data': self.extracted_data.to_dict(),
+            'missing_fields': list(self.missing_fields),
+            'context_understood': self.context_understood,
+            'response': self.response,
+        }
@@ -11,6 +11,7 @@ class Meeting:
     attendees: Optional[List[str]] = None
     location: Optional[str] = None
     event_id: Optional[str] = None  # Google Calendar event ID for deletion
+    etag: Optional[str] = None  # version of the event this copy was read at (for If-Match updates)
     
     def __str__(self):
         return f"{self.title} ({self.start_time.strftime('%Y-%m-%d %H:%M')} - {self.end_time.strftime('%H:%M')})"
@@ -0,0 +1,38 @@
+from dataclasses import dataclass, field
+from datetime import datetime, timedelta
+from typing import List, Optional
+from models.meeting import TimeSlot
+
+@dataclass
+class SlotRequest:
+    duration: timedelta
+    window_start: datetime
+    window_end: datetime
+    preferred_time: Optional[datetime] = None  # defaults to the start of the window
+    attendees: List[str] = field(default_factory=list)
+    buffer_minutes: int = 0  # free time required around existing meetings
+    max_meetings_per_day: Optional[int] = None
+    preferred_days: Optional[List[int]] = None  # weekday numbers, Monday = 0
+    step_minutes: Optional[int] = None
+
+@dataclass
+class ScoredSlot:
+    slot: TimeSlot
+    score: float  # lower is better
+    
+    def __str__(self):
+        return f"{self.slot} (score {self.score:.2f})"
+
+@dataclass(frozen=True)
+class TemporalExpression:
+    """Dates and times resolved from a phrase like "next friday from 3 to 4pm EST"."""
+    date: Optional[datetime] = None  # midnight of the day named, if any
+    start: Optional[datetime] = None  # set only when a clock time was given
+    end: Optional[datetime] = None
+    duration_minutes: Optional[int] = None
+    timezone: Optional[str] = None  # abbreviation as spoken, e.g. "EST"
+    date_range: Optional[str] = None  # "this_week" / "next_week"
+
+    @property
+    def empty(self) -> bool:
+        return not (self.date or self.start or self.duration_minutes or self.timezone or self.date_range)
@@ -0,0 +1,188 @@
+import json
+import random
+import threading
+import time
+from concurrent.futures import Future
+from typing import Any, Callable, Dict, Optional, Tuple
+from googleapiclient.errors import HttpError
+from config.settings import Config
+
+# Import our tracing system
+from config.logger import logger
+
+BATCH_LIMIT = 50  # sub-requests per batch round-trip (Calendar API maximum)
+
+# 403 reasons Google uses for quota/rate limiting (other 403s are real permission errors)
+RATE_LIMIT_REASONS = {'rateLimitExceeded', 'userRateLimitExceeded', 'quotaExceeded'}
+
+class TokenBucket:
+    """Thread-safe token bucket: `rate` tokens per second, holding at most `capacity`"""
+
+    def __init__(self, rate: float, capacity: float):
+        self.rate = rate
+        self.capacity = capacity
+        self._tokens = capacity
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def acquire(self):
+        """Take one token, sleeping until one is available"""
+        while True:
+            with self._lock:
+                now = time.monotonic()
+                self._tokens = min(self.capacity, self._tokens + (now - self._updated) * self.rate)
+                self._updated = now
+                if self._tokens >= 1:
+                    self._tokens -= 1
+                    return
+                wait = (1 - self._tokens) / self.rate
+            time.sleep(wait)
+
+class ApiExecutor:
+    """Executes Calendar API requests with throttling, retries and request coalescing.
+
+    Every request first takes a token from its calendar's bucket and from the shared
+    quota bucket. Rate-limit 403s, 429s and 5xx responses (5xx not for inserts or If-Match
+    updates) are retried with exponential backoff and full jitter (honouring Retry-After);
+    execute_batch() does the same for each sub-request of a batch. Identical in-flight GET requests are
+    coalesced, so concurrent callers share one round-trip and its result.
+    """
+
+    def __init__(self, config: Optional[Config] = None):
+        self.config = config or Config()
+        self._buckets: Dict[str, TokenBucket] = {}
+        self._quota = TokenBucket(self.config.CALENDAR_QUOTA_PER_MINUTE / 60.0,
+                                  max(1, self.config.CALENDAR_QUOTA_PER_MINUTE / 60.0 * 10))
+        self._in_flight: Dict[str, Future] = {}
+        self._lock = threading.Lock()
+
+    def execute(self, request, calendar_id: str) -> Any:
+        """Run a googleapiclient HttpRequest; HttpError propagates once retries are exhausted"""
+        if request.method != 'GET':
+            return self._execute_with_retries(request, calendar_id)
+
+        key = request.uri
+        with self._lock:
+            future = self._in_flight.get(key)
+            leader = future is None
+            if leader:
+                future = Future()
+                self._in_flight[key] = future
+
+        if not leader:
+            logger.debug(f"Coalesced calendar request: {key}")
+            return future.result()
+
+        try:
+            future.set_result(self._execute_with_retries(request, calendar_id))
+        except BaseException as error:
+            future.set_exception(error)
+        finally:
+            with self._lock:
+                del self._in_flight[key]
+        return future.result()
+
+    def execute_batch(self, requests: Dict[str, Any], calendar_id: str,
+                      new_batch: Callable[[Callable], Any]) -> Dict[str, Tuple[Any, Optional[Exception]]]:
+        """Run requests (id -> HttpRequest) in batched round-trips of up to BATCH_LIMIT.
+
+        Each sub-request is throttled and charged to the quota like a single request. Sub-requests
+        that fail with a retryable status are sent again in a later batch after backing off, and
+        the same applies to a whole batch rejected with one. new_batch(callback) makes an empty
+        BatchHttpRequest. Returns id -> (response, exception) for every request.
+        """
+        results: Dict[str, Tuple[Any, Optional[Exception]]] = {}
+        pending = dict(requests)
+        attempt = 0
+        while pending:
+            retry: Dict[str, Any] = {}
+            delay = 0.0
+
+            def on_response(request_id, response, exception):
+                results[request_id] = (response, exception)
+
+            ids = list(pending)
+            for chunk_start in range(0, len(ids), BATCH_LIMIT):
+                chunk = ids[chunk_start:chunk_start + BATCH_LIMIT]
+                batch = new_batch(on_response)
+                for request_id in chunk:
+                    self._acquire(calendar_id)
+                    batch.add(pending[request_id], request_id=request_id)
+                try:
+                    batch.execute()
+                except HttpError as error:
+                    for request_id in chunk:
+                        results[request_id] = (None, error)
+                except Exception as error:  # transport failure; nothing to retry safely
+                    for request_id in chunk:
+                        results[request_id] = (None, error)
+                    continue
+                for request_id in chunk:
+                    request = pending[request_id]
+                    error = results.get(request_id, (None, None))[1]
+                    if (isinstance(error, HttpError) and attempt < self.config.CALENDAR_MAX_RETRIES
+                            and self.is_retryable(error, request.method, self.is_conditional(request))):
+                        retry[request_id] = request
+                        delay = max(delay, self._retry_delay(error, attempt))
+
+            if retry:
+                attempt += 1
+                logger.warning(f"Retrying {len(retry)} batched calendar requests (retry {attempt}) in {delay:.2f}s")
+                time.sleep(delay)
+            pending = retry
+        return results
+
+    def _acquire(self, calendar_id: str):
+        self._bucket(calendar_id).acquire()
+        self._quota.acquire()
+
+    def _bucket(self, calendar_id: str) -> TokenBucket:
+        with self._lock:
+            bucket = self._buckets.get(calendar_id)
+            if bucket is None:
+                bucket = TokenBucket(self.config.CALENDAR_QPS, self.config.CALENDAR_BURST)
+                self._buckets[calendar_id] = bucket
+            return bucket
+
+    def _execute_with_retries(self, request, calendar_id: str) -> Any:
+        attempt = 0
+        while True:
+            self._acquire(calendar_id)
+            try:
+                return request.execute()
+            except HttpError as error:
+                if attempt >= self.config.CALENDAR_MAX_RETRIES or not self.is_retryable(
+                        error, request.method, self.is_conditional(request)):
+                    raise
+                delay = self._retry_delay(error, attempt)
+                attempt += 1
+                logger.warning(f"Calendar API returned {error.resp.status}, retry {attempt} in {delay:.2f}s")
+                time.sleep(delay)
+
+    @staticmethod
+    def is_conditional(request) -> bool:
+        return 'If-Match' in (getattr(request, 'headers', None) or {})
+
+    @staticmethod
+    def is_retryable(error: HttpError, method: str = 'GET', conditional: bool = False) -> bool:
+        status = error.resp.status
+        if status == 429:
+            return True
+        if status >= 500:
+            # An insert may have been applied before the server failed; retrying could duplicate it.
+            # Likewise an If-Match update: once applied, the retry fails with 412 as if it never had been
+            return method != 'POST' and not conditional
+        if status == 403:
+            try:
+                errors = json.loads(error.content.decode('utf-8'))['error'].get('errors', [])
+            except (ValueError, KeyError, AttributeError, TypeError):
+                return False
+            return any(item.get('reason') in RATE_LIMIT_REASONS for item in errors)
+        return False
+
+    def _retry_delay(self, error: HttpError, attempt: int) -> float:
+        retry_after = error.resp.get('retry-after')
+        if retry_after and retry_after.isdigit():
+            return float(retry_after)
+        ceiling = min(self.config.CALENDAR_BACKOFF_MAX, self.config.CALENDAR_BACKOFF_BASE * 2 ** attempt)
+        return random.uniform(0, ceiling)
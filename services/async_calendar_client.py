@@ -0,0 +1,96 @@
+import asyncio
+import functools
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timedelta
+from typing import Any, Callable, List, Optional, Sequence, Tuple
+from config.settings import Config
+from models.meeting import Meeting, TimeSlot
+from services.calendar_manager import CalendarManager
+
+# Import our tracing system
+from config.logger import logger
+
+class AsyncCalendarClient:
+    """Async facade over CalendarManager.
+
+    Calls run on a pooled thread executor; every worker thread lazily builds its own
+    Calendar service (see CalendarManager.service), so each thread reuses one keep-alive
+    HTTP connection and the asyncio loop is never blocked on network I/O.
+    """
+
+    def __init__(self, calendar_manager: CalendarManager, max_workers: Optional[int] = None,
+                 max_concurrency: Optional[int] = None):
+        self.calendar_manager = calendar_manager
+        self.config = Config()
+        self._executor = ThreadPoolExecutor(
+            max_workers=max_workers or self.config.CALENDAR_MAX_WORKERS,
+            thread_name_prefix='calendar-io'
+        )
+        self._max_concurrency = max_concurrency or self.config.CALENDAR_MAX_CONCURRENCY
+        self._semaphore = None  # Created lazily so it binds to the running loop
+
+    def _get_semaphore(self) -> asyncio.Semaphore:
+        if self._semaphore is None:
+            self._semaphore = asyncio.Semaphore(self._max_concurrency)
+        return self._semaphore
+
+    async def run(self, func: Callable, *args, **kwargs) -> Any:
+        """Run a blocking calendar-bound callable on the pool, honouring the concurrency limit"""
+        async with self._get_semaphore():
+            loop = asyncio.get_running_loop()
+            return await loop.run_in_executor(self._executor, functools.partial(func, *args, **kwargs))
+
+    async def gather(self, *coroutines) -> List[Any]:
+        """Run independent calendar lookups concurrently and return their results in order"""
+        return list(await asyncio.gather(*coroutines))
+
+    async def get_events(self, start_date: datetime, end_date: datetime,
+                         fields: Optional[Sequence[str]] = None, max_age: Optional[float] = None,
+                         required: bool = False) -> List[Meeting]:
+        return await self.run(self.calendar_manager.get_events, start_date, end_date, fields, max_age, required)
+
+    async def create_event(self, meeting: Meeting) -> bool:
+        return await self.run(self.calendar_manager.create_event, meeting)
+
+    async def create_events(self, meetings: List[Meeting]) -> List[bool]:
+        return await self.run(self.calendar_manager.create_events, meetings)
+
+    async def delete_event(self, meeting: Meeting) -> bool:
+        return await self.run(self.calendar_manager.delete_event, meeting)
+
+    async def update_event(self, meeting: Meeting, **changes) -> bool:
+        return await self.run(self.calendar_manager.update_event, meeting, **changes)
+
+    async def reschedule_event(self, meeting: Meeting, new_start) -> bool:
+        return await self.run(self.calendar_manager.reschedule_event, meeting, new_start)
+
+    async def check_availability(self, start_time: datetime, end_time: datetime) -> bool:
+        return await self.run(self.calendar_manager.check_availability, start_time, end_time)
+
+    async def find_available_slots(self, date: datetime, duration: timedelta, num_suggestions: int = 3,
+                                   attendees: Optional[List[str]] = None) -> List[TimeSlot]:
+        return await self.run(self.calendar_manager.find_available_slots, date, duration, num_suggestions,
+                              attendees=attendees)
+
+    async def get_busy_intervals(self, start_time: datetime, end_time: datetime,
+                                 attendees: Optional[List[str]] = None) -> List[Tuple[float, float]]:
+        return await self.run(self.calendar_manager.get_busy_intervals, start_time, end_time, attendees)
+
+    async def get_todays_events(self) -> List[Meeting]:
+        return await self.run(self.calendar_manager.get_todays_events)
+
+    async def get_events_with_person(self, person_email: str, days_ahead: int = 7) -> List[Meeting]:
+        return await self.run(self.calendar_manager.get_events_with_person, person_email, days_ahead)
+
+    async def find_meetings(self, identifier: str, query_date: str = None) -> List[Meeting]:
+        return await self.run(self.calendar_manager.find_meetings, identifier, query_date)
+
+    async def find_similar_meetings(self, identifier: str, query_date: str = None,
+                                    similarity_threshold: float = 0.35) -> List[Meeting]:
+        return await self.run(self.calendar_manager.find_similar_meetings, identifier, query_date,
+                              similarity_threshold)
+
+    def close(self):
+        """Release the worker threads (and with them their HTTP connections)"""
+        logger.debug("Shutting down async calendar client pool")
+        self._executor.shutdown(wait=False)
@@ -1,26 +1,108 @@
 import os
+import re
 import json
+import heapq
+import threading
+import time
 from datetime import datetime, timedelta
-from typing import List, Optional, Dict, Any
+from typing import List, Optional, Dict, Any, Iterator, Sequence, Tuple
 from google.auth.transport.requests import Request
+from google_auth_httplib2 import AuthorizedHttp
 from google.oauth2.credentials import Credentials
+from google.auth.credentials import AnonymousCredentials
 from google_auth_oauthlib.flow import InstalledAppFlow
 from googleapiclient.discovery import build
 from googleapiclient.errors import HttpError
+from googleapiclient.http import BatchHttpRequest
+import httplib2
+import numpy as np
 import pytz
 from config.settings import Config
 from models.meeting import Meeting, TimeSlot
+from services.event_parser import EventBatch, EventParser
+from services.meeting_index import MeetingIndex
+from services.calendar_store import CalendarStore
+from services.api_executor import ApiExecutor
+from services.calendar_prefetcher import CalendarPrefetcher
+from services.slot_engine import SlotEngine
 
 # Import our tracing system
 from config.logger import trace_function, trace_api_call, logger
 
+class CalendarUnavailableError(Exception):
+    """The calendar couldn't be reached and the index doesn't hold the requested range"""
+
 class CalendarManager:
+    # Partial-response projections for events().list - only request what we parse
+    MEETING_EVENT_FIELDS = ('id', 'etag', 'summary', 'description', 'location', 'start', 'end', 'attendees/email')
+    TIMING_EVENT_FIELDS = ('id', 'start', 'end')
+    SYNC_EVENT_FIELDS = MEETING_EVENT_FIELDS + ('status',)
+    
+    EMAIL_PATTERN = re.compile(r'\b[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Z|a-z]{2,}\b')
+    TIME_12H_PATTERN = re.compile(r'\b(\d{1,2})(?::(\d{2}))?\s*(am|pm)\b', re.IGNORECASE)  # "2 PM", "9:30am"
+    TIME_24H_PATTERN = re.compile(r'\b([01]?\d|2[0-3]):([0-5]\d)\b')  # "14:00"
+    DATE_PATTERN = re.compile(r'\b\d{4}-\d{2}-\d{2}\b')
+    
     @trace_function
     def __init__(self):
         self.config = Config()
-        self.service = None
+        self.credentials = None
+        self._local = threading.local()  # per-thread service objects (httplib2 is not thread-safe)
         self.timezone = pytz.timezone(self.config.DEFAULT_TIMEZONE)
-        self._authenticate()
+        self._parser = EventParser(self.timezone)
+        self.slot_engine = SlotEngine(self.timezone, (self.config.BUSINESS_HOURS_START, self.config.BUSINESS_HOURS_END))
+        self.meeting_index = MeetingIndex(self.timezone)  # kept in sync with every full fetch and mutation
+        self.api = ApiExecutor(self.config)  # throttling, retries and coalescing for every API call
+        self._busy_cache: Dict[str, Tuple[float, float, float, List[Tuple[float, float]]]] = {}  # id -> (fetched_at, start, end, busy)
+        self._busy_lock = threading.Lock()
+        self._authenticated = threading.Event()
+        self._mirror_synced = threading.Event()
+        self.store = CalendarStore(self.config.CALENDAR_MIRROR_PATH) if self.config.CALENDAR_MIRROR_PATH else None
+        if not self.store:
+            self._mirror_synced.set()
+        
+        if self._load_mirror():
+            # Warm start: reads are served from the mirror right away, while the OAuth
+            # refresh and sync-token reconciliation happen off the critical path
+            self._start_background(self._authenticate_and_sync)
+        else:
+            self._authenticate()
+            if self.store:
+                self._start_background(self.sync_mirror)
+        
+        # Keeps today/this week/the next two weeks in the index so common turns need no API call
+        self.prefetcher = CalendarPrefetcher(self)
+        if self.config.PREFETCH_INTERVAL_SECONDS > 0:
+            self.prefetcher.start()
+    
+    @property
+    def service(self):
+        """Calendar service bound to the calling thread's own keep-alive HTTP connection"""
+        service = getattr(self._local, 'service', None)
+        if service is None:
+            # During a warm start, authentication may still be running in the background
+            self._authenticated.wait()
+            if self.credentials is None:
+                raise ConnectionError("Not authenticated with Google Calendar")
+            service = self._build_service()
+            self._local.service = service
+        return service
+    
+    def _build_service(self):
+        """Build a Calendar API client over a dedicated httplib2 connection"""
+        http = AuthorizedHttp(self.credentials, http=httplib2.Http(timeout=self.config.CALENDAR_HTTP_TIMEOUT))
+        client_options = None
+        if self.config.CALENDAR_API_BASE_URL:
+            # e.g. the local fake server (fake_calendar_server.py) used for benchmarks
+            client_options = {'api_endpoint': self.config.CALENDAR_API_BASE_URL.rstrip('/') + '/calendar/v3/'}
+        return build('calendar', 'v3', http=http, cache_discovery=False, client_options=client_options)
+    
+    def new_batch_request(self, callback=None) -> BatchHttpRequest:
+        """Batch request bound to the configured API endpoint"""
+        if self.config.CALENDAR_API_BASE_URL:
+            return BatchHttpRequest(callback=callback,
+                                    batch_uri=self.config.CALENDAR_API_BASE_URL.rstrip('/') + '/batch/calendar/v3')
+        return self.service.new_batch_http_request(callback=callback)
     
     @trace_function
     @trace_api_call("Google_Auth", "authenticate")
@@ -28,6 +110,13 @@ class CalendarManager:
         """Authenticate with Google Calendar API"""
         creds = None
         
+        if self.config.CALENDAR_API_BASE_URL:
+            # Local stand-in server - no OAuth involved
+            self.credentials = AnonymousCredentials()
+            self._local.service = self._build_service()
+            self._authenticated.set()
+            return
+        
         # Load existing token
         if os.path.exists(self.config.TOKEN_PATH):
             try:
@@ -61,96 +150,442 @@ class CalendarManager:
                 }
                 json.dump(token_data, token, indent=2)
         
-        self.service = build('calendar', 'v3', credentials=creds)
+        self.credentials = creds
+        self._local.service = self._build_service()
+        self._authenticated.set()
+    
+    def _execute(self, request) -> Any:
+        return self.api.execute(request, self.config.CALENDAR_ID)
+    
+    def _start_background(self, target):
+        threading.Thread(target=target, name='calendar-sync', daemon=True).start()
+    
+    def _authenticate_and_sync(self):
+        try:
+            self._authenticate()
+        except Exception as e:
+            print(f"Background authentication failed, serving cached calendar only: {e}")
+            self._authenticated.set()  # unblock waiters; service access will raise
+            self._mirror_synced.set()
+            return
+        self.sync_mirror()
+    
+    def _load_mirror(self) -> bool:
+        """Fill the meeting index from the on-disk mirror; returns whether there was one"""
+        if not self.store:
+            return False
+        state = self.store.get_sync_state(self.config.CALENDAR_ID)
+        if not state:
+            return False
+        
+        batch = self._parser.parse(self.store.load_events(self.config.CALENDAR_ID))
+        self.meeting_index.replace_range(
+            self._parser.to_datetime(state['window_start']),
+            self._parser.to_datetime(state['window_end']),
+            batch.to_meetings(),
+            indexed_at=state['synced_at']
+        )
+        print(f"Loaded {len(batch)} events from calendar mirror (synced {time.time() - state['synced_at']:.0f}s ago)")
+        return True
+    
+    def _mirror_window(self):
+        now = datetime.now(self.timezone)
+        start = (now - timedelta(days=self.config.MIRROR_PAST_DAYS)).replace(hour=0, minute=0, second=0, microsecond=0)
+        return start, start + timedelta(days=self.config.MIRROR_PAST_DAYS + self.config.MIRROR_FUTURE_DAYS)
+    
+    def _store_rows(self, batch: EventBatch):
+        return zip(batch.raw_events, batch.starts, batch.ends)
+    
+    def sync_mirror(self):
+        """Reconcile the mirror and meeting index with Google, incrementally when a sync token is stored"""
+        if not self.store:
+            return
+        try:
+            state = self.store.get_sync_state(self.config.CALENDAR_ID)
+            if state and state['sync_token']:
+                try:
+                    self._incremental_sync(state)
+                except HttpError as error:
+                    if error.resp.status != 410:
+                        raise
+                    # Sync token expired - fall back to a full resync of the window
+                    self._full_sync()
+            else:
+                self._full_sync()
+        except (HttpError, httplib2.HttpLib2Error, OSError) as error:
+            print(f"Calendar mirror sync failed, serving cached events: {error}")
+        finally:
+            # From here on reads go to the API (falling back to the mirror when it is unreachable)
+            self._mirror_synced.set()
+    
+    def _full_sync(self):
+        window_start, window_end = self._mirror_window()
+        start_time, end_time = self._to_rfc3339_range(window_start, window_end)
+        batch = EventBatch(self._parser)
+        sync_token = None
+        page_token = None
+        
+        while True:
+            result = self._execute(self.service.events().list(
+                calendarId=self.config.CALENDAR_ID,
+                timeMin=start_time,
+                timeMax=end_time,
+                singleEvents=True,
+                maxResults=self.config.EVENT_PAGE_SIZE,
+                pageToken=page_token,
+                fields=self._event_list_fields(self.SYNC_EVENT_FIELDS, sync=True)
+            ))
+            self._parser.parse([item for item in result.get('items', []) if item.get('status') != 'cancelled'], batch)
+            page_token = result.get('nextPageToken')
+            if not page_token:
+                sync_token = result.get('nextSyncToken')
+                break
+        
+        self.store.replace_window(self.config.CALENDAR_ID, window_start.timestamp(), window_end.timestamp(),
+                                  self._store_rows(batch))
+        self.store.save_sync_state(self.config.CALENDAR_ID, sync_token, window_start.timestamp(),
+                                   window_end.timestamp(), time.time())
+        self.meeting_index.replace_range(window_start, window_end, batch.to_meetings())
+    
+    def _incremental_sync(self, state: Dict[str, Any]):
+        sync_token = state['sync_token']
+        page_token = None
+        changed = EventBatch(self._parser)
+        cancelled = []
+        
+        while True:
+            result = self._execute(self.service.events().list(
+                calendarId=self.config.CALENDAR_ID,
+                syncToken=sync_token,
+                singleEvents=True,
+                maxResults=self.config.EVENT_PAGE_SIZE,
+                pageToken=page_token,
+                fields=self._event_list_fields(self.SYNC_EVENT_FIELDS, sync=True)
+            ))
+            for item in result.get('items', []):
+                if item.get('status') == 'cancelled':
+                    cancelled.append(item['id'])
+                else:
+                    self._parser.parse([item], changed)
+            page_token = result.get('nextPageToken')
+            if not page_token:
+                sync_token = result.get('nextSyncToken', sync_token)
+                break
+        
+        self.store.delete_events(self.config.CALENDAR_ID, cancelled)
+        self.store.upsert_events(self.config.CALENDAR_ID, self._store_rows(changed))
+        self.store.save_sync_state(self.config.CALENDAR_ID, sync_token, state['window_start'],
+                                   state['window_end'], time.time())
+        for event_id in cancelled:
+            self.meeting_index.remove(event_id)
+        for meeting in changed:
+            self.meeting_index.add(meeting)
+        self.meeting_index.touch(self._parser.to_datetime(state['window_start']),
+                                 self._parser.to_datetime(state['window_end']))
     
     @trace_function
     @trace_api_call("Google_Calendar", "list_events")
-    def get_events(self, start_date: datetime, end_date: datetime) -> List[Meeting]:
-        """Get events between start and end dates"""
+    def get_events(self, start_date: datetime, end_date: datetime,
+                   fields: Optional[Sequence[str]] = None, max_age: Optional[float] = None,
+                   required: bool = False) -> List[Meeting]:
+        """Get events between start and end dates, following every result page.
+        
+        With max_age, events already indexed (e.g. by the prefetcher) within the last
+        max_age seconds are returned without an API call. With required, an unreachable
+        calendar raises CalendarUnavailableError instead of returning no events when the
+        index doesn't hold the range.
+        """
+        if fields is None and self._is_cached(start_date, end_date, max_age):
+            return self.meeting_index.query(start=start_date, end=end_date, overlapping=True)
+        
         try:
-            # Ensure dates are timezone-aware and convert to UTC
-            if start_date.tzinfo is None:
-                start_date = self.timezone.localize(start_date)
-            if end_date.tzinfo is None:
-                end_date = self.timezone.localize(end_date)
-            
-            # Convert to UTC for API request
-            start_utc = start_date.astimezone(pytz.UTC)
-            end_utc = end_date.astimezone(pytz.UTC)
-            
-            # Format as RFC3339 strings
-            start_time = start_utc.strftime('%Y-%m-%dT%H:%M:%S.%fZ')
-            end_time = end_utc.strftime('%Y-%m-%dT%H:%M:%S.%fZ')
-            
-            events_result = self.service.events().list(
+            batch = EventBatch(self._parser)
+            for items in self._list_event_pages(start_date, end_date, fields):
+                self._parser.parse(items, batch)
+        except HttpError as error:
+            print(f"An error occurred: {error}")
+            return self._cached_events(start_date, end_date, required)
+        except (httplib2.HttpLib2Error, OSError) as error:
+            print(f"Calendar unreachable, serving cached events: {error}")
+            return self._cached_events(start_date, end_date, required)
+        
+        if fields is None:
+            self._index_window(start_date, end_date, batch)
+        return batch.to_meetings()
+    
+    def refresh_range(self, start_date: datetime, end_date: datetime) -> bool:
+        """Re-fetch a range into the meeting index and mirror; returns whether it succeeded"""
+        try:
+            batch = EventBatch(self._parser)
+            for items in self._list_event_pages(start_date, end_date):
+                self._parser.parse(items, batch)
+        except (HttpError, httplib2.HttpLib2Error, OSError) as error:
+            print(f"An error occurred while refreshing events: {error}")
+            return False
+        self._index_window(start_date, end_date, batch)
+        return True
+    
+    def _index_window(self, start_date: datetime, end_date: datetime, batch: EventBatch):
+        # A complete, full-field listing is authoritative for the range
+        self.meeting_index.replace_range(start_date, end_date, batch.to_meetings())
+        if self.store:
+            self.store.replace_window(self.config.CALENDAR_ID, self.meeting_index.to_epoch(start_date),
+                                      self.meeting_index.to_epoch(end_date), self._store_rows(batch))
+    
+    def _is_cached(self, start_date: datetime, end_date: datetime, max_age: Optional[float]) -> bool:
+        if not self._mirror_synced.is_set():
+            # Warm start: answer from the mirror until the background reconcile has finished
+            return self.meeting_index.covers(start_date, end_date)
+        return max_age is not None and self.meeting_index.covers(start_date, end_date, max_age=max_age)
+    
+    def data_age(self) -> Optional[float]:
+        """Seconds since the prefetched window was last refreshed (None before the first refresh)"""
+        return self.prefetcher.age()
+    
+    def _cached_events(self, start_date: datetime, end_date: datetime, required: bool = False) -> List[Meeting]:
+        """Offline fallback - whatever the index/mirror holds for the range, if it holds it at all"""
+        if self.meeting_index.covers(start_date, end_date):
+            return self.meeting_index.query(start=start_date, end=end_date, overlapping=True)
+        if required:
+            raise CalendarUnavailableError(f"No cached events for {start_date} - {end_date}")
+        return []
+    
+    def iter_events(self, start_date: datetime, end_date: datetime,
+                    fields: Optional[Sequence[str]] = None) -> Iterator[Meeting]:
+        """Lazily yield events between start and end dates as each result page arrives;
+        API and network errors propagate to the caller"""
+        for batch in self.iter_event_batches(start_date, end_date, fields):
+            yield from batch
+    
+    def get_event_batch(self, start_date: datetime, end_date: datetime,
+                        fields: Optional[Sequence[str]] = None) -> EventBatch:
+        """Get events between start and end dates in columnar form, without building Meetings;
+        API and network errors propagate rather than returning a partial batch"""
+        batch = EventBatch(self._parser)
+        for page in self.iter_event_batches(start_date, end_date, fields):
+            self._parser.parse(page.raw_events, batch)
+        return batch
+    
+    def iter_event_batches(self, start_date: datetime, end_date: datetime,
+                           fields: Optional[Sequence[str]] = None) -> Iterator[EventBatch]:
+        """Yield one parsed EventBatch per result page.
+        
+        HttpError, httplib2.HttpLib2Error and OSError propagate - a listing cut short by an
+        error must not look like the end of the results.
+        """
+        for items in self._list_event_pages(start_date, end_date, fields):
+            yield self._parser.parse(items)
+    
+    def _list_event_pages(self, start_date: datetime, end_date: datetime,
+                          fields: Optional[Sequence[str]] = None) -> Iterator[List[Dict[str, Any]]]:
+        """Yield the raw items of each events().list page; HttpError propagates to the caller"""
+        start_time, end_time = self._to_rfc3339_range(start_date, end_date)
+        page_token = None
+        
+        while True:
+            events_result = self._execute(self.service.events().list(
                 calendarId=self.config.CALENDAR_ID,
                 timeMin=start_time,
                 timeMax=end_time,
                 singleEvents=True,
-                orderBy='startTime'
-            ).execute()
-            
-            events = events_result.get('items', [])
-            meetings = []
-            
-            for event in events:
-                meeting = self._event_to_meeting(event)
-                if meeting:
-                    meetings.append(meeting)
+                orderBy='startTime',
+                maxResults=self.config.EVENT_PAGE_SIZE,
+                pageToken=page_token,
+                fields=self._event_list_fields(fields)
+            ))
             
-            return meetings
+            yield events_result.get('items', [])
             
-        except HttpError as error:
-            print(f"An error occurred: {error}")
-            return []
+            page_token = events_result.get('nextPageToken')
+            if not page_token:
+                break
+    
+    def _to_rfc3339_range(self, start_date: datetime, end_date: datetime):
+        """Convert a local date range to the UTC RFC3339 strings the API expects"""
+        # Ensure dates are timezone-aware and convert to UTC
+        if start_date.tzinfo is None:
+            start_date = self.timezone.localize(start_date)
+        if end_date.tzinfo is None:
+            end_date = self.timezone.localize(end_date)
+        
+        # Convert to UTC for API request
+        start_utc = start_date.astimezone(pytz.UTC)
+        end_utc = end_date.astimezone(pytz.UTC)
+        
+        # Format as RFC3339 strings
+        return start_utc.strftime('%Y-%m-%dT%H:%M:%S.%fZ'), end_utc.strftime('%Y-%m-%dT%H:%M:%S.%fZ')
+    
+    def _event_list_fields(self, fields: Optional[Sequence[str]] = None, sync: bool = False) -> str:
+        """Map an event field projection to the API's partial-response `fields` parameter"""
+        item_fields = ','.join(fields or self.MEETING_EVENT_FIELDS)
+        page_fields = "nextPageToken,nextSyncToken" if sync else "nextPageToken"
+        return f"{page_fields},items({item_fields})"
     
     @trace_function
     @trace_api_call("Google_Calendar", "create_event")
     def create_event(self, meeting: Meeting) -> bool:
         """Create a new calendar event"""
         try:
-            # Ensure meeting times are timezone-aware
-            start_time = meeting.start_time
-            end_time = meeting.end_time
-            
-            if start_time.tzinfo is None:
-                start_time = self.timezone.localize(start_time)
-            if end_time.tzinfo is None:
-                end_time = self.timezone.localize(end_time)
-            
-            event_body = {
-                'summary': meeting.title,
-                'description': meeting.description or '',
-                'start': {
-                    'dateTime': start_time.isoformat(),
-                    'timeZone': str(start_time.tzinfo),
-                },
-                'end': {
-                    'dateTime': end_time.isoformat(),
-                    'timeZone': str(end_time.tzinfo),
-                },
-            }
-            
-            # Add attendees if provided
-            if meeting.attendees:
-                event_body['attendees'] = [{'email': email} for email in meeting.attendees]
-            
-            # Add location if provided
-            if meeting.location:
-                event_body['location'] = meeting.location
-            
-            event = self.service.events().insert(
+            event = self._execute(self.service.events().insert(
                 calendarId=self.config.CALENDAR_ID,
-                body=event_body
-            ).execute()
+                body=self._event_body(meeting)
+            ))
             
             print(f"Event created: {event.get('htmlLink')}")
+            self._cache_event(event)
             return True
             
         except HttpError as error:
             print(f"An error occurred while creating event: {error}")
             return False
     
+    @trace_function
+    @trace_api_call("Google_Calendar", "create_events")
+    def create_events(self, meetings: List[Meeting]) -> List[bool]:
+        """Create many events with batched inserts (50 per HTTP round-trip, throttled and retried
+        by ApiExecutor); returns per-meeting success"""
+        requests = {
+            str(i): self.service.events().insert(calendarId=self.config.CALENDAR_ID, body=self._event_body(meeting))
+            for i, meeting in enumerate(meetings)
+        }
+        responses = self.api.execute_batch(requests, self.config.CALENDAR_ID, self.new_batch_request)
+        
+        results = [False] * len(meetings)
+        created = []
+        for request_id, (response, exception) in responses.items():
+            if exception is not None:
+                print(f"An error occurred while creating event: {exception}")
+                continue
+            results[int(request_id)] = True
+            created.append(response)
+        
+        for event in created:
+            self._cache_event(event)
+        print(f"Created {len(created)} of {len(meetings)} events")
+        return results
+    
+    def _event_body(self, meeting: Meeting) -> Dict[str, Any]:
+        # Ensure meeting times are timezone-aware
+        start_time = meeting.start_time
+        end_time = meeting.end_time
+        
+        if start_time.tzinfo is None:
+            start_time = self.timezone.localize(start_time)
+        if end_time.tzinfo is None:
+            end_time = self.timezone.localize(end_time)
+        
+        event_body = {
+            'summary': meeting.title,
+            'description': meeting.description or '',
+            'start': self._event_time(start_time),
+            'end': self._event_time(end_time),
+        }
+        
+        # Add attendees if provided
+        if meeting.attendees:
+            event_body['attendees'] = [{'email': email} for email in meeting.attendees]
+        
+        # Add location if provided
+        if meeting.location:
+            event_body['location'] = meeting.location
+        return event_body
+    
+    def _event_time(self, value: datetime) -> Dict[str, str]:
+        return {'dateTime': value.isoformat(), 'timeZone': str(value.tzinfo)}
+    
+    def calendar_version(self) -> int:
+        """Changes whenever the locally known events change (for invalidating derived answers)"""
+        return self.meeting_index.version
+    
+    def _calendar_changed(self):
+        with self._busy_lock:
+            self._busy_cache.pop(self.config.CALENDAR_ID, None)
+        self.prefetcher.request_refresh()
+    
+    def _cache_event(self, event: Dict[str, Any]) -> Optional[Meeting]:
+        """Put a created/updated event into the meeting index and the mirror"""
+        self._calendar_changed()
+        batch = self._parser.parse([event])
+        if not len(batch):
+            return None
+        meeting = batch.meeting(0)
+        self.meeting_index.add(meeting)
+        if self.store:
+            self.store.upsert_events(self.config.CALENDAR_ID, self._store_rows(batch))
+        return meeting
+    
+    @trace_function
+    @trace_api_call("Google_Calendar", "update_event")
+    def update_event(self, meeting: Meeting, **changes) -> bool:
+        """Patch only the given fields of an event (title, description, location, attendees,
+        start_time, end_time), guarded by the etag the meeting was read at"""
+        if not meeting.event_id:
+            print("Cannot update event: No event ID available")
+            return False
+        
+        body = {}
+        for name, value in changes.items():
+            if name in ('start_time', 'end_time'):
+                if value.tzinfo is None:
+                    value = self.timezone.localize(value)
+                body[name[:-len('_time')]] = self._event_time(value)
+            elif name == 'title':
+                body['summary'] = value
+            elif name == 'attendees':
+                body['attendees'] = [{'email': email} for email in value]
+            elif name in ('description', 'location'):
+                body[name] = value
+            else:
+                raise ValueError(f"Unsupported event field: {name}")
+        if not body:
+            return True
+        
+        try:
+            request = self.service.events().patch(
+                calendarId=self.config.CALENDAR_ID,
+                eventId=meeting.event_id,
+                body=body,
+                fields=','.join(self.MEETING_EVENT_FIELDS)
+            )
+            if meeting.etag:
+                # Optimistic concurrency: fail with 412 if someone else changed the event since we read it
+                request.headers['If-Match'] = meeting.etag
+            event = self._execute(request)
+            
+        except HttpError as error:
+            if error.resp.status == 412:
+                print(f"Event '{meeting.title}' was changed elsewhere; not updating it")
+                self._refresh_event(meeting.event_id)
+            else:
+                print(f"An error occurred while updating event: {error}")
+            return False
+        
+        print(f"Event '{meeting.title}' updated successfully")
+        self._cache_event(event)
+        return True
+    
+    @trace_function
+    def reschedule_event(self, meeting: Meeting, new_start) -> bool:
+        """Move a meeting to a new start time (datetime or ISO string), keeping its duration"""
+        if isinstance(new_start, str):
+            new_start = datetime.fromisoformat(new_start.replace('Z', '+00:00'))
+        if new_start.tzinfo is None:
+            new_start = self.timezone.localize(new_start)
+        duration = meeting.end_time - meeting.start_time
+        return self.update_event(meeting, start_time=new_start, end_time=new_start + duration)
+    
+    def _refresh_event(self, event_id: str):
+        """Re-read one event so the cached copy (and its etag) is current again"""
+        try:
+            event = self._execute(self.service.events().get(
+                calendarId=self.config.CALENDAR_ID,
+                eventId=event_id,
+                fields=','.join(self.MEETING_EVENT_FIELDS)
+            ))
+            self._cache_event(event)
+        except HttpError as error:
+            print(f"An error occurred while refreshing event: {error}")
+    
     @trace_function
     @trace_api_call("Google_Calendar", "delete_event")
     def delete_event(self, meeting: Meeting) -> bool:
@@ -160,12 +595,16 @@ class CalendarManager:
                 print("Cannot delete event: No event ID available")
                 return False
             
-            self.service.events().delete(
+            self._execute(self.service.events().delete(
                 calendarId=self.config.CALENDAR_ID,
                 eventId=meeting.event_id
-            ).execute()
+            ))
             
             print(f"Event '{meeting.title}' deleted successfully")
+            self.meeting_index.remove(meeting.event_id)
+            if self.store:
+                self.store.delete_events(self.config.CALENDAR_ID, [meeting.event_id])
+            self._calendar_changed()
             return True
             
         except HttpError as error:
@@ -173,23 +612,39 @@ class CalendarManager:
             return False
     
     @trace_function
-    def check_availability(self, start_time: datetime, end_time: datetime) -> bool:
-        """Check if a time slot is available"""
+    def check_availability(self, start_time: datetime, end_time: datetime, max_age: Optional[float] = None) -> bool:
+        """Check if a time slot is available (from indexed events within max_age seconds, if given).
+        
+        If the calendar can't be reached, the index answers when it holds the slot; otherwise
+        CalendarUnavailableError is raised rather than guessing.
+        """
         # Ensure times are timezone-aware
         if start_time.tzinfo is None:
             start_time = self.timezone.localize(start_time)
         if end_time.tzinfo is None:
             end_time = self.timezone.localize(end_time)
+        
+        if self._is_cached(start_time, end_time, max_age):
+            return not self.meeting_index.busy_intervals(start_time, end_time)
             
-        existing_events = self.get_events(start_time, end_time)
-        return len(existing_events) == 0
+        # Any single event means the slot is taken, so stop at the first non-empty page
+        try:
+            for batch in self.iter_event_batches(start_time, end_time, fields=self.TIMING_EVENT_FIELDS):
+                if len(batch):
+                    return False
+            return True
+        except (HttpError, httplib2.HttpLib2Error, OSError) as error:
+            if not self.meeting_index.covers(start_time, end_time):
+                raise CalendarUnavailableError(f"Couldn't check availability: {error}") from error
+            print(f"Calendar unreachable, checking availability from cached events: {error}")
+            return not self.meeting_index.busy_intervals(start_time, end_time)
     
     @trace_function
     def find_available_slots(self, date: datetime, duration: timedelta, 
-                           num_suggestions: int = 3) -> List[TimeSlot]:
-        """Find available time slots on a given date"""
-        available_slots = []
-        
+                           num_suggestions: int = 3, max_age: Optional[float] = None,
+                           attendees: Optional[List[str]] = None) -> List[TimeSlot]:
+        """Find time slots on a given date that are free on the user's calendars and, if given,
+        for every attendee (prefetched events are used while fresh)"""
         # Ensure the input date is timezone-aware
         if date.tzinfo is None:
             date = self.timezone.localize(date)
@@ -198,25 +653,107 @@ class CalendarManager:
         start_of_day = date.replace(hour=self.config.BUSINESS_HOURS_START, minute=0, second=0, microsecond=0)
         end_of_day = date.replace(hour=self.config.BUSINESS_HOURS_END, minute=0, second=0, microsecond=0)
         
-        # Get existing events for the day
-        existing_events = self.get_events(start_of_day, end_of_day)
-        existing_events.sort(key=lambda x: x.start_time)
-        
-        current_time = start_of_day
+        starts = self.find_slot_starts(start_of_day, end_of_day, duration, attendees, max_age=max_age)
+        # First start of each free gap, then later starts within the gaps
+        chosen = SlotEngine.spread(starts, num_suggestions, self.config.SLOT_STEP_MINUTES * 60)
+        return self.slot_engine.to_slots(chosen, duration)
+    
+    def find_slot_starts(self, start_time: datetime, end_time: datetime, duration: timedelta,
+                         attendees: Optional[List[str]] = None, step_minutes: Optional[int] = None,
+                         max_age: Optional[float] = None) -> np.ndarray:
+        """Epochs of every start in [start_time, end_time) where `duration` fits inside business
+        hours and is free for the user and all attendees, on a step_minutes grid"""
+        if max_age is None:
+            max_age = self.config.PREFETCH_MAX_AGE_SECONDS
+        busy = self.get_busy_intervals(start_time, end_time, attendees, max_age)
+        return self.slot_engine.free_starts([busy], start_time, end_time, duration,
+                                            step_minutes or self.config.SLOT_STEP_MINUTES)
+    
+    def get_busy_intervals(self, start_time: datetime, end_time: datetime,
+                           attendees: Optional[List[str]] = None,
+                           max_age: Optional[float] = None) -> List[Tuple[float, float]]:
+        """Merged busy (start_epoch, end_epoch) intervals across the user's calendars and the
+        attendees' calendars, in start order"""
+        busy = self.get_busy_by_calendar(start_time, end_time, attendees, max_age)
+        return self._merge_busy(list(busy.values()))
+    
+    def get_busy_by_calendar(self, start_time: datetime, end_time: datetime,
+                             attendees: Optional[List[str]] = None,
+                             max_age: Optional[float] = None) -> Dict[str, List[Tuple[float, float]]]:
+        """Sorted busy intervals per calendar: the user's own (CALENDAR_ID, EXTRA_CALENDAR_IDS)
+        and each attendee's (keyed by lower-cased email)"""
+        if start_time.tzinfo is None:
+            start_time = self.timezone.localize(start_time)
+        if end_time.tzinfo is None:
+            end_time = self.timezone.localize(end_time)
         
-        for event in existing_events:
-            # Check if there's a gap before this event
-            if current_time + duration <= event.start_time:
-                available_slots.append(TimeSlot(current_time, current_time + duration))
-                if len(available_slots) >= num_suggestions:
-                    break
-            current_time = max(current_time, event.end_time)
+        busy = {}
+        calendar_ids = []
+        if self._is_cached(start_time, end_time, max_age):
+            busy[self.config.CALENDAR_ID] = self.meeting_index.busy_intervals(start_time, end_time)
+        else:
+            calendar_ids.append(self.config.CALENDAR_ID)
+        for calendar_id in self.config.EXTRA_CALENDAR_IDS + [email.lower() for email in attendees or [] if email]:
+            if calendar_id not in calendar_ids and calendar_id != self.config.CALENDAR_ID:
+                calendar_ids.append(calendar_id)
         
-        # Check if there's time after the last event
-        if len(available_slots) < num_suggestions and current_time + duration <= end_of_day:
-            available_slots.append(TimeSlot(current_time, current_time + duration))
+        busy.update(self._free_busy(calendar_ids, start_time, end_time))
+        return busy
+    
+    def _free_busy(self, calendar_ids: List[str], start_time: datetime,
+                   end_time: datetime) -> Dict[str, List[Tuple[float, float]]]:
+        """Sorted busy intervals per calendar, from the TTL cache or one freeBusy query per 50 calendars"""
+        start_epoch, end_epoch = start_time.timestamp(), end_time.timestamp()
+        oldest = time.time() - self.config.FREEBUSY_TTL_SECONDS
+        streams = {}
+        missing = []
+        with self._busy_lock:
+            for calendar_id in calendar_ids:
+                cached = self._busy_cache.get(calendar_id)
+                if cached and cached[0] >= oldest and cached[1] <= start_epoch and end_epoch <= cached[2]:
+                    streams[calendar_id] = [interval for interval in cached[3]
+                                            if interval[0] < end_epoch and interval[1] > start_epoch]
+                else:
+                    missing.append(calendar_id)
         
-        return available_slots[:num_suggestions]
+        time_min, time_max = self._to_rfc3339_range(start_time, end_time)
+        for i in range(0, len(missing), 50):
+            chunk = missing[i:i + 50]
+            try:
+                result = self._execute(self.service.freebusy().query(body={
+                    'timeMin': time_min,
+                    'timeMax': time_max,
+                    'items': [{'id': calendar_id} for calendar_id in chunk]
+                }))
+            except (HttpError, httplib2.HttpLib2Error, OSError) as error:
+                print(f"An error occurred while querying free/busy: {error}")
+                continue
+            
+            fetched_at = time.time()
+            for calendar_id in chunk:
+                info = result.get('calendars', {}).get(calendar_id, {})
+                if info.get('errors'):
+                    # e.g. an external attendee whose calendar isn't shared - treat as free
+                    print(f"Free/busy unavailable for {calendar_id}: {info['errors'][0].get('reason')}")
+                    continue
+                busy = sorted((self._parser.rfc3339_epoch(interval['start']), self._parser.rfc3339_epoch(interval['end']))
+                              for interval in info.get('busy', []))
+                with self._busy_lock:
+                    self._busy_cache[calendar_id] = (fetched_at, start_epoch, end_epoch, busy)
+                streams[calendar_id] = busy
+        return streams
+    
+    @staticmethod
+    def _merge_busy(streams: List[List[Tuple[float, float]]]) -> List[Tuple[float, float]]:
+        """k-way merge of sorted interval streams, coalescing overlaps"""
+        merged = []
+        for start, end in heapq.merge(*streams):
+            if merged and start <= merged[-1][1]:
+                if end > merged[-1][1]:
+                    merged[-1] = (merged[-1][0], end)
+            else:
+                merged.append((start, end))
+        return merged
     
     @trace_function
     def get_todays_events(self) -> List[Meeting]:
@@ -224,108 +761,75 @@ class CalendarManager:
         now = datetime.now(self.timezone)
         start_of_day = now.replace(hour=0, minute=0, second=0, microsecond=0)
         end_of_day = now.replace(hour=23, minute=59, second=59, microsecond=999999)
-        return self.get_events(start_of_day, end_of_day)
+        return self.get_events(start_of_day, end_of_day, max_age=self.config.PREFETCH_MAX_AGE_SECONDS)
     
     def get_events_with_person(self, person_email: str, days_ahead: int = 7) -> List[Meeting]:
         """Get events with a specific person in the coming days"""
         start_date = datetime.now(self.timezone)
         end_date = start_date + timedelta(days=days_ahead)
-        all_events = self.get_events(start_date, end_date)
+        self._ensure_indexed(start_date, end_date)
+        return self.meeting_index.query(emails=[person_email], start=start_date, end=end_date)
+    
+    def _search_window(self, query_date: str = None) -> Tuple[datetime, datetime]:
+        """Date range to search for a meeting - the given day, or today plus 30 days"""
+        if query_date:
+            start_date = datetime.fromisoformat(query_date)
+            return start_date, start_date + timedelta(days=1)
+        now = datetime.now(self.timezone)
+        start_date = now.replace(hour=0, minute=0, second=0, microsecond=0)
+        return start_date, start_date + timedelta(days=30)
+    
+    def _ensure_indexed(self, start_date: datetime, end_date: datetime):
+        """Refresh the meeting index for the range unless it is already fresh"""
+        if not self.meeting_index.covers(start_date, end_date, max_age=self.config.MEETING_INDEX_TTL_SECONDS):
+            self.get_events(start_date, end_date)
+    
+    def _parse_identifier(self, identifier: str) -> Tuple[str, List[str], List[Tuple[int, Optional[int]]], Optional[str]]:
+        """Split a spoken meeting identifier into title text, emails, start times and an ISO date"""
+        emails = self.EMAIL_PATTERN.findall(identifier)
+        text = self.EMAIL_PATTERN.sub(' ', identifier)
+        
+        times = []
+        for hour, minute, meridiem in self.TIME_12H_PATTERN.findall(text):
+            hour = int(hour) % 12 + (12 if meridiem.lower() == 'pm' else 0)
+            times.append((hour, int(minute) if minute else None))
+        text = self.TIME_12H_PATTERN.sub(' ', text)
+        for hour, minute in self.TIME_24H_PATTERN.findall(text):
+            times.append((int(hour), int(minute)))
+        text = self.TIME_24H_PATTERN.sub(' ', text)
         
-        return [event for event in all_events 
-                if event.attendees and person_email in event.attendees]
+        dates = self.DATE_PATTERN.findall(text)
+        text = self.DATE_PATTERN.sub(' ', text)
+        
+        return text.strip(), emails, times, dates[0] if dates else None
     
     @trace_function
     def find_meetings(self, identifier: str, query_date: str = None) -> List[Meeting]:
-        """Find meetings that match the given identifier (title, time, etc.)"""
+        """Find meetings that match the given identifier (title, attendee, time, etc.)"""
         try:
-            # Determine search date range
-            if query_date:
-                start_date = datetime.fromisoformat(query_date)
-                end_date = start_date + timedelta(days=1)
-            else:
-                # Search from beginning of today to 30 days ahead
-                now = datetime.now(self.timezone)
-                start_date = now.replace(hour=0, minute=0, second=0, microsecond=0)
-                end_date = start_date + timedelta(days=30)
-            
-            all_meetings = self.get_events(start_date, end_date)
-            matching_meetings = []
-            
-            identifier_lower = identifier.lower()
-            
-            # Extract potential email addresses from the identifier
-            import re
-            email_pattern = r'\b[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Z|a-z]{2,}\b'
-            extracted_emails = re.findall(email_pattern, identifier)
+            text, emails, times, mentioned_date = self._parse_identifier(identifier)
+            start_date, end_date = self._search_window(query_date or mentioned_date)
+            self._ensure_indexed(start_date, end_date)
             
-            for meeting in all_meetings:
-                match_found = False
-                
-                # Check if identifier matches title
-                if identifier_lower in meeting.title.lower():
-                    matching_meetings.append(meeting)
-                    match_found = True
-                
-                # Check if any extracted email addresses match meeting attendees
-                if not match_found and extracted_emails and meeting.attendees:
-                    for email in extracted_emails:
-                        if email.lower() in [attendee.lower() for attendee in meeting.attendees]:
-                            matching_meetings.append(meeting)
-                            match_found = True
-                            break
-                
-                # Check if identifier matches a time pattern
-                if not match_found and any(time_part in identifier_lower for time_part in 
-                        [meeting.start_time.strftime('%H:%M').lower(), 
-                         meeting.start_time.strftime('%I:%M %p').lower(),
-                         meeting.start_time.strftime('%Y-%m-%d').lower()]):
-                    matching_meetings.append(meeting)
-            
-            return matching_meetings
+            # A meeting matches if its title, an attendee or its start time matches
+            return self.meeting_index.query(text=text, emails=emails, times=times,
+                                            start=start_date, end=end_date)
         except Exception as e:
             print(f"Error finding meetings: {e}")
             return []
     
     @trace_function
-    def find_similar_meetings(self, identifier: str, query_date: str = None, similarity_threshold: float = 0.6) -> List[Meeting]:
-        """Find meetings with similar titles using fuzzy matching"""
+    def find_similar_meetings(self, identifier: str, query_date: str = None, similarity_threshold: float = 0.35) -> List[Meeting]:
+        """Find meetings with similar titles using trigram/BM25 fuzzy matching"""
         try:
-            # Determine search date range
-            if query_date:
-                start_date = datetime.fromisoformat(query_date)
-                end_date = start_date + timedelta(days=1)
-            else:
-                # Search from beginning of today to 30 days ahead
-                now = datetime.now(self.timezone)
-                start_date = now.replace(hour=0, minute=0, second=0, microsecond=0)
-                end_date = start_date + timedelta(days=30)
-            
-            all_meetings = self.get_events(start_date, end_date)
-            similar_meetings = []
-            
-            identifier_lower = identifier.lower()
-            identifier_words = set(identifier_lower.split())
-            
-            for meeting in all_meetings:
-                meeting_title_lower = meeting.title.lower()
-                meeting_words = set(meeting_title_lower.split())
-                
-                # Calculate similarity based on common words
-                if identifier_words and meeting_words:
-                    common_words = identifier_words.intersection(meeting_words)
-                    similarity = len(common_words) / len(identifier_words.union(meeting_words))
-                    
-                    if similarity >= similarity_threshold:
-                        similar_meetings.append((meeting, similarity))
-                
-                # Also check for partial word matches (e.g., "review" in "project review")
-                elif any(word in meeting_title_lower for word in identifier_words if len(word) > 2):
-                    similar_meetings.append((meeting, 0.5))  # Lower similarity for partial matches
+            start_date, end_date = self._search_window(query_date)
+            self._ensure_indexed(start_date, end_date)
             
-            # Sort by similarity score (descending) and return just the meetings
-            similar_meetings.sort(key=lambda x: x[1], reverse=True)
-            return [meeting for meeting, _ in similar_meetings[:5]]  # Return top 5 similar meetings
+            # Ranked best-first; scores are normalised so an exact title match is 1.0
+            similar_meetings = self.meeting_index.search_similar(
+                identifier, start=start_date, end=end_date, k=5, min_score=similarity_threshold
+            )
+            return [meeting for meeting, _ in similar_meetings]
             
         except Exception as e:
             print(f"Error finding similar meetings: {e}")
@@ -333,48 +837,5 @@ class CalendarManager:
     
     def _event_to_meeting(self, event: Dict[str, Any]) -> Optional[Meeting]:
         """Convert Google Calendar event to Meeting object"""
-        try:
-            # Handle different datetime formats
-            start = event['start']
-            end = event['end']
-            
-            if 'dateTime' in start:
-                # Parse timezone-aware datetime
-                start_time_str = start['dateTime']
-                end_time_str = end['dateTime']
-                
-                # Handle different timezone formats
-                if start_time_str.endswith('Z'):
-                    start_time = datetime.fromisoformat(start_time_str.replace('Z', '+00:00'))
-                    end_time = datetime.fromisoformat(end_time_str.replace('Z', '+00:00'))
-                else:
-                    start_time = datetime.fromisoformat(start_time_str)
-                    end_time = datetime.fromisoformat(end_time_str)
-                
-                # Convert to local timezone
-                start_time = start_time.astimezone(self.timezone)
-                end_time = end_time.astimezone(self.timezone)
-            else:
-                # All-day event - create timezone-aware datetime
-                start_date = datetime.fromisoformat(start['date'])
-                end_date = datetime.fromisoformat(end['date'])
-                
-                start_time = self.timezone.localize(start_date)
-                end_time = self.timezone.localize(end_date)
-            
-            attendees = []
-            if 'attendees' in event:
-                attendees = [attendee.get('email', '') for attendee in event['attendees']]
-            
-            return Meeting(
-                title=event.get('summary', 'No Title'),
-                start_time=start_time,
-                end_time=end_time,
-                description=event.get('description', ''),
-                attendees=attendees,
-                location=event.get('location', ''),
-                event_id=event.get('id', '')  # Store the Google Calendar event ID
-            )
-        except Exception as e:
-            print(f"Error parsing event: {e}")
-            return None
\ No newline at end of file
+        batch = self._parser.parse([event])
+        return batch.meeting(0) if len(batch) else None
@@ -0,0 +1,67 @@
+import threading
+import time
+from datetime import datetime, timedelta
+from typing import Optional, Tuple
+from config.settings import Config
+
+# Import our tracing system
+from config.logger import logger
+
+class CalendarPrefetcher:
+    """Keeps the near-term calendar window warm in CalendarManager's meeting index.
+
+    A daemon thread re-fetches the rolling window (start of this week or yesterday,
+    whichever is earlier, through PREFETCH_FUTURE_DAYS ahead) every
+    PREFETCH_INTERVAL_SECONDS, and straight away when request_refresh() is called after
+    a mutation. last_refreshed records when the window was last fetched successfully.
+    """
+
+    def __init__(self, calendar_manager, interval: Optional[float] = None):
+        self.calendar_manager = calendar_manager
+        self.config = Config()
+        self.interval = interval or self.config.PREFETCH_INTERVAL_SECONDS
+        self.last_refreshed: Optional[float] = None  # epoch seconds of the last successful refresh
+        self._wake = threading.Event()
+        self._stopped = threading.Event()
+        self._thread = None
+
+    def start(self):
+        if self._thread is None:
+            self._thread = threading.Thread(target=self._run, name='calendar-prefetch', daemon=True)
+            self._thread.start()
+
+    def stop(self):
+        self._stopped.set()
+        self._wake.set()
+
+    def request_refresh(self):
+        """Refresh as soon as possible (repeated requests collapse into one refresh)"""
+        self._wake.set()
+
+    def age(self) -> Optional[float]:
+        """Seconds since the window was last refreshed, or None if it never was"""
+        return time.time() - self.last_refreshed if self.last_refreshed is not None else None
+
+    def window(self) -> Tuple[datetime, datetime]:
+        now = datetime.now(self.calendar_manager.timezone)
+        today = now.replace(hour=0, minute=0, second=0, microsecond=0)
+        start = min(today - timedelta(days=1), today - timedelta(days=today.weekday()))
+        end = today + timedelta(days=self.config.PREFETCH_FUTURE_DAYS + 1)
+        return start, end
+
+    def refresh(self) -> bool:
+        start, end = self.window()
+        if not self.calendar_manager.refresh_range(start, end):
+            return False
+        self.last_refreshed = time.time()
+        logger.debug(f"Prefetched calendar window {start:%Y-%m-%d} - {end:%Y-%m-%d}")
+        return True
+
+    def _run(self):
+        while not self._stopped.is_set():
+            self._wake.clear()
+            try:
+                self.refresh()
+            except Exception as e:
+                print(f"Calendar prefetch failed: {e}")
+            self._wake.wait(self.interval)
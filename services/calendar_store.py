@@ -0,0 +1,102 @@
+import json
+import sqlite3
+import threading
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+class CalendarStore:
+    """On-disk SQLite mirror of calendar events and sync state, keyed by calendar id.
+
+    Runs in WAL mode so the background reconciler can write while the bot reads.
+    Events are stored as the raw API payload plus start/end epochs (indexed for window
+    queries); the in-memory MeetingIndex is rebuilt from them at startup.
+    """
+
+    SCHEMA = """
+        CREATE TABLE IF NOT EXISTS events (
+            calendar_id TEXT NOT NULL,
+            event_id TEXT NOT NULL,
+            start_epoch REAL NOT NULL,
+            end_epoch REAL NOT NULL,
+            payload TEXT NOT NULL,
+            PRIMARY KEY (calendar_id, event_id)
+        );
+        CREATE INDEX IF NOT EXISTS idx_events_window ON events (calendar_id, start_epoch, end_epoch);
+        CREATE TABLE IF NOT EXISTS sync_state (
+            calendar_id TEXT PRIMARY KEY,
+            sync_token TEXT,
+            window_start REAL NOT NULL,
+            window_end REAL NOT NULL,
+            synced_at REAL NOT NULL
+        );
+    """
+
+    def __init__(self, path: str):
+        self.path = path
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.executescript(self.SCHEMA)
+        self._conn.commit()
+
+    def load_events(self, calendar_id: str) -> List[Dict[str, Any]]:
+        """All mirrored raw events for a calendar, in start order"""
+        with self._lock:
+            rows = self._conn.execute(
+                "SELECT payload FROM events WHERE calendar_id = ? ORDER BY start_epoch", (calendar_id,)
+            ).fetchall()
+        return [json.loads(payload) for (payload,) in rows]
+
+    def get_sync_state(self, calendar_id: str) -> Optional[Dict[str, Any]]:
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT sync_token, window_start, window_end, synced_at FROM sync_state WHERE calendar_id = ?",
+                (calendar_id,)
+            ).fetchone()
+        if row is None:
+            return None
+        return {'sync_token': row[0], 'window_start': row[1], 'window_end': row[2], 'synced_at': row[3]}
+
+    def save_sync_state(self, calendar_id: str, sync_token: Optional[str], window_start: float,
+                        window_end: float, synced_at: float):
+        with self._lock, self._conn:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO sync_state (calendar_id, sync_token, window_start, window_end, synced_at) "
+                "VALUES (?, ?, ?, ?, ?)",
+                (calendar_id, sync_token, window_start, window_end, synced_at)
+            )
+
+    def upsert_events(self, calendar_id: str, events: Iterable[Tuple[Dict[str, Any], float, float]]):
+        """Insert or replace (raw event, start epoch, end epoch) rows"""
+        with self._lock, self._conn:
+            self._conn.executemany(
+                "INSERT OR REPLACE INTO events (calendar_id, event_id, start_epoch, end_epoch, payload) "
+                "VALUES (?, ?, ?, ?, ?)",
+                [(calendar_id, event['id'], start, end, json.dumps(event)) for event, start, end in events]
+            )
+
+    def delete_events(self, calendar_id: str, event_ids: Iterable[str]):
+        with self._lock, self._conn:
+            self._conn.executemany(
+                "DELETE FROM events WHERE calendar_id = ? AND event_id = ?",
+                [(calendar_id, event_id) for event_id in event_ids]
+            )
+
+    def replace_window(self, calendar_id: str, start_epoch: float, end_epoch: float,
+                       events: Iterable[Tuple[Dict[str, Any], float, float]]):
+        """Make the mirror hold exactly `events` for events overlapping [start_epoch, end_epoch)"""
+        rows = [(calendar_id, event['id'], start, end, json.dumps(event)) for event, start, end in events]
+        with self._lock, self._conn:
+            self._conn.execute(
+                "DELETE FROM events WHERE calendar_id = ? AND start_epoch < ? AND end_epoch > ?",
+                (calendar_id, end_epoch, start_epoch)
+            )
+            self._conn.executemany(
+                "INSERT OR REPLACE INTO events (calendar_id, event_id, start_epoch, end_epoch, payload) "
+                "VALUES (?, ?, ?, ?, ?)",
+                rows
+            )
+
+    def close(self):
+        with self._lock:
+            self._conn.close()
@@ -1,9 +1,19 @@
-import google.generativeai as genai
+import asyncio
 from datetime import datetime, timedelta
 import re
-from typing import Dict, Any, Optional, List
+from typing import Awaitable, Callable, Dict, Any, Hashable, Optional, List
 from config.settings import Config
 from models.meeting import Meeting
+from models.intent import IntentResult
+from services.llm_client import LLMClient
+from services.intent_router import IntentRouter
+from services.temporal_parser import TemporalParser
+from services.response_renderer import ResponseRenderer
+from services.speech_pipeline import SentenceSegmenter, SpeechPipeline
+from services.llm_cache import LLMCache
+from services.conversation_memory import ConversationMemory
+from services.speculation import SpeculativeClassifier
+from services.prompts import CLASSIFIER_INSTRUCTIONS, RESPONDER_INSTRUCTIONS, SUMMARIZER_INSTRUCTIONS, INTENT_RESPONSE_SCHEMA, estimate_tokens
 from fastapi import WebSocket
 import json
 import os
@@ -13,53 +23,111 @@ from real_time_tts_version2.app.tts_engine import synthesize_text
 from config.logger import trace_function, trace_api_call, logger
 from stt import RealTimeSTT
 
+SPEAKER_WAV = "/home/multiqos/vansh/MeetingScheduler/meeting-schedular/real_time_tts_version2/my/cloning_Male.wav"
+
 class ConversationHandler:
     @trace_function
     def __init__(self):
         self.config = Config()
-        genai.configure(api_key=self.config.GEMINI_API_KEY)
-        self.model = genai.GenerativeModel(self.config.GEMINI_MODEL)
+        self.llm = LLMClient(system_instruction=RESPONDER_INSTRUCTIONS)  # async Gemini access with timeouts
+        self.classifier_llm = LLMClient(system_instruction=CLASSIFIER_INSTRUCTIONS)
+        self.temporal = TemporalParser()  # local date/time resolution (the LLM only quotes the wording)
+        self.router = IntentRouter(self.temporal)  # answers simple requests without the LLM
+        self.renderer = ResponseRenderer(self._ask_for_missing_info)  # templated replies for known situations
         self.pending_meetings = {}  # Store meetings pending complete information
-        self.chat_history = []  # Store conversation history
+        self.summarizer_llm = LLMClient(system_instruction=SUMMARIZER_INSTRUCTIONS.format(
+            max_words=self.config.MEMORY_SUMMARY_TOKENS * 3 // 4))
+        self.memory = ConversationMemory(self._summarize_history, self.config.MEMORY_RECENT_MESSAGES,
+                                         self.config.MEMORY_SUMMARY_TOKENS)  # recent turns + running summary
+        self.speech: Optional[SpeechPipeline] = None  # set while a reply is being spoken
+        self.cache = LLMCache(
+            self.config.LLM_CACHE_SIZE, self.config.LLM_CACHE_TTL_SECONDS,
+            embed=self.llm.embed if self.config.LLM_CACHE_SEMANTIC else None,
+            similarity=self.config.LLM_CACHE_SIMILARITY
+        )
+        self.calendar_version: Callable[[], Hashable] = lambda: None  # set by the app to CalendarManager.calendar_version
+        self.prefetch_calendar: Optional[Callable[[Dict[str, Any]], Awaitable[None]]] = None  # set by the app
+        self.speculation = SpeculativeClassifier(self._speculative_classify, self._speculative_prefetch)
+        self._speculation_context: Dict[str, Any] = {}
+        self._warm_audio: Dict[str, asyncio.Task] = {}  # sentence -> synthesis started before it was needed
         
     @trace_function
     def add_to_history(self, role: str, message: str):
-        """Add a message to chat history and maintain only last 6 messages (3 user + 3 assistant)"""
-        self.chat_history.append({
-            'role': role,
-            'message': message,
-            'timestamp': datetime.now().isoformat()
-        })
-        
-        # Keep only the last 6 messages (3 pairs of user-assistant)
-        if len(self.chat_history) > 6:
-            self.chat_history = self.chat_history[-6:]
+        """Add a message to the conversation memory; older messages get summarized in the background"""
+        self.memory.add(role, message)
     
+    @property
+    def chat_history(self) -> List[Dict[str, str]]:
+        return self.memory.messages
+
     @trace_function
-    def get_conversation_context(self) -> str:
-        """Format chat history for LLM context - includes both user and assistant messages"""
-        if not self.chat_history:
-            return "No previous conversation history."
-        
-        context_lines = ["Recent conversation history:"]
-        for entry in self.chat_history:
-            role_label = "User" if entry['role'] == 'user' else "Assistant"
-            # Truncate very long messages for context
-            message = entry['message']
-            if len(message) > 150:
-                message = message[:150] + "..."
-            context_lines.append(f"{role_label}: {message}")
-        
-        return "\n".join(context_lines)
+    def get_conversation_context(self, token_budget: Optional[int] = None) -> str:
+        """Pending request facts, summary of older turns and recent messages for LLM context.
+        With a token budget, the oldest messages that don't fit are left out."""
+        return self.memory.render(token_budget)
+
+    async def _summarize_history(self, summary: str, lines: List[str]) -> str:
+        prompt = f"Summary so far: {summary or '(none)'}\n\nNext messages:\n" + "\n".join(lines)
+        return await self.summarizer_llm.generate(prompt)
+
+    def _classification_prompt(self, user_input: str) -> str:
+        """Per-request part of the classification prompt; the instructions are the classifier
+        model's system instruction"""
+        now = datetime.now()
+        details = f"Today's date: {now.strftime('%Y-%m-%d (%A)')}\nCurrent time: {now.strftime('%H:%M')}\n\nCurrent user message: \"{user_input}\""
+        history = self.get_conversation_context(self.config.LLM_PROMPT_TOKEN_BUDGET - estimate_tokens(details))
+        return f"{history}\n\n{details}"
+
+    def _response_prompt(self, situation: str, context_str: str, user_message: str) -> str:
+        """Per-request part of the reply prompt. The situation and its context are always sent
+        in full; history fills whatever is left of the token budget."""
+        details = (f"Current situation: {situation}\n\nAdditional context:\n{context_str}\n\n"
+                   f"User's last message: \"{user_message}\"\n\n"
+                   f"Current date/time: {datetime.now().strftime('%Y-%m-%d %H:%M')}")
+        history = self.get_conversation_context(self.config.LLM_PROMPT_TOKEN_BUDGET - estimate_tokens(details))
+        return f"{history}\n\n{details}"
 
     @trace_function
-    def get_user_voice_input(self) -> str:
+    def get_user_voice_input(self, on_partial: Optional[Callable[[str], None]] = None) -> str:
         print("🎤 Listening for your reply...")
         stt = RealTimeSTT(model_size="large-v3", device="cpu")
-        result = stt.start_recording_for_public_environment()  # Use public environment settings
+        result = stt.start_recording_for_public_environment(on_partial=on_partial)  # Use public environment settings
         if result and 'transcription' in result:
             return result['transcription']
         return ""
+
+    async def listen(self, context: Dict[str, Any]) -> str:
+        """Record the user's reply without blocking the loop. Whenever they pause, what they
+        have said so far is classified (and its data prefetched) while recording goes on."""
+        self._speculation_context = context
+        for task in self._warm_audio.values():
+            task.cancel()
+        self._warm_audio = {}
+        on_partial = None
+        if self.config.SPECULATIVE_CLASSIFICATION:
+            self.speculation.begin()
+            on_partial = self.speculation.on_partial
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(None, self.get_user_voice_input, on_partial)
+
+    async def _speculative_classify(self, text: str) -> Optional[Dict[str, Any]]:
+        context = self._speculation_context
+        routed = self.router.route(text, context)
+        if routed is not None:
+            return routed
+        self.memory.set_facts(context)
+        return await self._classify_with_llm(self._classification_prompt(text))
+
+    async def _speculative_prefetch(self, text: str, result: Dict[str, Any]):
+        """Fetch the calendar range the request will read and, for intents whose reply is the
+        classifier's own response, synthesize that reply ahead of time"""
+        self._resolve_times(result, text, self._speculation_context)
+        if result['intent'] in ('GREETING', 'GENERAL_QUERY'):
+            for sentence in SentenceSegmenter.split(result.get('response', '')):
+                if sentence not in self._warm_audio:
+                    self._warm_audio[sentence] = asyncio.create_task(self._synthesize_sentence(sentence))
+        if self.prefetch_calendar is not None:
+            await self.prefetch_calendar(result)
     
 
     
@@ -88,19 +156,53 @@ class ConversationHandler:
         
 
     async def speak_response_in_terminal(self, text: str):
-        cleaned_text = self.clean_text_for_tts(text)  # 👈 Clean before speaking
+        """Speak text sentence by sentence, synthesizing each while the previous one plays"""
+        pipeline = SpeechPipeline(self._synthesize_sentence, self._play_audio)
+        for sentence in SentenceSegmenter.split(text):
+            pipeline.say(sentence)
+        await pipeline.finish()
 
-        filename = f"terminal_response_{uuid.uuid4()}.wav"
-        output_path = f"temp_audio/{filename}"
-        speaker_wav = "/home/multiqos/vansh/MeetingScheduler/meeting-schedular/real_time_tts_version2/my/cloning_Male.wav"
+    def start_speech(self):
+        """Start speaking this turn's reply; LLM replies are then spoken while they stream in"""
+        if self.speech is not None:
+            self.speech.cancel()
+        self.speech = SpeechPipeline(self._synthesize_sentence, self._play_audio)
 
-        language = "en"
+    async def finish_speech(self, response: str):
+        """Speak response if none of it was streamed, then wait for playback to finish"""
+        pipeline, self.speech = self.speech, None
+        if pipeline is None:
+            await self.speak_response_in_terminal(response)
+            return
+        if not pipeline.spoken:
+            for sentence in SentenceSegmenter.split(response):
+                pipeline.say(sentence)
+        await pipeline.finish()
 
-        success = await synthesize_text(cleaned_text, speaker_wav, language, output_path)
-        if success:
-            os.system(f"ffplay -nodisp -autoexit {output_path} >/dev/null 2>&1")
-        else:
-            print(f"❌ TTS failed for: {cleaned_text}")
+    async def _synthesize_sentence(self, sentence: str) -> Optional[str]:
+        warm = self._warm_audio.pop(sentence, None)
+        if warm is not None:
+            try:
+                path = await warm
+            except asyncio.CancelledError:
+                path = None
+            if path:
+                return path
+        cleaned_text = self.clean_text_for_tts(sentence)  # 👈 Clean before speaking
+        if not cleaned_text:
+            return None
+        output_path = f"temp_audio/terminal_response_{uuid.uuid4()}.wav"
+        if await synthesize_text(cleaned_text, SPEAKER_WAV, "en", output_path):
+            return output_path
+        print(f"❌ TTS failed for: {cleaned_text}")
+        return None
+
+    async def _play_audio(self, path: str):
+        process = await asyncio.create_subprocess_exec(
+            'ffplay', '-nodisp', '-autoexit', path,
+            stdout=asyncio.subprocess.DEVNULL, stderr=asyncio.subprocess.DEVNULL
+        )
+        await process.wait()
 
         
     @trace_function
@@ -110,145 +212,30 @@ class ConversationHandler:
         
         # Add user message to history
         self.add_to_history('user', user_input)
+        self.memory.set_facts(context)
+        # A classification started on a partial transcript is used if the final one matches
+        speculated = await self.speculation.resolve(user_input)
         
-        # Get conversation context
-        conversation_context = self.get_conversation_context()
-
-        prompt = f"""
-        You are a friendly meeting scheduler assistant. Analyze the user's message and determine their intent.
-        Be warm, conversational, and helpful - like talking to a good friend, not a strict teacher.
-        
-        {conversation_context}
-        
-        Current user message: "{user_input}"
-        
-        Current context:
-        - Today's date: {datetime.now().strftime('%Y-%m-%d')}
-        - Current time: {datetime.now().strftime('%H:%M')}
-        
-        IMPORTANT: Use the conversation history to understand:
-        1. If the user is continuing a previous request (like providing missing meeting details)
-        2. If they're referring to something mentioned earlier
-        3. If they're confirming or canceling a previous action
-        4. Context about meetings they've discussed before
-        
-        Possible intents:
-        1. VIEW_CALENDAR - User wants to see their schedule
-        2. ADD_MEETING - User wants to schedule a new meeting
-        3. DELETE_MEETING - User wants to cancel/delete a meeting
-        4. CHECK_AVAILABILITY - User wants to check if they're free at a specific time
-        5. FIND_MEETINGS - User wants to find meetings with specific people or criteria
-        6. CONFIRMATION - User is confirming a previous action (like "yes" to schedule a meeting)
-        7. PROVIDE_INFO - User is providing missing information for a previous request
-        8. GENERAL_QUERY - General questions about their calendar
-        
-        For ADD_MEETING intent, extract:
-        - meeting_title (the purpose/title of the meeting - MANDATORY)
-        - meeting_description (optional subtitle/additional details)
-        - start_datetime (convert relative times like "tomorrow at 2pm" to specific datetime - MANDATORY)
-        - duration_minutes (how long the meeting should be in minutes - MANDATORY, only include if user specifies duration)
-        - attendees (email addresses or names if mentioned - MANDATORY, only include if user mentions attendees, do not default to empty list)
-            Note: This includes team references like "marketing team", "dev team", specific names, or email addresses
-        - location (if mentioned, optional)
-        - timezone (if user mentions timezone like EST, PST, UTC, etc.)
-        - recurrence_pattern (if user mentions recurring meetings - values: "daily", "weekly", "monthly", "yearly")
-        - recurrence_count (number of occurrences for recurring meetings - e.g., "5 weeks" = 5, "3 months" = 3)
-        - recurrence_days (for weekly patterns, which days - e.g., ["tuesday"] for "every tuesday", ["monday", "friday"] for "mondays and fridays")
-        
-        For VIEW_CALENDAR intent, extract:
-        - query_date (convert dates like "20th june", "june 20th", "tomorrow", "today" to ISO format YYYY-MM-DD)
-        - date_range (for weekly/range requests like "this week", "next week", "this month" - use values like "this_week", "next_week", "this_month")
-        
-        For DELETE_MEETING intent, extract:
-        - meeting_identifier (title, time, or other identifying info)
-        - query_date (if specific date mentioned)
-        
-        For PROVIDE_INFO intent, extract whatever information the user is providing based on conversation history.
-        This includes:
-        - timezone (if user mentions EST, PST, UTC, etc.)
-        - Any other missing fields they're providing
-        
-        For CHECK_AVAILABILITY intent, extract:
-        - start_datetime (the time to check availability for - MANDATORY)
-        - duration_minutes (if checking for a specific duration, default 60)
-        - end_datetime (if user specifies a time range like "3 to 4pm")
-        
-        DATE PARSING RULES:
-        - Convert ordinal dates like "20th june", "1st july", "3rd december" to ISO format
-        - For dates without year, assume current year (2025)
-        - Convert relative dates like "today", "tomorrow", "next week" to specific dates
-        - For weekly requests like "this week", "next week", set date_range to "this_week", "next_week" respectively
-        - Examples: "20th june" -> "2025-06-20", "tomorrow" -> actual tomorrow's date, "this week" -> date_range: "this_week"
-        - Always use YYYY-MM-DD format for query_date
-        - For start_datetime, use full ISO format: YYYY-MM-DDTHH:MM:SS
-        
-        RECURRING MEETING START DATE RULES:
-        - For recurring meetings like "every tuesday for 5 weeks", the start_datetime should be the NEXT occurrence of that day
-        - If today is Friday June 20, 2025, and user says "every tuesday", start_datetime should be Tuesday June 24, 2025 (the very next Tuesday)
-        - Do NOT set start dates weeks or months in the future unless explicitly specified
-        - Examples: 
-          * "every tuesday for 5 weeks" on Friday -> start next Tuesday (not 5 weeks from now)
-          * "every monday starting next month" -> start first Monday of next month
-          * "daily for 2 weeks" -> start tomorrow (or today if time allows)
-        
-        TIMEZONE HANDLING:
-        - If user mentions timezone abbreviations like EST, PST, CST, MST, UTC, GMT, etc., extract them as "timezone"
-        - If user just says a timezone name like "Eastern", "Pacific", "Central", extract as "timezone"
-        - Common patterns: "EST", "in EST", "Eastern time", "Pacific Standard Time", etc.
-        
-        RECURRING MEETING PATTERNS:
-        - "every tuesday" or "every tuesday for 5 weeks" -> recurrence_pattern: "weekly", recurrence_days: ["tuesday"], recurrence_count: 5
-        - "daily for 2 weeks" -> recurrence_pattern: "daily", recurrence_count: 14
-        - "weekly for 3 weeks" -> recurrence_pattern: "weekly", recurrence_count: 3
-        - "monthly for 6 months" -> recurrence_pattern: "monthly", recurrence_count: 6
-        - "every monday and friday" -> recurrence_pattern: "weekly", recurrence_days: ["monday", "friday"]
-        
-        Respond in this exact JSON format:
-        {{
-            "intent": "INTENT_NAME",
-            "confidence": 0.95,
-            "extracted_data": {{
-                "meeting_title": "title here",
-                "meeting_description": "subtitle here",
-                "start_datetime": "2024-01-15T14:00:00",
-                "end_datetime": "2024-01-15T15:00:00",
-                "duration_minutes": 60,
-                "location": "location here",
-                "timezone": "EST",
-                "recurrence_pattern": "weekly",
-                "recurrence_count": 5,
-                "recurrence_days": ["tuesday"],
-                "query_date": "2024-01-15",
-                "person_email": "person@example.com",
-                "meeting_identifier": "meeting title or time"
-            }},
-            "missing_fields": ["field1", "field2"],
-            "context_understood": true/false,
-            "response": "Natural, friendly language response to user"
-        }}
-        
-        Only include relevant fields in extracted_data based on the intent.
-        For ADD_MEETING, list any missing mandatory fields (meeting_title, start_datetime, duration_minutes, attendees) in "missing_fields".
-        Set "context_understood" to true if you're using conversation history to understand the current message.
-        Make responses conversational and friendly.
-        """
+        # Simple, unambiguous requests don't need a round-trip to Gemini
+        routed = self.router.route(user_input, context)
+        if routed is not None:
+            if websocket:
+                await websocket.send_text(json.dumps({"type": "text", "content": routed["response"]}))
+            return routed
+
+        prompt = self._classification_prompt(user_input)
         
         try:
-            response = self.model.generate_content(prompt)
-            response_text = response.text.strip()
-
-            if response_text.startswith('```json'):
-                response_text = response_text[7:]
-            if response_text.startswith('```'):
-                response_text = response_text[3:]
-            if response_text.endswith('```'):
-                response_text = response_text[:-3]
-            response_text = response_text.strip()
+            # Classifications don't depend on calendar data, only on the prompt (history included)
+            cache_scope = LLMCache.key(prompt.replace(user_input, ''))
+            result = speculated or await self.cache.get(prompt, scope=cache_scope, text=user_input)
+            if result is None:
+                result = await self._classify_with_llm(prompt)
+                if result is not None:
+                    await self.cache.put(prompt, result, scope=cache_scope, text=user_input)
 
-            try:
-                result = json.loads(response_text)
-            except json.JSONDecodeError:
-                print("⚠️ LLM response was not valid JSON, using fallback intent matcher.")
+            if result is None:
+                print("⚠️ LLM response did not match the intent schema, using fallback intent matcher.")
                 result = {
                     "intent": "GENERAL_QUERY",
                     "confidence": 0.5,
@@ -275,6 +262,8 @@ class ConversationHandler:
                     result["intent"] = "CONFIRMATION"
                     result["response"] = "Got it! Let me proceed with that for you."
 
+            self._resolve_times(result, user_input, context)
+
             if websocket:
                 await websocket.send_text(json.dumps({"type": "text", "content": result["response"]}))
             
@@ -303,6 +292,52 @@ class ConversationHandler:
 
 
     
+    @trace_function
+    async def _classify_with_llm(self, prompt: str) -> Optional[Dict[str, Any]]:
+        """Schema-constrained classification; one retry if the reply doesn't validate, else None"""
+        request = prompt
+        for attempt in range(2):
+            try:
+                raw = await self.classifier_llm.generate_json(request, INTENT_RESPONSE_SCHEMA)
+                return IntentResult.from_dict(raw).to_dict()
+            except ValueError as e:  # json.JSONDecodeError is a ValueError too
+                logger.warning(f"Invalid classifier response (attempt {attempt + 1}): {e}")
+                request = f"{prompt}\n\nYour previous reply was invalid ({e}). Reply again following the schema exactly."
+        return None
+
+    def _resolve_times(self, result: Dict[str, Any], user_input: str, context: Optional[Dict[str, Any]] = None):
+        """Fill the ISO date/time fields of an LLM result from the user's wording"""
+        data = result.get('extracted_data')
+        if not isinstance(data, dict):
+            return
+        when = data.pop('when', None)
+        intent = result.get('intent')
+        if intent not in ('ADD_MEETING', 'CHECK_AVAILABILITY', 'PROVIDE_INFO', 'VIEW_CALENDAR',
+                          'DELETE_MEETING', 'RESCHEDULE_MEETING'):
+            return
+
+        # A bare time given while completing a meeting belongs to the day already chosen
+        default_date = None
+        pending_start = ((context or {}).get('data') or {}).get('start_datetime')
+        if pending_start:
+            try:
+                default_date = datetime.fromisoformat(pending_start).date()
+            except ValueError:
+                pass
+
+        resolved = self.temporal.fields(when, default_date=default_date) if when else {}
+        if not resolved:
+            resolved = self.temporal.fields(user_input, default_date=default_date)
+
+        if intent in ('VIEW_CALENDAR', 'DELETE_MEETING'):
+            resolved = {key: value for key, value in resolved.items() if key in ('query_date', 'date_range')}
+        elif intent == 'RESCHEDULE_MEETING':
+            resolved = {'new_datetime': resolved['start_datetime']} if 'start_datetime' in resolved else {}
+        else:
+            resolved.pop('query_date', None)
+            resolved.pop('date_range', None)
+        data.update(resolved)
+
     @trace_function
     def generate_response(self, intent: str, data: Dict[str, Any], context: Dict[str, Any]) -> str:
         """Generate a natural language response based on intent and data"""
@@ -497,12 +532,14 @@ class ConversationHandler:
 
     @trace_function
     @trace_api_call("Gemini", "generate_dynamic_response")
-    def generate_dynamic_response(self, situation: str, context_data: dict = None, user_message: str = "") -> str:
-        """Generate dynamic responses using LLM instead of static strings"""
-        
-        # Get conversation context
-        conversation_context = self.get_conversation_context()
-        
+    async def generate_dynamic_response(self, situation: str, context_data: dict = None, user_message: str = "") -> str:
+        """Reply for a situation: rendered from templates when it's a known one (unless
+        RESPONSE_MODE is 'llm'), otherwise generated by the LLM"""
+        if self.config.RESPONSE_MODE != 'llm':
+            rendered = self.renderer.render(situation, context_data)
+            if rendered is not None:
+                return rendered
+
         # Prepare context data as string
         context_str = ""
         if context_data:
@@ -512,25 +549,7 @@ class ConversationHandler:
                     # Special handling for events/meetings - always show details
                     if key == 'events' and all(isinstance(item, dict) for item in value):
                         # Format meeting details properly
-                        events_text = []
-                        for event in value:
-                            title = event.get('title', 'No Title')
-                            time = event.get('time', 'No Time')
-                            date = event.get('date', '')  # For weekly view
-                            
-                            if date:
-                                # Weekly view - include date
-                                event_line = f"• {title} on {date} from {time}"
-                            else:
-                                # Single day view
-                                event_line = f"• {title} ({time})"
-                            
-                            if event.get('attendees'):
-                                attendees_str = ', '.join(event['attendees'][:2])
-                                if len(event['attendees']) > 2:
-                                    attendees_str += f" +{len(event['attendees']) - 2} more"
-                                event_line += f" - with {attendees_str}"
-                            events_text.append(event_line)
+                        events_text = [self.renderer.format_event(event) for event in value]
                         context_items.append(f"{key}:\n" + "\n".join(events_text))
                     elif len(value) <= 3:
                         context_items.append(f"{key}: {', '.join(str(v) for v in value)}")
@@ -542,57 +561,54 @@ class ConversationHandler:
                     context_items.append(f"{key}: {value}")
             context_str = "\n".join(context_items)
         
-        prompt = f"""
-        You are a friendly, conversational meeting scheduler assistant. Generate a natural response for this situation.
-        Be warm, helpful, and personable - like talking to a good friend who's helping with your calendar.
-        
-        {conversation_context}
-        
-        Current situation: {situation}
-        
-        Additional context:
-        {context_str}
-        
-        User's last message: "{user_message}"
-        
-        Current date/time: {datetime.now().strftime('%Y-%m-%d %H:%M')}
-        
-        CRITICAL INSTRUCTIONS:
-        - NEVER create, invent, or hallucinate fake meetings, events, or calendar data
-        - ONLY use actual meeting/event information provided in the context above
-        - If no meetings/events are provided in the context, the calendar is empty - acknowledge this clearly
-        - If events_count is 0 or there are no events listed, say the calendar is free/empty
-        - Do NOT create example meetings like "Project Brainstorm", "Client Presentation", etc.
-        - When asking for clarification about which meeting to cancel, do NOT list fake meetings
-        
-        Generate a natural, conversational response that:
-        1. Acknowledges the situation appropriately
-        2. Uses the conversation context to maintain continuity
-        3. Is helpful and friendly
-        4. Uses emojis sparingly but effectively
-        5. Matches the tone of a helpful assistant
-        6. ONLY shows actual meeting details from the context if any exist
-        
-        When showing meetings/events, format them nicely with:
-        - Meeting titles (only real ones from context)
-        - Times (only real ones from context)
-        - Attendees (only real ones from context)
-        
-        Keep the response conversational but informative. Don't include JSON or formatting instructions.
-        Just return the natural response text.
-        """
+        prompt = self._response_prompt(situation, context_str, user_message)
         
+        # Keyed on the situation rather than the whole prompt, so a repeat isn't missed just
+        # because the chat history moved on; the calendar version keeps schedule answers fresh
+        cache_key = f"{situation}\n{context_str}\n{user_message}"
+        version = self.calendar_version()
+        cached = await self.cache.get(cache_key, version=version)
+        if cached is not None:
+            return cached
+
         try:
-            response = self.model.generate_content(prompt)
-            return response.text.strip()
+            if self.speech is not None and self.config.STREAM_LLM_SPEECH:
+                reply, complete = await self._stream_to_speech(prompt)
+            else:
+                reply, complete = await self.llm.generate(prompt), True
+            if complete:
+                await self.cache.put(cache_key, reply, version=version)
+            return reply
         except Exception as e:
             print(f"Error generating dynamic response: {e}")
             # Fallback to a basic response
             return "I'm here to help! Let me know what you'd like to do with your calendar. 😊"
     
+    async def _stream_to_speech(self, prompt: str):
+        """Generate with streaming, handing each finished sentence to the speech pipeline.
+        Returns the reply and whether the stream completed."""
+        speech = self.speech
+        segmenter = SentenceSegmenter()
+        parts = []
+        complete = True
+        try:
+            async for chunk in self.llm.stream(prompt):
+                parts.append(chunk)
+                for sentence in segmenter.feed(chunk):
+                    speech.say(sentence)
+        except Exception as e:
+            if not parts:
+                raise
+            # Part of the reply is already being spoken; finish with what we have
+            print(f"Response stream ended early: {e}")
+            complete = False
+        for sentence in segmenter.flush():
+            speech.say(sentence)
+        return ''.join(parts).strip(), complete
+
     def clear_history(self):
         """Clear the conversation history"""
-        self.chat_history = []
+        self.memory.clear()
         print("🔄 Chat history cleared!")
     
     def get_history_summary(self) -> str:
@@ -604,9 +620,19 @@ class ConversationHandler:
         for i, entry in enumerate(self.chat_history, 1):
             role_emoji = "👤" if entry['role'] == 'user' else "🤖"
             summary += f"{i}. {role_emoji} {entry['role']}: {entry['message'][:50]}{'...' if len(entry['message']) > 50 else ''}\n"
+        if self.memory.summary:
+            summary += f"Earlier: {self.memory.summary}\n"
         
         return summary
 
+    def get_cache_summary(self) -> str:
+        """LLM cache metrics for debugging"""
+        stats = self.cache.stats()
+        return (f"LLM cache: {stats['entries']} entries, {stats['hits']} hits, "
+                f"{stats['semantic_hits']} paraphrase hits, {stats['misses']} misses, "
+                f"{stats['evictions']} evictions (hit rate {stats['hit_rate']:.0%}); "
+                f"speculation: {self.speculation.confirmed} used, {self.speculation.discarded} discarded")
+
 
 
 
@@ -0,0 +1,114 @@
+import asyncio
+from datetime import datetime
+from typing import Any, Awaitable, Callable, Dict, List, Optional
+from services.prompts import estimate_tokens, fit_to_budget
+
+# Import our tracing system
+from config.logger import logger
+
+class ConversationMemory:
+    """Conversation context for LLM prompts, bounded by a token budget.
+
+    The most recent messages are kept verbatim. Older ones are folded into a running
+    summary by a background task, so the turn that pushed them out never waits on
+    it; until the summary catches up they are still shown verbatim. The pending
+    request's details ("facts so far") are kept separately from the chat and are
+    always included, so a multi-step meeting request doesn't depend on the wording of
+    turns long gone.
+    """
+
+    def __init__(self, summarize: Optional[Callable[[str, List[str]], Awaitable[str]]] = None,
+                 recent_messages: int = 8, summary_tokens: int = 150):
+        self.summarize = summarize  # (summary so far, older lines) -> new summary
+        self.recent_messages = recent_messages
+        self.summary_tokens = summary_tokens
+        self.messages: List[Dict[str, str]] = []  # recent, verbatim
+        self.summary = ''
+        self.facts: Dict[str, Any] = {}
+        self._unsummarized: List[str] = []  # pushed out of the recent window, not yet in the summary
+        self._task: Optional[asyncio.Task] = None
+
+    def add(self, role: str, message: str):
+        self.messages.append({'role': role, 'message': message, 'timestamp': datetime.now().isoformat()})
+        while len(self.messages) > self.recent_messages:
+            self._unsummarized.append(self._line(self.messages.pop(0)))
+        # Summarize a user/assistant pair at a time rather than every message
+        if len(self._unsummarized) >= 2:
+            self._schedule_summary()
+        # Without a working summarizer, keep no more than another window's worth
+        del self._unsummarized[:-self.recent_messages]
+
+    def set_facts(self, pending: Optional[Dict[str, Any]]):
+        """Mirror the pending action (main's pending_context) as facts; empty clears them"""
+        pending = pending or {}
+        facts = {}
+        if pending.get('action'):
+            facts['pending_action'] = pending['action']
+        for key, value in (pending.get('data') or {}).items():
+            if value not in (None, '', [], {}):
+                facts[key] = value
+        missing = (pending.get('context') or {}).get('missing_fields')
+        if missing:
+            facts['still_missing'] = missing
+        self.facts = facts
+
+    def render(self, token_budget: Optional[int] = None) -> str:
+        """Facts, summary and recent messages, newest messages dropped last when over budget"""
+        if not (self.messages or self.summary or self._unsummarized or self.facts):
+            return "No previous conversation history."
+
+        sections = []
+        if self.facts:
+            facts = '; '.join(f"{key}: {self._format(value)}" for key, value in self.facts.items())
+            sections.append(f"Facts so far: {facts}")
+        if self.summary:
+            sections.append(f"Earlier in the conversation: {self.summary}")
+        header = "Recent conversation history:"
+        lines = self._unsummarized + [self._line(entry) for entry in self.messages]
+        if token_budget is not None:
+            used = sum(estimate_tokens(section) + 1 for section in sections) + estimate_tokens(header)
+            lines = fit_to_budget(lines, token_budget - used)
+        return "\n".join(sections + [header] + lines)
+
+    def clear(self):
+        if self._task is not None:
+            self._task.cancel()
+            self._task = None
+        self.messages = []
+        self.summary = ''
+        self.facts = {}
+        self._unsummarized = []
+
+    def _schedule_summary(self):
+        if self.summarize is None or (self._task is not None and not self._task.done()):
+            return  # a running task picks up the new lines before it finishes
+        try:
+            self._task = asyncio.get_running_loop().create_task(self._summarize_unsummarized())
+        except RuntimeError:
+            pass  # no event loop; tried again on the next message
+
+    async def _summarize_unsummarized(self):
+        while len(self._unsummarized) >= 2:
+            batch = list(self._unsummarized)
+            try:
+                summary = await self.summarize(self.summary, batch)
+            except Exception as e:
+                logger.warning(f"Conversation summary update failed: {e}")
+                return
+            self.summary = ' '.join(summary.split())[:self.summary_tokens * 4]
+            # Lines added while we waited are still there for the next round
+            if self._unsummarized[:len(batch)] == batch:
+                del self._unsummarized[:len(batch)]
+            else:
+                self._unsummarized = [line for line in self._unsummarized if line not in batch]
+
+    @staticmethod
+    def _line(entry: Dict[str, str]) -> str:
+        role_label = "User" if entry['role'] == 'user' else "Assistant"
+        return f"{role_label}: {entry['message']}"
+
+    @staticmethod
+    def _format(value: Any) -> str:
+        if isinstance(value, (list, tuple)):
+            return ', '.join(str(item) for item in value)
+        return str(value)
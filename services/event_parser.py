@@ -0,0 +1,122 @@
+from array import array
+from datetime import datetime, timedelta
+from typing import Any, Dict, Iterable, Iterator, List, Optional
+from models.meeting import Meeting
+
+_EPOCH = datetime(1970, 1, 1)
+
+class EventBatch:
+    """Columnar view over parsed Google Calendar events.
+
+    Start/end times are kept as UTC epoch-second arrays alongside an id/title table;
+    Meeting objects are only built (and then cached) when something asks for them.
+    """
+
+    def __init__(self, parser: 'EventParser'):
+        self._parser = parser
+        self.starts = array('d')
+        self.ends = array('d')
+        self.ids: List[str] = []
+        self.titles: List[str] = []
+        self.raw_events: List[Dict[str, Any]] = []
+        self._meetings: Dict[int, Meeting] = {}
+
+    def __len__(self) -> int:
+        return len(self.ids)
+
+    def __iter__(self) -> Iterator[Meeting]:
+        for i in range(len(self.ids)):
+            yield self.meeting(i)
+
+    def meeting(self, i: int) -> Meeting:
+        """Build (once) the Meeting for row i"""
+        meeting = self._meetings.get(i)
+        if meeting is None:
+            event = self.raw_events[i]
+            meeting = Meeting(
+                title=self.titles[i],
+                start_time=self._parser.to_datetime(self.starts[i]),
+                end_time=self._parser.to_datetime(self.ends[i]),
+                description=event.get('description', ''),
+                attendees=[attendee.get('email', '') for attendee in event.get('attendees', [])],
+                location=event.get('location', ''),
+                event_id=self.ids[i],  # Store the Google Calendar event ID
+                etag=event.get('etag')
+            )
+            self._meetings[i] = meeting
+        return meeting
+
+    def to_meetings(self) -> List[Meeting]:
+        return list(self)
+
+class EventParser:
+    """One-pass converter from raw Calendar API events to an EventBatch.
+
+    Parsed UTC offsets and all-day date conversions are cached, so a month view pays
+    for each distinct offset/date once instead of once per event.
+    """
+
+    def __init__(self, timezone):
+        self.timezone = timezone
+        self._offsets: Dict[str, float] = {}  # "Z" / "+05:30" -> offset in seconds
+        self._all_day: Dict[str, float] = {}  # "2025-06-20" -> epoch of local midnight
+
+    def parse(self, events: Iterable[Dict[str, Any]], batch: Optional[EventBatch] = None) -> EventBatch:
+        """Append events to batch (a new one by default), skipping any that can't be parsed"""
+        if batch is None:
+            batch = EventBatch(self)
+        for event in events:
+            try:
+                start = self._to_epoch(event['start'])
+                end = self._to_epoch(event['end'])
+            except Exception as e:
+                print(f"Error parsing event: {e}")
+                continue
+            batch.starts.append(start)
+            batch.ends.append(end)
+            batch.ids.append(event.get('id', ''))
+            batch.titles.append(event.get('summary', 'No Title'))
+            batch.raw_events.append(event)
+        return batch
+
+    def to_datetime(self, epoch: float) -> datetime:
+        """Epoch seconds -> aware datetime in the configured timezone"""
+        return datetime.fromtimestamp(epoch, self.timezone)
+
+    def rfc3339_epoch(self, value: str) -> float:
+        """Epoch seconds for an RFC3339 timestamp such as a free/busy interval bound"""
+        return self._datetime_epoch(value)
+
+    def _to_epoch(self, value: Dict[str, str]) -> float:
+        if 'dateTime' in value:
+            return self._datetime_epoch(value['dateTime'])
+        return self._date_epoch(value['date'])
+
+    def _datetime_epoch(self, value: str) -> float:
+        # RFC3339: YYYY-MM-DDTHH:MM:SS[.fff](Z|+HH:MM|-HH:MM)
+        if value.endswith('Z'):
+            body, suffix = value[:-1], 'Z'
+        elif len(value) > 6 and value[-6] in '+-' and value[-3] == ':':
+            body, suffix = value[:-6], value[-6:]
+        else:
+            # No offset at all - treat as wall time in the configured timezone
+            return self.timezone.localize(datetime.fromisoformat(value)).timestamp()
+
+        offset = self._offsets.get(suffix)
+        if offset is None:
+            if suffix == 'Z':
+                offset = 0.0
+            else:
+                sign = -1 if suffix[0] == '-' else 1
+                offset = sign * (int(suffix[1:3]) * 3600 + int(suffix[4:6]) * 60)
+            self._offsets[suffix] = offset
+
+        return (datetime.fromisoformat(body) - _EPOCH) / timedelta(seconds=1) - offset
+
+    def _date_epoch(self, value: str) -> float:
+        # All-day events start at local midnight
+        epoch = self._all_day.get(value)
+        if epoch is None:
+            epoch = self.timezone.localize(datetime.fromisoformat(value)).timestamp()
+            self._all_day[value] = epoch
+        return epoch
@@ -0,0 +1,109 @@
+import heapq
+import math
+import re
+from collections import Counter, defaultdict
+from typing import Callable, Dict, List, Optional, Tuple
+
+# Spoken/transcribed variants that should index identically
+_SYNONYMS = {
+    'q1': 'quarter one', 'q2': 'quarter two', 'q3': 'quarter three', 'q4': 'quarter four',
+    '1st': 'first', '2nd': 'second', '3rd': 'third', '4th': 'fourth',
+    '&': 'and', 'mtg': 'meeting', 'sync-up': 'sync', 'syncup': 'sync',
+    '1:1': 'one on one', '1on1': 'one on one', '1-1': 'one on one',
+}
+_NUMBER_WORDS = ['zero', 'one', 'two', 'three', 'four', 'five', 'six', 'seven', 'eight', 'nine', 'ten',
+                 'eleven', 'twelve']
+
+_WORD_PATTERN = re.compile(r'[a-z0-9:&-]+')
+
+class FuzzyMeetingSearch:
+    """Ranked fuzzy title search: a character-trigram index scored with BM25.
+
+    Titles are normalised (synonyms, number words) and compacted without spaces before
+    trigramming, so "stand up" finds "Standup" and "Q3 review" finds "Quarter three review".
+    Documents are added and removed incrementally as the event store changes.
+    """
+
+    K1 = 1.2
+    B = 0.75
+
+    def __init__(self):
+        self._postings: Dict[str, Dict[str, int]] = defaultdict(dict)  # trigram -> {doc id: tf}
+        self._doc_trigrams: Dict[str, Counter] = {}
+        self._doc_lengths: Dict[str, int] = {}
+        self._total_length = 0
+
+    def __len__(self) -> int:
+        return len(self._doc_trigrams)
+
+    @staticmethod
+    def normalize(text: str) -> str:
+        words = []
+        for word in _WORD_PATTERN.findall(text.lower()):
+            word = _SYNONYMS.get(word, word)
+            if word.isdigit() and int(word) < len(_NUMBER_WORDS):
+                word = _NUMBER_WORDS[int(word)]
+            words.append(re.sub(r'[^a-z0-9 ]', '', word))
+        return ''.join(words).replace(' ', '')
+
+    @classmethod
+    def trigrams(cls, text: str) -> Counter:
+        compact = cls.normalize(text)
+        if not compact:
+            return Counter()
+        padded = f"  {compact} "
+        return Counter(padded[i:i + 3] for i in range(len(padded) - 2))
+
+    def add(self, doc_id: str, text: str):
+        self.remove(doc_id)
+        grams = self.trigrams(text)
+        if not grams:
+            return
+        for gram, tf in grams.items():
+            self._postings[gram][doc_id] = tf
+        self._doc_trigrams[doc_id] = grams
+        self._doc_lengths[doc_id] = sum(grams.values())
+        self._total_length += self._doc_lengths[doc_id]
+
+    def remove(self, doc_id: str):
+        grams = self._doc_trigrams.pop(doc_id, None)
+        if grams is None:
+            return
+        for gram in grams:
+            docs = self._postings.get(gram)
+            if docs is not None:
+                docs.pop(doc_id, None)
+                if not docs:
+                    del self._postings[gram]
+        self._total_length -= self._doc_lengths.pop(doc_id)
+
+    def search(self, query: str, k: int = 5, min_score: float = 0.0,
+               accept: Optional[Callable[[str], bool]] = None) -> List[Tuple[str, float]]:
+        """Top-k (doc id, score) pairs; scores are normalised so an exact match scores 1.0"""
+        query_grams = self.trigrams(query)
+        if not query_grams or not self._doc_trigrams:
+            return []
+
+        doc_count = len(self._doc_trigrams)
+        avg_length = self._total_length / doc_count
+        query_length = sum(query_grams.values())
+        scores: Dict[str, float] = defaultdict(float)
+        best_possible = 0.0
+
+        for gram, query_tf in query_grams.items():
+            docs = self._postings.get(gram)
+            df = len(docs) if docs else 0
+            idf = math.log(1 + (doc_count - df + 0.5) / (df + 0.5))
+            best_possible += idf * self._saturate(query_tf, query_length, avg_length)
+            if not docs:
+                continue
+            for doc_id, tf in docs.items():
+                scores[doc_id] += idf * self._saturate(min(tf, query_tf), self._doc_lengths[doc_id], avg_length)
+
+        ranked = ((min(score / best_possible, 1.0), doc_id) for doc_id, score in scores.items()
+                  if accept is None or accept(doc_id))
+        top = heapq.nlargest(k, (item for item in ranked if item[0] >= min_score))
+        return [(doc_id, score) for score, doc_id in top]
+
+    def _saturate(self, tf: int, doc_length: int, avg_length: float) -> float:
+        return tf * (self.K1 + 1) / (tf + self.K1 * (1 - self.B + self.B * doc_length / avg_length))
@@ -0,0 +1,139 @@
+import re
+from datetime import datetime
+from typing import Any, Dict, Optional
+from config.settings import Config
+from services.temporal_parser import TemporalParser, DATE_RANGE_RE, RELATIVE_DAY_RE, WEEKDAY_RE, CALENDAR_DATE_RE, DAYS_AHEAD_RE, ORDINAL_DAY_RE
+
+# Import our tracing system
+from config.logger import trace_function, logger
+
+CONFIRM_RE = re.compile(r"^(?:yes|yeah|yep|yup|sure|ok|okay|confirm(?:ed)?|go ahead|do it|sounds good|that works)"
+                        r"(?:,? (?:please|thanks|thank you))?[.!]*$")
+GREETING_RE = re.compile(r"^(?:hi|hello|hey|good (?:morning|afternoon|evening))(?: there)?[.!]*$")
+HELP_RE = re.compile(r"^(?:help|what can you do|how does this work|what can i ask)\??$")
+VIEW_RE = re.compile(r"\b(?:show|view|list|check|read|what'?s|what is|what do i have|anything)\b.*"
+                     r"\b(?:schedule|calendar|agenda|meetings|events|on for)\b"
+                     r"|^what do i have\b|^(?:my |today'?s |tomorrow'?s )?(?:schedule|calendar|agenda)\b")
+# What a view request may say besides its date words ("what's on my calendar", "show me my schedule for")
+VIEW_PHRASE_RE = re.compile(r"(?: can you| please)?(?: show| view| list| check| read| what'?s| what is| what does| what do i have| anything| do i have anything)?"
+                            r"(?: me)?(?: on| for)?(?: my| the)?(?: 's)?(?: schedule| calendar| agenda| meetings| events)?"
+                            r"(?: look like| like)?(?: on| for)?(?: please)?")
+# "cancel everything tomorrow", "delete my 2 meetings on friday" - several meetings, not one identifier
+QUANTIFIER_RE = re.compile(r"\b(?:all|everything|every|each|both|any|(?:\d+|two|three|four|five|six) (?:meetings|events|calls))\b")
+AVAILABILITY_RE = re.compile(r"\b(?:am i|are we|will i be) (?:free|available|busy)\b"
+                             r"|\bdo i have (?:anything|something|a meeting|any meetings)\b")
+DELETE_RE = re.compile(r"^(?:please )?(?:cancel|delete|remove)\s+(?:my |the )?(?P<target>.*?)(?: meeting)?[.!]*$")
+# Requests that need more than pattern matching (new meetings, rescheduling, references to earlier turns)
+DEFER_RE = re.compile(r"\b(?:schedule (?:a|an|the|my)|book|set up|add|create|move|reschedule|push|postpone|"
+                      r"every|with|that|it|this one|them)\b")
+
+class IntentRouter:
+    """Pattern-based intent classification for short, unambiguous requests.
+
+    Confirmations, greetings, help, "what's on my calendar tomorrow", "am I free at 3pm"
+    and "cancel my 3pm" are recognised with precompiled patterns and TemporalParser,
+    producing the same result dict as the LLM classifier. Anything the rules are not
+    confident about (route() returns None) is left to Gemini.
+    """
+
+    def __init__(self, temporal_parser: Optional[TemporalParser] = None, min_confidence: Optional[float] = None):
+        self.config = Config()
+        self.temporal = temporal_parser or TemporalParser()
+        self.min_confidence = min_confidence if min_confidence is not None else self.config.INTENT_ROUTER_MIN_CONFIDENCE
+
+    @trace_function
+    def route(self, user_input: str, context: Optional[Dict[str, Any]] = None, now: Optional[datetime] = None) -> Optional[Dict[str, Any]]:
+        """Classification result for user_input, or None when the LLM should decide"""
+        text = ' '.join(user_input.lower().strip().split())
+        if not text:
+            return None
+        now = now or datetime.now(self.temporal.timezone)
+
+        result = self._classify(text, context or {}, now)
+        if result is None or result['confidence'] < self.min_confidence:
+            return None
+        logger.debug(f"Intent routed locally: {result['intent']} ({result['confidence']:.2f})")
+        return result
+
+    def _classify(self, text: str, context: Dict[str, Any], now: datetime) -> Optional[Dict[str, Any]]:
+        if CONFIRM_RE.match(text):
+            # Without a pending action a bare "yes" means nothing to us; let the LLM use the history
+            if not context:
+                return None
+            return self._result('CONFIRMATION', 0.95, {}, "Got it! Let me proceed with that for you.")
+        if GREETING_RE.match(text):
+            return self._result('GREETING', 0.95, {}, "Hey there! How can I help with your calendar today? 😊")
+        if HELP_RE.match(text):
+            return self._result('HELP', 0.95, {}, "")
+
+        # Follow-ups to a pending request depend on the conversation so far
+        if context or DEFER_RE.search(text):
+            return None
+
+        if AVAILABILITY_RE.search(text):
+            return self._availability(text, now)
+        match = DELETE_RE.match(text)
+        if match:
+            return self._delete(text, match.group('target'), now)
+        if VIEW_RE.search(text):
+            return self._view(text, now)
+        return None
+
+    def _view(self, text: str, now: datetime) -> Optional[Dict[str, Any]]:
+        # Everything but the date words has to be a schedule phrase ("...capital of france on my calendar" isn't)
+        rest = self._without_dates(text).strip(' ?.!')
+        if not VIEW_PHRASE_RE.fullmatch(' ' + ' '.join(rest.split())):
+            return None
+        when = self.temporal.parse(text, now.date())
+        data = {}
+        if when.date_range:
+            data['date_range'] = when.date_range
+        elif when.date is not None:
+            data['query_date'] = when.date.strftime('%Y-%m-%d')
+        elif re.search(r'\d', text):
+            return None  # a date we could not read
+        return self._result('VIEW_CALENDAR', 0.9, data, "Sure thing! Let me show you what's on your calendar.")
+
+    def _availability(self, text: str, now: datetime) -> Optional[Dict[str, Any]]:
+        data = self.temporal.fields(text, now.date())
+        if 'start_datetime' not in data or data['start_datetime'].endswith('T00:00:00'):
+            return None  # no clock time to check
+        data.pop('query_date', None)
+        return self._result('CHECK_AVAILABILITY', 0.9, data, "Let me check that time for you.")
+
+    def _delete(self, text: str, target: str, now: datetime) -> Optional[Dict[str, Any]]:
+        data = {}
+        day = self.temporal.parse(text, now.date()).date
+        if day is not None:
+            data['query_date'] = day.strftime('%Y-%m-%d')
+        if QUANTIFIER_RE.search(target):
+            # A whole-day cancel lists that day's meetings; without a day, let the LLM work it out
+            if day is None:
+                return None
+            return self._result('DELETE_MEETING', 0.9, data, "No problem! Let me find those meetings for you.")
+        # Whatever is left after removing the date words identifies the meeting ("3pm", "standup")
+        identifier = self._without_dates(target)
+        identifier = re.sub(r"'s\b|\b(?:on|for|at)\b", '', identifier)
+        identifier = re.sub(r'\b(?:meetings?|all)\b', '', identifier).strip(" .,!'")
+        if identifier:
+            data['meeting_identifier'] = ' '.join(identifier.split())
+        elif day is None:
+            return None
+        return self._result('DELETE_MEETING', 0.9, data, "No problem! Let me find that meeting for you.")
+
+    @staticmethod
+    def _without_dates(text: str) -> str:
+        for pattern in (DATE_RANGE_RE, DAYS_AHEAD_RE, RELATIVE_DAY_RE, WEEKDAY_RE, CALENDAR_DATE_RE, ORDINAL_DAY_RE):
+            text = pattern.sub('', text)
+        return text
+
+    @staticmethod
+    def _result(intent: str, confidence: float, data: Dict[str, Any], response: str) -> Dict[str, Any]:
+        return {
+            'intent': intent,
+            'confidence': confidence,
+            'extracted_data': data,
+            'missing_fields': [],
+            'context_understood': False,
+            'response': response,
+        }
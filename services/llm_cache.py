@@ -0,0 +1,144 @@
+import copy
+import hashlib
+import re
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Any, Awaitable, Callable, Dict, Hashable, List, Optional
+import numpy as np
+
+# Import our tracing system
+from config.logger import logger
+
+# The wall-clock line of a prompt changes every minute without changing the answer
+CLOCK_LINE_RE = re.compile(r'(current (?:date/)?time:[^\n]*?)\d{1,2}:\d{2}', re.IGNORECASE)
+NUMBER_RE = re.compile(r'\d+')
+
+@dataclass
+class CacheEntry:
+    value: Any
+    created_at: float
+    version: Hashable
+    scope: Optional[str] = None
+    embedding: Optional[np.ndarray] = None
+    numbers: tuple = ()  # digits in the input text; paraphrases must agree on them
+
+class LLMCache:
+    """LRU cache for LLM results with TTL and version-based invalidation.
+
+    Entries are keyed by a hash of the normalized prompt (case, whitespace and the current
+    time line ignored). An entry is only returned while it is younger than the TTL and was
+    stored under the same version (e.g. the calendar version), so answers derived from older
+    calendar data are never reused. With an embedding function, a miss can also be answered by an entry in
+    the same scope whose input text is a close paraphrase (cosine similarity >= threshold)
+    mentioning the same numbers, so "free at 3" never answers "free at 4".
+    """
+
+    def __init__(self, max_entries: int = 256, ttl_seconds: float = 300,
+                 embed: Optional[Callable[[str], Awaitable[List[float]]]] = None, similarity: float = 0.95):
+        self.max_entries = max_entries
+        self.ttl_seconds = ttl_seconds
+        self.embed = embed
+        self.similarity = similarity
+        self._entries: "OrderedDict[str, CacheEntry]" = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.semantic_hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self._last_embedding = (None, None)  # a miss embeds the text, and put() then reuses it
+
+    @staticmethod
+    def normalize(text: str) -> str:
+        return ' '.join(CLOCK_LINE_RE.sub(r'\1', text).lower().split())
+
+    @classmethod
+    def key(cls, prompt: str) -> str:
+        return hashlib.sha256(cls.normalize(prompt).encode('utf-8')).hexdigest()
+
+    async def get(self, prompt: str, version: Hashable = None, scope: Optional[str] = None,
+                  text: Optional[str] = None) -> Optional[Any]:
+        """Cached value for prompt, or for a paraphrase of text within scope; None on a miss"""
+        key = self.key(prompt)
+        now = time.time()
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and self._valid(entry, version, now):
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return copy.deepcopy(entry.value)
+
+        if self.embed is not None and text and scope is not None:
+            entry = await self._similar(text, version, scope, now)
+            if entry is not None:
+                self.semantic_hits += 1
+                return copy.deepcopy(entry.value)
+
+        self.misses += 1
+        return None
+
+    async def put(self, prompt: str, value: Any, version: Hashable = None, scope: Optional[str] = None,
+                  text: Optional[str] = None):
+        embedding = None
+        if self.embed is not None and text and scope is not None:
+            embedding = await self._embedding(text)
+        entry = CacheEntry(copy.deepcopy(value), time.time(), version, scope, embedding,
+                           tuple(NUMBER_RE.findall(text or '')))
+        with self._lock:
+            self._entries[self.key(prompt)] = entry
+            self._entries.move_to_end(self.key(prompt))
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+                self.evictions += 1
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+
+    def stats(self) -> Dict[str, Any]:
+        lookups = self.hits + self.semantic_hits + self.misses
+        return {
+            'entries': len(self._entries),
+            'hits': self.hits,
+            'semantic_hits': self.semantic_hits,
+            'misses': self.misses,
+            'evictions': self.evictions,
+            'hit_rate': (self.hits + self.semantic_hits) / lookups if lookups else 0.0,
+        }
+
+    def _valid(self, entry: CacheEntry, version: Hashable, now: float) -> bool:
+        return entry.version == version and now - entry.created_at < self.ttl_seconds
+
+    async def _similar(self, text: str, version: Hashable, scope: str, now: float) -> Optional[CacheEntry]:
+        numbers = tuple(NUMBER_RE.findall(text))
+        with self._lock:
+            candidates = [entry for entry in self._entries.values()
+                          if entry.scope == scope and entry.embedding is not None and entry.numbers == numbers
+                          and self._valid(entry, version, now)]
+        if not candidates:
+            return None
+        query = await self._embedding(text)
+        if query is None:
+            return None
+        matrix = np.stack([entry.embedding for entry in candidates])
+        scores = matrix @ query
+        best = int(np.argmax(scores))
+        if scores[best] < self.similarity:
+            return None
+        logger.debug(f"Semantic cache hit ({scores[best]:.3f}) for '{text}'")
+        return candidates[best]
+
+    async def _embedding(self, text: str) -> Optional[np.ndarray]:
+        text = ' '.join(text.lower().split())
+        if self._last_embedding[0] == text:
+            return self._last_embedding[1]
+        try:
+            vector = np.asarray(await self.embed(text), dtype=np.float32)
+        except Exception as e:
+            logger.warning(f"Embedding failed, skipping semantic cache: {e}")
+            return None
+        norm = np.linalg.norm(vector)
+        vector = vector / norm if norm else None
+        self._last_embedding = (text, vector)
+        return vector
@@ -0,0 +1,76 @@
+import asyncio
+import functools
+import json
+from typing import Any, AsyncIterator, List, Optional
+import google.generativeai as genai
+from config.settings import Config
+
+# Import our tracing system
+from config.logger import logger
+
+class LLMClient:
+    """Non-blocking access to the Gemini model.
+
+    Requests use the SDK's native generate_content_async (falling back to a worker thread
+    on SDKs without it) and are bounded by LLM_TIMEOUT_SECONDS; a timed-out or cancelled
+    call cancels the underlying request instead of leaving the event loop waiting on it.
+    """
+
+    def __init__(self, model_name: Optional[str] = None, timeout: Optional[float] = None,
+                 system_instruction: Optional[str] = None):
+        self.config = Config()
+        genai.configure(api_key=self.config.GEMINI_API_KEY)
+        # Static instructions go in once here instead of being resent inside every prompt
+        self.model = genai.GenerativeModel(model_name or self.config.GEMINI_MODEL,
+                                           system_instruction=system_instruction)
+        self.timeout = timeout or self.config.LLM_TIMEOUT_SECONDS
+
+    async def generate_content(self, prompt: Any, timeout: Optional[float] = None, **kwargs):
+        """Raw SDK response for prompt; raises asyncio.TimeoutError after the timeout"""
+        if hasattr(self.model, 'generate_content_async'):
+            call = self.model.generate_content_async(prompt, **kwargs)
+        else:
+            loop = asyncio.get_running_loop()
+            call = loop.run_in_executor(None, functools.partial(self.model.generate_content, prompt, **kwargs))
+        try:
+            return await asyncio.wait_for(call, timeout or self.timeout)
+        except asyncio.TimeoutError:
+            logger.warning(f"Gemini call timed out after {timeout or self.timeout}s")
+            raise
+
+    async def generate(self, prompt: Any, timeout: Optional[float] = None, **kwargs) -> str:
+        """Response text for prompt, stripped"""
+        response = await self.generate_content(prompt, timeout, **kwargs)
+        return response.text.strip()
+
+    async def generate_json(self, prompt: Any, schema: dict, timeout: Optional[float] = None) -> Any:
+        """Parsed response for prompt, constrained by Gemini to JSON matching schema"""
+        text = await self.generate(prompt, timeout, generation_config={
+            'response_mime_type': 'application/json',
+            'response_schema': schema,
+        })
+        return json.loads(text)
+
+    async def embed(self, text: str, timeout: Optional[float] = None) -> List[float]:
+        """Embedding vector for text (used to match paraphrased requests)"""
+        loop = asyncio.get_running_loop()
+        call = loop.run_in_executor(None, functools.partial(
+            genai.embed_content, model=self.config.LLM_EMBEDDING_MODEL, content=text))
+        result = await asyncio.wait_for(call, timeout or self.timeout)
+        return result['embedding']
+
+    async def stream(self, prompt: Any, timeout: Optional[float] = None, **kwargs) -> AsyncIterator[str]:
+        """Response text in chunks as Gemini produces it; the timeout applies to each wait"""
+        timeout = timeout or self.timeout
+        if not hasattr(self.model, 'generate_content_async'):
+            yield await self.generate(prompt, timeout, **kwargs)
+            return
+        response = await asyncio.wait_for(self.model.generate_content_async(prompt, stream=True, **kwargs), timeout)
+        chunks = response.__aiter__()
+        while True:
+            try:
+                chunk = await asyncio.wait_for(chunks.__anext__(), timeout)
+            except StopAsyncIteration:
+                return
+            if chunk.text:
+                yield chunk.text
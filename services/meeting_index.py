@@ -0,0 +1,267 @@
+import re
+import threading
+import time
+from bisect import bisect_left
+from collections import defaultdict
+from datetime import datetime
+from typing import Dict, Iterable, List, Optional, Set, Tuple
+from models.meeting import Meeting
+from services.fuzzy_search import FuzzyMeetingSearch
+
+# Words that carry no identifying information in "cancel my meeting with ..." style requests
+STOP_WORDS = {'a', 'an', 'the', 'my', 'our', 'with', 'at', 'on', 'for', 'to', 'of', 'in', 'and', 'call', 'meeting'}
+
+_TOKEN_PATTERN = re.compile(r'[a-z0-9]+')
+
+class MeetingIndex:
+    """In-memory lookup index over the cached calendar events.
+
+    Holds token postings for titles and descriptions, an attendee -> events map and an
+    hour-of-day bucket index, plus the time ranges it has been filled for, so lookups
+    can be answered without a network fetch while the cached range is fresh.
+    """
+
+    def __init__(self, timezone):
+        self.timezone = timezone
+        self._lock = threading.RLock()  # the async client touches the index from worker threads
+        self._meetings: Dict[str, Meeting] = {}
+        self._starts: Dict[str, float] = {}
+        self._ends: Dict[str, float] = {}
+        self._title_postings: Dict[str, Set[str]] = defaultdict(set)
+        self._description_postings: Dict[str, Set[str]] = defaultdict(set)
+        self._attendee_postings: Dict[str, Set[str]] = defaultdict(set)
+        self._hour_buckets: Dict[int, Set[str]] = defaultdict(set)
+        self._doc_keys: Dict[str, Tuple[Set[str], Set[str], Set[str], int]] = {}
+        self._vocabulary: Optional[List[str]] = None  # sorted title tokens, rebuilt lazily
+        self._coverage: List[List[float]] = []  # sorted, non-overlapping [start_epoch, end_epoch, indexed_at]
+        self.fuzzy = FuzzyMeetingSearch()  # ranked title search, maintained alongside the postings
+        self.version = 0  # bumped whenever the indexed meetings change
+
+    def __len__(self) -> int:
+        return len(self._meetings)
+
+    @staticmethod
+    def tokenize(text: Optional[str]) -> List[str]:
+        return _TOKEN_PATTERN.findall(text.lower()) if text else []
+
+    def to_epoch(self, value: datetime) -> float:
+        if value.tzinfo is None:
+            value = self.timezone.localize(value)
+        return value.timestamp()
+
+    def add(self, meeting: Meeting):
+        """Insert or replace a meeting (meetings without an event id can't be indexed)"""
+        if not meeting.event_id:
+            return
+        with self._lock:
+            if self._meetings.get(meeting.event_id) == meeting:
+                return
+            self.remove(meeting.event_id)
+            event_id = meeting.event_id
+            title_tokens = set(self.tokenize(meeting.title))
+            description_tokens = set(self.tokenize(meeting.description))
+            attendees = {attendee.lower() for attendee in (meeting.attendees or []) if attendee}
+            start_time = meeting.start_time
+            if start_time.tzinfo is not None:
+                start_time = start_time.astimezone(self.timezone)
+            hour = start_time.hour
+
+            self._meetings[event_id] = meeting
+            self._starts[event_id] = self.to_epoch(meeting.start_time)
+            self._ends[event_id] = self.to_epoch(meeting.end_time)
+            for token in title_tokens:
+                self._title_postings[token].add(event_id)
+            for token in description_tokens:
+                self._description_postings[token].add(event_id)
+            for attendee in attendees:
+                self._attendee_postings[attendee].add(event_id)
+            self._hour_buckets[hour].add(event_id)
+            self._doc_keys[event_id] = (title_tokens, description_tokens, attendees, hour)
+            self.fuzzy.add(event_id, meeting.title)
+            self._vocabulary = None
+            self.version += 1
+
+    def remove(self, event_id: str):
+        with self._lock:
+            keys = self._doc_keys.pop(event_id, None)
+            if keys is None:
+                return
+            title_tokens, description_tokens, attendees, hour = keys
+            for postings, terms in ((self._title_postings, title_tokens),
+                                    (self._description_postings, description_tokens),
+                                    (self._attendee_postings, attendees),
+                                    (self._hour_buckets, (hour,))):
+                for term in terms:
+                    ids = postings.get(term)
+                    if ids is not None:
+                        ids.discard(event_id)
+                        if not ids:
+                            del postings[term]
+            del self._meetings[event_id]
+            del self._starts[event_id]
+            del self._ends[event_id]
+            self.fuzzy.remove(event_id)
+            self._vocabulary = None
+            self.version += 1
+
+    def get(self, event_id: str) -> Optional[Meeting]:
+        return self._meetings.get(event_id)
+
+    def replace_range(self, start: datetime, end: datetime, meetings: Iterable[Meeting],
+                      indexed_at: Optional[float] = None):
+        """Make the index hold exactly `meetings` for events overlapping [start, end) and mark
+        that range as indexed at `indexed_at` (now by default)"""
+        start_epoch, end_epoch = self.to_epoch(start), self.to_epoch(end)
+        meetings = [meeting for meeting in meetings if meeting.event_id]
+        current = {meeting.event_id for meeting in meetings}
+        with self._lock:
+            # Unchanged meetings are left alone so that version only moves on real changes
+            stale = [event_id for event_id in self._starts
+                     if self._starts[event_id] < end_epoch and self._ends[event_id] > start_epoch
+                     and event_id not in current]
+            for event_id in stale:
+                self.remove(event_id)
+            for meeting in meetings:
+                self.add(meeting)
+            self._mark_covered(start_epoch, end_epoch, indexed_at if indexed_at is not None else time.time())
+    
+    def touch(self, start: datetime, end: datetime):
+        """Mark [start, end) as fresh after its contents were reconciled in place"""
+        with self._lock:
+            self._mark_covered(self.to_epoch(start), self.to_epoch(end), time.time())
+
+    def covers(self, start: datetime, end: datetime, max_age: Optional[float] = None) -> bool:
+        """Whether [start, end) was fully indexed (within the last max_age seconds, if given)"""
+        start_epoch, end_epoch = self.to_epoch(start), self.to_epoch(end)
+        oldest = time.time() - max_age if max_age is not None else float('-inf')
+        position = start_epoch
+        with self._lock:
+            # Walk the adjoining pieces from start to end; every one of them has to be fresh
+            for covered_start, covered_end, indexed_at in self._coverage:
+                if covered_end <= position:
+                    continue
+                if covered_start > position or indexed_at < oldest:
+                    return False
+                position = covered_end
+                if position >= end_epoch:
+                    return True
+        return False
+
+    def invalidate(self):
+        """Forget which ranges are fresh; the indexed meetings stay until replaced"""
+        with self._lock:
+            self._coverage = []
+
+    def _mark_covered(self, start_epoch: float, end_epoch: float, indexed_at: float):
+        # The new range takes its own timestamp; only the parts of older ranges outside it
+        # keep theirs, so a refresh is never aged by the range it overlaps
+        pieces = [[start_epoch, end_epoch, indexed_at]]
+        for covered_start, covered_end, covered_at in self._coverage:
+            if covered_start < start_epoch:
+                pieces.append([covered_start, min(covered_end, start_epoch), covered_at])
+            if covered_end > end_epoch:
+                pieces.append([max(covered_start, end_epoch), covered_end, covered_at])
+        pieces.sort()
+        coverage = []
+        for piece in pieces:
+            if coverage and coverage[-1][1] >= piece[0] and coverage[-1][2] == piece[2]:
+                coverage[-1][1] = max(coverage[-1][1], piece[1])  # adjoining, equally fresh
+            else:
+                coverage.append(piece)
+        self._coverage = coverage
+
+    def _title_ids(self, token: str) -> Set[str]:
+        """Ids of meetings with a title word starting with token"""
+        if self._vocabulary is None:
+            self._vocabulary = sorted(self._title_postings)
+        ids = set()
+        i = bisect_left(self._vocabulary, token)
+        while i < len(self._vocabulary) and self._vocabulary[i].startswith(token):
+            ids |= self._title_postings[self._vocabulary[i]]
+            i += 1
+        return ids
+
+    def _text_ids(self, text: str, include_description: bool) -> Optional[Set[str]]:
+        tokens = self.tokenize(text)
+        significant = [token for token in tokens if token not in STOP_WORDS] or tokens
+        if not significant:
+            return None
+        result = None
+        for token in significant:
+            ids = self._title_ids(token)
+            if include_description:
+                ids |= self._description_postings.get(token, set())
+            result = ids if result is None else result & ids
+            if not result:
+                break
+        return result
+
+    def query(self, text: Optional[str] = None, emails: Optional[Iterable[str]] = None,
+              times: Optional[Iterable[Tuple[int, Optional[int]]]] = None,
+              start: Optional[datetime] = None, end: Optional[datetime] = None,
+              match_all: bool = False, include_description: bool = False,
+              overlapping: bool = False) -> List[Meeting]:
+        """Find meetings by title words, attendee email and/or start time (hour, minute or None).
+
+        With match_all=False a meeting matching any of the given filters is returned, otherwise
+        it must match all of them. The [start, end) window always applies - to the start time,
+        or with overlapping=True to any overlap, like the events().list API. Results are
+        ordered by start time.
+        """
+        with self._lock:
+            filters = []
+            if text:
+                ids = self._text_ids(text, include_description)
+                if ids is not None:
+                    filters.append(ids)
+            if emails:
+                ids = set()
+                for email in emails:
+                    ids |= self._attendee_postings.get(email.lower(), set())
+                filters.append(ids)
+            if times:
+                ids = set()
+                for hour, minute in times:
+                    for event_id in self._hour_buckets.get(hour, ()):
+                        if minute is None or self._local_minute(event_id) == minute:
+                            ids.add(event_id)
+                filters.append(ids)
+
+            if not filters:
+                candidates = set(self._meetings)
+            elif match_all:
+                candidates = set.intersection(*filters)
+            else:
+                candidates = set.union(*filters)
+
+            start_epoch = self.to_epoch(start) if start else float('-inf')
+            end_epoch = self.to_epoch(end) if end else float('inf')
+            if overlapping:
+                matches = [event_id for event_id in candidates
+                           if self._starts[event_id] < end_epoch and self._ends[event_id] > start_epoch]
+            else:
+                matches = [event_id for event_id in candidates if start_epoch <= self._starts[event_id] < end_epoch]
+            matches.sort(key=self._starts.__getitem__)
+            return [self._meetings[event_id] for event_id in matches]
+
+    def busy_intervals(self, start: datetime, end: datetime) -> List[Tuple[float, float]]:
+        """Sorted (start_epoch, end_epoch) of indexed events overlapping [start, end)"""
+        start_epoch, end_epoch = self.to_epoch(start), self.to_epoch(end)
+        with self._lock:
+            return sorted((self._starts[event_id], self._ends[event_id]) for event_id in self._starts
+                          if self._starts[event_id] < end_epoch and self._ends[event_id] > start_epoch)
+
+    def search_similar(self, text: str, start: Optional[datetime] = None, end: Optional[datetime] = None,
+                       k: int = 5, min_score: float = 0.0) -> List[Tuple[Meeting, float]]:
+        """Best fuzzy title matches for text within [start, end), with scores in [0, 1]"""
+        start_epoch = self.to_epoch(start) if start else float('-inf')
+        end_epoch = self.to_epoch(end) if end else float('inf')
+        with self._lock:
+            ranked = self.fuzzy.search(
+                text, k=k, min_score=min_score,
+                accept=lambda event_id: start_epoch <= self._starts[event_id] < end_epoch
+            )
+            return [(self._meetings[event_id], score) for event_id, score in ranked]
+
+    def _local_minute(self, event_id: str) -> int:
+        return datetime.fromtimestamp(self._starts[event_id], self.timezone).minute
@@ -0,0 +1,315 @@
+import random
+from datetime import datetime
+from typing import Any, Callable, Dict, List, Optional
+
+# Import our tracing system
+from config.logger import logger
+
+# Situation passed to generate_dynamic_response -> template pool. Situations not listed
+# here (open-ended ones that depend on what the user said) are answered by the LLM.
+SITUATIONS = {
+    "User requested to clear conversation history and it was successfully cleared": 'history_cleared',
+    "User requested to view schedule but no meetings found": 'schedule_empty',
+    "Showing user their schedule with meetings": 'schedule',
+    "Error occurred while trying to retrieve schedule": 'error',
+    "User wants to schedule a meeting but some required information is missing": 'missing_info',
+    "User confirmed they want to schedule meeting but still missing required information": 'missing_info',
+    "User provided some information but still missing required fields for meeting scheduling": 'missing_info',
+    "Meeting was successfully scheduled": 'scheduled',
+    "Meeting successfully scheduled after user confirmation": 'scheduled',
+    "Meeting successfully scheduled after user provided missing information": 'scheduled',
+    "Requested meeting time conflicts with existing schedule, offering alternatives": 'conflict',
+    "Still conflict after confirmation, offering new alternative times": 'conflict',
+    "Meeting scheduling conflict detected after user provided information, offering alternatives": 'conflict',
+    "User confirmed they want to schedule meeting despite conflict, but need to specify which alternative time": 'pick_alternative',
+    "Failed to schedule meeting": 'schedule_failed',
+    "Failed to schedule meeting even after user confirmation": 'schedule_failed',
+    "Failed to schedule meeting after user provided all required information": 'schedule_failed',
+    "Error occurred while trying to schedule meeting": 'error',
+    "User wants to cancel meetings on a specific date but no meetings exist on that date": 'cancel_day_empty',
+    "User wants to cancel meetings on a specific date, showing actual meetings that exist": 'cancel_day',
+    "User wants to cancel a meeting but didn't specify which one or when": 'which_to_cancel',
+    "User provided information but still need meeting identifier for deletion": 'which_to_cancel',
+    "No exact matches found but found similar meetings, asking user to clarify": 'similar',
+    "No meetings found matching the user's description": 'no_match',
+    "No meetings found matching the provided information": 'no_match',
+    "Found specific meeting to delete, asking for user confirmation": 'confirm_delete',
+    "User confirmed they want to delete the suggested meeting, asking for final confirmation": 'confirm_delete',
+    "User selected specific meeting from list, asking for confirmation before deletion": 'confirm_delete',
+    "User selected specific meeting by name, asking for confirmation before deletion": 'confirm_delete',
+    "Found specific meeting to delete after user provided more information": 'confirm_delete',
+    "Multiple meetings found matching user's description, need clarification": 'multiple',
+    "Found multiple meetings matching the information, need user to specify which one": 'multiple',
+    "Error occurred while trying to cancel meeting": 'error',
+    "User wants to check availability but didn't specify when": 'availability_when',
+    "User checked availability and the time slot is free": 'available',
+    "User checked availability but there are conflicting meetings": 'busy',
+    "Error occurred while checking availability": 'error',
+    "All meetings successfully deleted for the specified date": 'bulk_deleted',
+    "Some meetings deleted successfully but some failed": 'bulk_partial',
+    "Failed to delete any meetings": 'bulk_failed',
+    "Meeting successfully deleted after user confirmation": 'deleted',
+    "Failed to delete meeting despite user confirmation": 'delete_failed',
+    "Error occurred while processing user confirmation": 'error',
+    "User wants to reschedule a meeting but didn't specify which meeting": 'which_to_reschedule',
+    "No meetings found matching the identifier for rescheduling": 'reschedule_no_match',
+    "Multiple meetings found for rescheduling, need user to specify which one": 'reschedule_multiple',
+    "Found meeting to reschedule but no new time specified": 'reschedule_when',
+    "Meeting successfully rescheduled": 'rescheduled',
+    "Failed to reschedule meeting": 'reschedule_failed',
+    "Error occurred while trying to reschedule meeting": 'error',
+    "User requested help or general information about the meeting scheduler": 'help',
+    "Error occurred while processing additional user information": 'error',
+}
+
+TEMPLATES = {
+    'history_cleared': [
+        "All clear! 🧹 I've wiped our conversation history, so we're starting fresh.",
+        "Done! Our conversation history is cleared. What would you like to do next?",
+    ],
+    'schedule_empty': [
+        "Your calendar is wide open for {date_requested}! 🎉 Nothing scheduled.",
+        "Good news: nothing on the books for {date_requested}. Enjoy the free time! ✨",
+        "Looks like {date_requested} is completely clear. 📅",
+    ],
+    'schedule': [
+        "Here's what you've got for {date_requested} ({events_count_text}):\n\n{events_list}",
+        "Here's your schedule for {date_requested}, {events_count_text} in total:\n\n{events_list}",
+    ],
+    'error': [
+        "Oops! Something went wrong while {activity}: {error}. Want to give it another try? 😊",
+        "Sorry, I hit a snag while {activity} ({error}). Mind trying again?",
+    ],
+    'scheduled': [
+        "Perfect! ✅ '{meeting_title}' is booked for {meeting_time}{with_attendees}. You're all set!",
+        "Done! ✅ I've scheduled '{meeting_title}' for {meeting_time}{with_attendees}.",
+        "All set! 🎉 '{meeting_title}' is on your calendar for {meeting_time}{with_attendees}.",
+    ],
+    'conflict': [
+        "Ah, that time's already taken for '{meeting_title}' 😅 but these slots are open:\n\n{alternatives_list}\n\nWhich one works for you?",
+        "Looks like there's a clash at that time. Here are some free slots for '{meeting_title}':\n\n{alternatives_list}\n\nJust pick one!",
+    ],
+    'pick_alternative': [
+        "Sure! Which of these times should I use for '{meeting_title}'?\n\n{alternatives_list}",
+        "No problem! Just tell me which slot you'd like for '{meeting_title}':\n\n{alternatives_list}",
+    ],
+    'schedule_failed': [
+        "Hmm, I couldn't schedule '{meeting_title}'. {error_message} Want to try a different time? 🤔",
+        "Sorry, '{meeting_title}' didn't go through. {error_message} Shall we try again?",
+    ],
+    'cancel_day_empty': [
+        "There's nothing on your calendar for {query_date}, so nothing to cancel! 🎉",
+        "Good news: {query_date} is already clear, so there's nothing to cancel.",
+    ],
+    'cancel_day': [
+        "Here's what's on {query_date}:\n\n{meetings_list}\n\nShould I cancel all {events_count_text}, or just one of them?",
+        "You have {events_count_text} on {query_date}:\n\n{meetings_list}\n\nWant me to clear them all, or tell me which one to cancel.",
+    ],
+    'which_to_cancel': [
+        "Sure! Which meeting should I cancel? Tell me its title or when it is. 🔍",
+        "No problem! Which meeting would you like to remove? A title or time works.",
+    ],
+    'similar': [
+        "I couldn't find an exact match for '{search_term}', but these look close:\n\n{similar_list}\n\nIs it one of these?",
+        "No exact match for '{search_term}', but I found these:\n\n{similar_list}\n\nWhich one did you mean?",
+    ],
+    'no_match': [
+        "Hmm, I couldn't find a meeting matching '{search_term}'{on_date}. Could you give me the title or time? 🔍",
+        "I didn't find anything matching '{search_term}'{on_date}. Maybe try the meeting title or when it's scheduled?",
+    ],
+    'confirm_delete': [
+        "Found it! '{meeting_title}' at {meeting_time}{with_attendees}. Should I go ahead and cancel it?",
+        "I've got '{meeting_title}' at {meeting_time}{with_attendees}. Want me to remove it?",
+    ],
+    'multiple': [
+        "I found a few meetings that could be it:\n\n{meetings_list}\n\nWhich one do you mean?",
+        "A few meetings match that:\n\n{meetings_list}\n\nJust tell me which one!",
+    ],
+    'availability_when': [
+        "Happy to check! What day and time should I look at? ⏰",
+        "Sure! When would you like me to check, like 'tomorrow at 3pm'?",
+    ],
+    'available': [
+        "Great news! You're free from {start_time} to {end_time} on {date}. ✨",
+        "You're all clear from {start_time} to {end_time} on {date}! 🎉",
+    ],
+    'busy': [
+        "You've got {conflict_count_text} between {start_time} and {end_time} on {date}:\n\n{conflicts_list}\n\nWant me to check another time?",
+        "That time's taken. On {date} between {start_time} and {end_time} you have:\n\n{conflicts_list}\n\nShall I look for another slot?",
+    ],
+    'bulk_deleted': [
+        "Done! ✅ Cleared {deleted_count_text} from {date}.",
+        "All gone! ✅ I've cancelled {deleted_count_text} on {date}.",
+    ],
+    'bulk_partial': [
+        "I cancelled {deleted_count_text} on {date}, but couldn't remove: {failed_meetings_text}. Want me to try those again?",
+    ],
+    'bulk_failed': [
+        "Sorry, I couldn't cancel any meetings on {date} ({failed_meetings_text}). Want me to try again?",
+    ],
+    'deleted': [
+        "Done! ✅ '{meeting_title}' at {meeting_time} has been cancelled. One less thing to worry about!",
+        "All set! ✅ I've removed '{meeting_title}' at {meeting_time} from your calendar.",
+    ],
+    'delete_failed': [
+        "Hmm, I couldn't cancel '{meeting_title}' at {meeting_time}. Want me to try again?",
+    ],
+    'which_to_reschedule': [
+        "Sure! Which meeting would you like to move? Give me its title or time. 🔄",
+        "Happy to reschedule! Which meeting is it?",
+    ],
+    'reschedule_no_match': [
+        "I couldn't find a meeting matching '{search_term}' to reschedule. Could you give me the title or time? 🔍",
+    ],
+    'reschedule_multiple': [
+        "I found a few meetings matching '{search_term}':\n\n{meetings_list}\n\nWhich one should I move?",
+    ],
+    'reschedule_when': [
+        "Got it! '{meeting_title}' is currently at {current_time}. When would you like to move it to? ⏰",
+        "'{meeting_title}' is at {current_time} right now. What time works better?",
+    ],
+    'rescheduled': [
+        "Done! ✅ '{meeting_title}' moved from {old_time} to {new_time}.",
+        "All set! 🔄 '{meeting_title}' is now at {new_time} (was {old_time}).",
+    ],
+    'reschedule_failed': [
+        "Hmm, I couldn't move '{meeting_title}' to {requested_time}. Want to try another time? 🤔",
+    ],
+    'help': [
+        "I'm your calendar sidekick! 📅 Here's what I can do:\n\n{features_list}\n\n"
+        "Try something like 'What's on my calendar tomorrow?' or 'Schedule a sync with alex@example.com Friday at 2pm for 30 minutes'.",
+    ],
+}
+
+# What the user was doing when an error situation occurred
+ACTIVITIES = {
+    "Error occurred while trying to retrieve schedule": "getting your schedule",
+    "Error occurred while trying to schedule meeting": "scheduling that meeting",
+    "Error occurred while trying to cancel meeting": "cancelling that meeting",
+    "Error occurred while checking availability": "checking your availability",
+    "Error occurred while processing user confirmation": "processing your confirmation",
+    "Error occurred while trying to reschedule meeting": "rescheduling that meeting",
+    "Error occurred while processing additional user information": "processing that information",
+}
+
+class ResponseRenderer:
+    """Renders bot replies for known situations from phrasing pools, without an LLM call.
+
+    Each situation maps to a pool of templates whose slots are filled from context_data
+    (lists of events/meetings/alternatives are formatted here). render() returns None for
+    situations it has no template for, and generate_dynamic_response then asks Gemini.
+    """
+
+    def __init__(self, missing_info_prompt: Optional[Callable[[List[str], Dict[str, Any]], str]] = None,
+                 seed: Optional[int] = None):
+        self.missing_info_prompt = missing_info_prompt
+        self._random = random.Random(seed)
+        self._last_choice: Dict[str, int] = {}
+
+    def can_render(self, situation: str) -> bool:
+        return situation in SITUATIONS
+
+    def render(self, situation: str, context_data: Optional[Dict[str, Any]] = None) -> Optional[str]:
+        key = SITUATIONS.get(situation)
+        if key is None:
+            return None
+        context_data = context_data or {}
+        if key == 'missing_info' and self.missing_info_prompt:
+            return self.missing_info_prompt(context_data.get('missing_fields', []), context_data.get('current_data', {}))
+        try:
+            return self._choose(key).format_map(self._slots(situation, context_data))
+        except (KeyError, ValueError, TypeError) as e:
+            logger.warning(f"Could not render '{situation}' from template: {e}")
+            return None
+
+    def _choose(self, key: str) -> str:
+        pool = TEMPLATES[key]
+        # Don't use the same phrasing twice in a row
+        choices = [index for index in range(len(pool)) if index != self._last_choice.get(key)] or [0]
+        index = self._random.choice(choices)
+        self._last_choice[key] = index
+        return pool[index]
+
+    def _slots(self, situation: str, data: Dict[str, Any]) -> Dict[str, Any]:
+        slots = {key: value for key, value in data.items() if value is not None}
+        slots['activity'] = ACTIVITIES.get(situation, "doing that")
+        slots['meeting_title'] = data.get('meeting_title') or 'your meeting'
+        slots['meeting_time'] = self.format_time(data.get('meeting_time') or data.get('start_time')
+                                                 or data.get('requested_time') or 'the requested time')
+        for key in ('requested_time', 'new_time', 'old_time', 'current_time'):
+            if data.get(key):
+                slots[key] = self.format_time(data[key])
+        slots['with_attendees'] = self._with_attendees(data.get('attendees'))
+        slots['error_message'] = data.get('error_message') or ''
+        slots['on_date'] = f" on {self.format_time(data['search_date'])}" if data.get('search_date') else ''
+        slots['events_count_text'] = self._count(data.get('events_count', len(data.get('meetings') or [])), 'meeting')
+        slots['conflict_count_text'] = self._count(data.get('conflict_count', len(data.get('conflicts') or [])), 'meeting')
+        slots['deleted_count_text'] = self._count(data.get('deleted_count', 0), 'meeting')
+        slots['failed_meetings_text'] = ', '.join(f"'{title}'" for title in data.get('failed_meetings') or []) or 'unknown'
+        slots['events_list'] = '\n'.join(self.format_event(event) for event in data.get('events') or [])
+        slots['meetings_list'] = self._meeting_list(data.get('meetings') or data.get('matching_meetings') or [])
+        slots['similar_list'] = self._meeting_list(data.get('similar_meetings') or [])
+        slots['conflicts_list'] = self._meeting_list(data.get('conflicts') or [])
+        slots['alternatives_list'] = '\n'.join(f"• {slot}" for slot in data.get('alternative_times') or [])
+        slots['features_list'] = '\n'.join(f"• {feature}" for feature in data.get('available_features') or [])
+        return slots
+
+    @staticmethod
+    def format_event(event: Dict[str, Any]) -> str:
+        """One bullet line for an event dict (title, time, optional date and attendees)"""
+        title = event.get('title', 'No Title')
+        time = event.get('time', 'No Time')
+        if event.get('date'):
+            line = f"• {title} on {event['date']} from {time}"
+        else:
+            line = f"• {title} ({time})"
+        attendees = event.get('attendees') or []
+        if attendees:
+            attendees_str = ', '.join(attendees[:2])
+            if len(attendees) > 2:
+                attendees_str += f" +{len(attendees) - 2} more"
+            line += f" - with {attendees_str}"
+        return line
+
+    @staticmethod
+    def format_time(value: Any) -> str:
+        """Readable form of a datetime or ISO string; other strings are returned unchanged"""
+        if isinstance(value, str):
+            try:
+                value = datetime.fromisoformat(value.replace('Z', '+00:00'))
+            except ValueError:
+                return value
+        if isinstance(value, datetime):
+            if value.hour == 0 and value.minute == 0:
+                return value.strftime('%A, %B %d').replace(' 0', ' ')
+            return value.strftime('%I:%M %p on %A, %B %d').lstrip('0').replace(' 0', ' ')
+        return str(value)
+
+    def _meeting_list(self, meetings: List[Any]) -> str:
+        lines = []
+        for meeting in meetings:
+            if isinstance(meeting, dict):
+                prefix = f"{meeting['number']}. " if 'number' in meeting else "• "
+                line = f"{prefix}{meeting.get('title', 'Untitled')} - {meeting.get('time', '')}".rstrip(' -')
+                attendees = meeting.get('attendees') or []
+                if attendees:
+                    line += f" (with {', '.join(attendees[:2])})"
+                lines.append(line)
+            else:
+                lines.append(f"• {meeting}")
+        return '\n'.join(lines)
+
+    @staticmethod
+    def _with_attendees(attendees: Any) -> str:
+        if not attendees or not isinstance(attendees, list):
+            return ''
+        if len(attendees) == 1 and str(attendees[0]).lower() in ('me', 'just me', 'myself'):
+            return ''
+        names = ', '.join(str(attendee) for attendee in attendees[:3])
+        if len(attendees) > 3:
+            names += f" +{len(attendees) - 3} more"
+        return f" with {names}"
+
+    @staticmethod
+    def _count(count: int, noun: str) -> str:
+        return f"{count} {noun}{'s' if count != 1 else ''}"
@@ -0,0 +1,139 @@
+import heapq
+import time
+from collections import Counter
+from datetime import datetime, timedelta
+from typing import List, Optional
+import numpy as np
+from config.settings import Config
+from models.meeting import TimeSlot
+from models.scheduling import ScoredSlot, SlotRequest
+
+# Import our tracing system
+from config.logger import trace_function, logger
+
+class ScheduleOptimizer:
+    """Ranks candidate meeting slots under hard constraints and soft preferences.
+
+    Hard constraints (business hours, everyone's busy time padded by a buffer, a cap on
+    meetings per day) are applied on CalendarManager's minute availability grid. The
+    remaining starts are scored by distance to the preferred time, fragmentation of the
+    free time around them and preferred weekdays, with a day-by-day branch-and-bound
+    search that stops early once no remaining day can beat the current top-k, or when
+    the time budget runs out.
+    """
+
+    CLOSENESS_WEIGHT = 1.0  # per hour away from the preferred time
+    FRAGMENT_WEIGHT = 0.5  # per side that leaves an unusably short gap
+    OFF_DAY_PENALTY = 4.0  # for a weekday outside preferred_days
+    MIN_USEFUL_GAP_MINUTES = 30
+
+    def __init__(self, calendar_manager, time_budget_ms: Optional[float] = None):
+        self.calendar_manager = calendar_manager
+        self.config = Config()
+        self.time_budget_ms = time_budget_ms or self.config.OPTIMIZER_TIME_BUDGET_MS
+
+    @trace_function
+    def solve(self, request: SlotRequest, num_suggestions: int = 3) -> List[ScoredSlot]:
+        deadline = time.perf_counter() + self.time_budget_ms / 1000.0
+        manager = self.calendar_manager
+        engine = manager.slot_engine
+        timezone = manager.timezone
+
+        window_start = max(self._localize(request.window_start), datetime.now(timezone))
+        window_end = self._localize(request.window_end)
+        if window_start >= window_end or num_suggestions <= 0:
+            return []
+        preferred_epoch = self._localize(request.preferred_time or window_start).timestamp()
+        step = request.step_minutes or self.config.SLOT_STEP_MINUTES
+        duration_minutes = int(-(-request.duration.total_seconds() // 60))
+
+        # Hard constraints: busy time (with buffers) and business hours on the minute grid
+        busy = manager.get_busy_intervals(window_start, window_end, request.attendees,
+                                          self.config.PREFETCH_MAX_AGE_SECONDS)
+        buffer_seconds = request.buffer_minutes * 60
+        padded = [(start - buffer_seconds, end + buffer_seconds) for start, end in busy]
+        start_epoch, minutes = engine.window(window_start, window_end)
+        blocked = engine.occupancy(padded, start_epoch, minutes) | ~engine.open_mask(start_epoch, minutes)
+        offsets = engine.feasible_starts(blocked, duration_minutes, step, start_epoch)
+        if not len(offsets):
+            return []
+        starts = start_epoch + offsets * 60.0
+
+        midnights = self._local_midnights(start_epoch, minutes)
+        day_of = np.searchsorted(midnights, starts, side='right') - 1
+        fragments = self._fragment_counts(blocked, offsets, duration_minutes)
+        full_days = self._full_days(request, window_start, window_end, midnights)
+
+        # Branch and bound over days: a day's bound is its best possible closeness plus its day penalty
+        days = []
+        for day in np.unique(day_of):
+            if day in full_days:
+                continue
+            day_starts = starts[day_of == day]
+            weekday = datetime.fromtimestamp(midnights[day] + 43200, timezone).weekday()
+            penalty = self.OFF_DAY_PENALTY if request.preferred_days and weekday not in request.preferred_days else 0.0
+            nearest = np.clip(preferred_epoch, day_starts[0], day_starts[-1])
+            days.append((self.CLOSENESS_WEIGHT * abs(nearest - preferred_epoch) / 3600 + penalty, day, penalty))
+        days.sort()
+
+        best = []  # max-heap via negated scores: (-score, -start)
+        for bound, day, penalty in days:
+            if len(best) == num_suggestions and bound >= -best[0][0]:
+                break  # days are ordered by bound, so no later day can improve the top-k
+            indices = np.flatnonzero(day_of == day)
+            closeness = self.CLOSENESS_WEIGHT * np.abs(starts[indices] - preferred_epoch) / 3600
+            for position in np.argsort(closeness, kind='stable'):
+                lower = closeness[position] + penalty
+                if len(best) == num_suggestions and lower >= -best[0][0]:
+                    break
+                index = indices[position]
+                score = lower + self.FRAGMENT_WEIGHT * fragments[index]
+                item = (-score, -starts[index])
+                if len(best) < num_suggestions:
+                    heapq.heappush(best, item)
+                elif item > best[0]:
+                    heapq.heapreplace(best, item)
+            if time.perf_counter() > deadline:
+                logger.warning("Slot optimizer hit its time budget; returning the best slots found so far")
+                break
+
+        ranked = sorted((-score, -start) for score, start in best)
+        return [ScoredSlot(engine.to_slots([start], request.duration)[0], float(score)) for score, start in ranked]
+
+    def _localize(self, value: datetime) -> datetime:
+        return self.calendar_manager.timezone.localize(value) if value.tzinfo is None else value
+
+    def _local_midnights(self, start_epoch: float, minutes: int) -> np.ndarray:
+        timezone = self.calendar_manager.timezone
+        day = datetime.fromtimestamp(start_epoch, timezone).date()
+        last_day = datetime.fromtimestamp(start_epoch + minutes * 60, timezone).date()
+        midnights = []
+        while day <= last_day:
+            midnights.append(timezone.localize(datetime(day.year, day.month, day.day)).timestamp())
+            day += timedelta(days=1)
+        return np.asarray(midnights)
+
+    def _fragment_counts(self, blocked: np.ndarray, offsets: np.ndarray, duration_minutes: int) -> np.ndarray:
+        """Per start, how many sides leave a free gap shorter than MIN_USEFUL_GAP_MINUTES"""
+        minutes = len(blocked)
+        index = np.arange(minutes)
+        # Last blocked minute at or before i, and first blocked minute at or after i
+        previous_blocked = np.maximum.accumulate(np.where(blocked, index, -1))
+        next_blocked = np.minimum.accumulate(np.where(blocked, index, minutes)[::-1])[::-1]
+        before = offsets - (previous_blocked[np.maximum(offsets - 1, 0)] + 1)
+        before[offsets == 0] = 0
+        ends = offsets + duration_minutes
+        after = np.where(ends < minutes, next_blocked[np.minimum(ends, minutes - 1)] - ends, 0)
+        short = lambda gap: (gap > 0) & (gap < self.MIN_USEFUL_GAP_MINUTES)
+        return short(before).astype(np.int8) + short(after).astype(np.int8)
+
+    def _full_days(self, request: SlotRequest, window_start: datetime, window_end: datetime,
+                   midnights: np.ndarray) -> set:
+        """Indices of days that already hold max_meetings_per_day of the user's own meetings"""
+        if not request.max_meetings_per_day:
+            return set()
+        meetings = self.calendar_manager.get_events(window_start, window_end,
+                                                    max_age=self.config.PREFETCH_MAX_AGE_SECONDS)
+        epochs = np.asarray([self.calendar_manager.meeting_index.to_epoch(meeting.start_time) for meeting in meetings])
+        counts = Counter((np.searchsorted(midnights, epochs, side='right') - 1).tolist())
+        return {day for day, count in counts.items() if count >= request.max_meetings_per_day}
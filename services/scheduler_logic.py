@@ -1,7 +1,12 @@
+import heapq
+from bisect import bisect_left
 from datetime import datetime, timedelta
 from typing import List, Optional, Tuple
+import numpy as np
 from models.meeting import Meeting, TimeSlot
-from services.calendar_manager import CalendarManager
+from models.scheduling import ScoredSlot, SlotRequest
+from services.calendar_manager import CalendarManager, CalendarUnavailableError
+from services.schedule_optimizer import ScheduleOptimizer
 
 # Import our tracing system
 from config.logger import trace_function, logger
@@ -10,6 +15,7 @@ class SchedulerLogic:
     @trace_function
     def __init__(self, calendar_manager: CalendarManager):
         self.calendar_manager = calendar_manager
+        self.optimizer = ScheduleOptimizer(calendar_manager)
     
     @trace_function
     def schedule_meeting(self, meeting_data: dict) -> Tuple[bool, str, List[TimeSlot]]:
@@ -67,12 +73,15 @@ class SchedulerLogic:
                     return False, "Failed to create the meeting.", []
             else:
                 # Time slot is not available, find better alternatives
-                alternatives = self.find_nearby_available_slots(
-                    start_time, 
-                    timedelta(minutes=duration_minutes)
+                alternatives = self.suggest_optimal_meeting_times(
+                    start_time,
+                    timedelta(minutes=duration_minutes),
+                    attendees=meeting.attendees
                 )
                 return False, "Time slot is already booked.", alternatives
                 
+        except CalendarUnavailableError:
+            return False, "Couldn't check availability, so the meeting wasn't scheduled.", []
         except Exception as e:
             return False, f"Error scheduling single meeting: {str(e)}", []
     
@@ -101,11 +110,17 @@ class SchedulerLogic:
             if not meeting_dates:
                 return False, "Could not generate recurring meeting dates.", []
             
-            # Check availability for all dates
+            # Check availability for all dates against one busy-time snapshot
+            duration = timedelta(minutes=duration_minutes)
+            busy = self.calendar_manager.get_busy_intervals(min(meeting_dates), max(meeting_dates) + duration)
+            busy_starts = [start for start, _ in busy]
             conflicts = []
             for meeting_date in meeting_dates:
-                end_time = meeting_date + timedelta(minutes=duration_minutes)
-                if not self.calendar_manager.check_availability(meeting_date, end_time):
+                start_epoch = meeting_date.timestamp()
+                end_epoch = start_epoch + duration.total_seconds()
+                # Merged intervals are disjoint, so only the last one starting before the end can overlap
+                i = bisect_left(busy_starts, end_epoch) - 1
+                if i >= 0 and busy[i][1] > start_epoch:
                     conflicts.append(meeting_date)
             
             if conflicts:
@@ -113,25 +128,24 @@ class SchedulerLogic:
                 conflict_dates = [dt.strftime('%B %d, %Y at %I:%M %p') for dt in conflicts[:3]]
                 return False, f"Some meeting times conflict with existing events: {', '.join(conflict_dates)}", []
             
-            # All dates are available, create all meetings
-            created_count = 0
-            for i, meeting_date in enumerate(meeting_dates):
-                end_time = meeting_date + timedelta(minutes=duration_minutes)
-                
-                # Create individual meeting with original title (no occurrence number)
-                meeting = Meeting(
+            # All dates are available, create all meetings in one batched request
+            meetings = [
+                # Individual meeting with original title (no occurrence number)
+                Meeting(
                     title=title,
                     start_time=meeting_date,
-                    end_time=end_time,
+                    end_time=meeting_date + duration,
                     description=meeting_data.get('meeting_description', ''),
                     attendees=meeting_data.get('attendees', []),
                     location=meeting_data.get('location', '')
                 )
-                
-                if self.calendar_manager.create_event(meeting):
-                    created_count += 1
-                else:
+                for meeting_date in meeting_dates
+            ]
+            results = self.calendar_manager.create_events(meetings)
+            for meeting_date, created in zip(meeting_dates, results):
+                if not created:
                     print(f"Failed to create meeting for {meeting_date}")
+            created_count = sum(results)
             
             if created_count == len(meeting_dates):
                 return True, f"Successfully scheduled {created_count} recurring meetings!", []
@@ -143,6 +157,134 @@ class SchedulerLogic:
         except Exception as e:
             return False, f"Error scheduling recurring meeting: {str(e)}", []
     
+    @trace_function
+    def schedule_meetings(self, meeting_requests: List[dict]) -> Tuple[bool, str, List[Optional[Meeting]]]:
+        """
+        Jointly place many meetings without conflicts between them and create them in one batch.
+        Each request takes the schedule_meeting fields; start_datetime is the preferred time and the
+        meeting may move anywhere within BATCH_SEARCH_DAYS of that day. Returns success, a message
+        and the created meetings in request order (None where a meeting couldn't be placed or created).
+        """
+        try:
+            timezone = self.calendar_manager.timezone
+            engine = self.calendar_manager.slot_engine
+            step = self.calendar_manager.config.SLOT_STEP_MINUTES
+            now = datetime.now(timezone)
+            if not meeting_requests:
+                return True, "No meetings to schedule.", []
+            
+            specs = []
+            for data in meeting_requests:
+                preferred = datetime.fromisoformat(data.get('start_datetime'))
+                if preferred.tzinfo is None:
+                    preferred = timezone.localize(preferred)
+                day_start = preferred.replace(hour=0, minute=0, second=0, microsecond=0)
+                specs.append({
+                    'data': data,
+                    'preferred': preferred,
+                    'minutes': int(data.get('duration_minutes', 60)),
+                    'attendees': [email.lower() for email in data.get('attendees', []) if email],
+                    'window': (max(day_start, now),
+                               day_start + timedelta(days=self.calendar_manager.config.BATCH_SEARCH_DAYS)),
+                })
+            
+            # One shared availability snapshot on the minute grid
+            snapshot_start = min(spec['window'][0] for spec in specs)
+            snapshot_end = max(spec['window'][1] for spec in specs)
+            all_attendees = sorted({email for spec in specs for email in spec['attendees']})
+            busy = self.calendar_manager.get_busy_by_calendar(snapshot_start, snapshot_end, all_attendees)
+            start_epoch, minutes = engine.window(snapshot_start, snapshot_end)
+            own_blocked = ~engine.open_mask(start_epoch, minutes)
+            attendee_blocked = {}
+            for calendar_id, intervals in busy.items():
+                occupancy = engine.occupancy(intervals, start_epoch, minutes)
+                if calendar_id in all_attendees:
+                    attendee_blocked[calendar_id] = occupancy
+                else:
+                    own_blocked |= occupancy
+            for spec in specs:
+                lo = int((spec['window'][0].timestamp() - start_epoch) // 60)
+                spec['range'] = (max(lo, 0), min(int((spec['window'][1].timestamp() - start_epoch) // 60), minutes))
+                spec['preferred_offset'] = (spec['preferred'].timestamp() - start_epoch) / 60
+            
+            def candidates(spec, placements):
+                """Feasible start offsets for spec given the other placed meetings, closest first"""
+                blocked = own_blocked.copy()
+                for email in spec['attendees']:
+                    if email in attendee_blocked:
+                        blocked |= attendee_blocked[email]
+                for other, offset in placements.items():
+                    if other != spec['index']:
+                        blocked[offset:offset + specs[other]['minutes']] = True
+                lo, hi = spec['range']
+                if hi <= lo:
+                    return []
+                offsets = engine.feasible_starts(blocked[lo:hi], spec['minutes'], step, start_epoch + lo * 60) + lo
+                return sorted(offsets.tolist(), key=lambda offset: abs(offset - spec['preferred_offset']))
+            
+            # Greedy: most constrained meetings first, each at its best remaining start
+            for index, spec in enumerate(specs):
+                spec['index'] = index
+                spec['options'] = len(candidates(spec, {}))
+            placements = {}
+            unplaced = []
+            for spec in sorted(specs, key=lambda spec: spec['options']):
+                options = candidates(spec, placements)
+                if options:
+                    placements[spec['index']] = options[0]
+                else:
+                    unplaced.append(spec)
+            
+            # Repair: free a start for an unplaced meeting by moving one placed meeting elsewhere
+            for spec in unplaced:
+                for offset in candidates(spec, {}):
+                    end = offset + spec['minutes']
+                    blockers = [other for other, placed in placements.items()
+                                if placed < end and placed + specs[other]['minutes'] > offset]
+                    if len(blockers) != 1:
+                        continue
+                    blocker = blockers[0]
+                    trial = dict(placements)
+                    del trial[blocker]
+                    trial[spec['index']] = offset
+                    moved = candidates(specs[blocker], trial)
+                    if moved:
+                        trial[blocker] = moved[0]
+                        placements = trial
+                        break
+            
+            # Commit every placed meeting through one batched insert
+            order = sorted(placements)
+            meetings = []
+            for index in order:
+                data = specs[index]['data']
+                start_time = datetime.fromtimestamp(start_epoch + placements[index] * 60, timezone)
+                meetings.append(Meeting(
+                    title=data.get('meeting_title', 'Untitled Meeting'),
+                    start_time=start_time,
+                    end_time=start_time + timedelta(minutes=specs[index]['minutes']),
+                    description=data.get('meeting_description', ''),
+                    attendees=data.get('attendees', []),
+                    location=data.get('location', '')
+                ))
+            results = self.calendar_manager.create_events(meetings) if meetings else []
+            
+            scheduled: List[Optional[Meeting]] = [None] * len(specs)
+            for index, meeting, created in zip(order, meetings, results):
+                if created:
+                    scheduled[index] = meeting
+            created_count = sum(1 for meeting in scheduled if meeting)
+            
+            if created_count == len(specs):
+                return True, f"Successfully scheduled all {created_count} meetings!", scheduled
+            elif created_count > 0:
+                return True, f"Scheduled {created_count} out of {len(specs)} meetings.", scheduled
+            else:
+                return False, "Could not schedule any of the meetings.", scheduled
+                
+        except Exception as e:
+            return False, f"Error scheduling meetings: {str(e)}", []
+    
     @trace_function
     def _generate_recurring_dates(self, start_time: datetime, pattern: str, count: int, days: List[str]) -> List[datetime]:
         """Generate list of dates for recurring meetings"""
@@ -230,73 +372,47 @@ class SchedulerLogic:
     
     @trace_function
     def find_nearby_available_slots(self, preferred_time: datetime, 
-                                  duration: timedelta, num_suggestions: int = 3) -> List[TimeSlot]:
-        """Find available slots near the preferred time, checking same day first, then adjacent days"""
-        all_alternatives = []
-        
+                                  duration: timedelta, num_suggestions: int = 3,
+                                  attendees: Optional[List[str]] = None) -> List[TimeSlot]:
+        """Find slots near the preferred time that suit every attendee, searching the same day
+        and the adjacent days (never the past) in one go"""
         # Ensure preferred_time is timezone-aware
         if preferred_time.tzinfo is None:
             preferred_time = self.calendar_manager.timezone.localize(preferred_time)
         
-        # First, check the same day
-        same_day_slots = self.calendar_manager.find_available_slots(
-            preferred_time, duration, num_suggestions
-        )
-        
-        # Prioritize slots closer to the preferred time
-        for slot in same_day_slots:
-            time_diff = abs((slot.start_time - preferred_time).total_seconds())
-            all_alternatives.append((slot, time_diff))
-        
-        # If we need more suggestions, check the next day
-        if len(all_alternatives) < num_suggestions:
-            next_day = preferred_time + timedelta(days=1)
-            next_day_preferred = next_day.replace(hour=preferred_time.hour, minute=preferred_time.minute)
-            next_day_slots = self.calendar_manager.find_available_slots(
-                next_day_preferred, duration, num_suggestions - len(all_alternatives)
-            )
-            
-            for slot in next_day_slots:
-                time_diff = abs((slot.start_time - preferred_time).total_seconds())
-                all_alternatives.append((slot, time_diff))
-        
-        # If still need more, check the previous day
-        if len(all_alternatives) < num_suggestions:
-            prev_day = preferred_time - timedelta(days=1)
-            # Only suggest previous day if it's not in the past
-            current_date = datetime.now(self.calendar_manager.timezone).date()
-            if prev_day.date() >= current_date:
-                prev_day_preferred = prev_day.replace(hour=preferred_time.hour, minute=preferred_time.minute)
-                prev_day_slots = self.calendar_manager.find_available_slots(
-                    prev_day_preferred, duration, num_suggestions - len(all_alternatives)
-                )
-                
-                for slot in prev_day_slots:
-                    time_diff = abs((slot.start_time - preferred_time).total_seconds())
-                    all_alternatives.append((slot, time_diff))
-        
-        # Sort by time difference (closest first) and return top suggestions
-        all_alternatives.sort(key=lambda x: x[1])
-        return [slot for slot, _ in all_alternatives[:num_suggestions]]
+        day_start = preferred_time.replace(hour=0, minute=0, second=0, microsecond=0)
+        return self.find_best_slots(day_start - timedelta(days=1), day_start + timedelta(days=2),
+                                    duration, preferred_time, num_suggestions, attendees)
     
     @trace_function
     def find_next_available_slot(self, preferred_date: datetime, 
-                                duration: timedelta) -> Optional[TimeSlot]:
+                                duration: timedelta, attendees: Optional[List[str]] = None) -> Optional[TimeSlot]:
         """Find the next available slot on or after the preferred date"""
-        current_date = preferred_date.date()
-        
-        # Check up to 7 days ahead
-        for i in range(7):
-            check_date = datetime.combine(current_date + timedelta(days=i), 
-                                        datetime.min.time())
-            available_slots = self.calendar_manager.find_available_slots(
-                check_date, duration, num_suggestions=1
-            )
-            
-            if available_slots:
-                return available_slots[0]
+        day_start = datetime.combine(preferred_date.date(), datetime.min.time())
+        day_start = self.calendar_manager.timezone.localize(day_start)
         
-        return None
+        # Check up to 7 days ahead, with a single availability fetch
+        starts = self._slot_starts(day_start, day_start + timedelta(days=7), duration, attendees)
+        if not len(starts):
+            return None
+        return self.calendar_manager.slot_engine.to_slots([starts[0]], duration)[0]
+    
+    def find_best_slots(self, window_start: datetime, window_end: datetime, duration: timedelta,
+                        preferred_time: datetime, num_suggestions: int = 3,
+                        attendees: Optional[List[str]] = None) -> List[TimeSlot]:
+        """Top-k free slots in the window, closest to the preferred time first"""
+        starts = self._slot_starts(window_start, window_end, duration, attendees)
+        preferred_epoch = preferred_time.timestamp()
+        best = heapq.nsmallest(num_suggestions, starts.tolist(), key=lambda epoch: abs(epoch - preferred_epoch))
+        return self.calendar_manager.slot_engine.to_slots(best, duration)
+    
+    def _slot_starts(self, window_start: datetime, window_end: datetime, duration: timedelta,
+                     attendees: Optional[List[str]] = None):
+        # Never suggest times that have already passed
+        window_start = max(window_start, datetime.now(self.calendar_manager.timezone))
+        if window_start >= window_end:
+            return np.empty(0)
+        return self.calendar_manager.find_slot_starts(window_start, window_end, duration, attendees)
     
     @trace_function
     def detect_scheduling_conflicts(self, start_time: datetime, 
@@ -306,9 +422,28 @@ class SchedulerLogic:
     
     @trace_function
     def suggest_optimal_meeting_times(self, date: datetime, duration: timedelta,
-                                    num_suggestions: int = 3) -> List[TimeSlot]:
-        """Suggest optimal meeting times considering existing schedule"""
-        return self.calendar_manager.find_available_slots(date, duration, num_suggestions)
+                                    num_suggestions: int = 3, attendees: Optional[List[str]] = None,
+                                    preferred_days: Optional[List[int]] = None) -> List[TimeSlot]:
+        """Suggest optimal meeting times around `date` considering everyone's schedule,
+        buffers, daily meeting limits and preferred weekdays"""
+        if date.tzinfo is None:
+            date = self.calendar_manager.timezone.localize(date)
+        day_start = date.replace(hour=0, minute=0, second=0, microsecond=0)
+        request = SlotRequest(
+            duration=duration,
+            window_start=day_start - timedelta(days=1),
+            window_end=day_start + timedelta(days=2),
+            preferred_time=date,
+            attendees=attendees or [],
+            buffer_minutes=self.calendar_manager.config.MEETING_BUFFER_MINUTES,
+            max_meetings_per_day=self.calendar_manager.config.MAX_MEETINGS_PER_DAY or None,
+            preferred_days=preferred_days
+        )
+        return [scored.slot for scored in self.find_optimal_slots(request, num_suggestions)]
+    
+    def find_optimal_slots(self, request: SlotRequest, num_suggestions: int = 3) -> List[ScoredSlot]:
+        """Ranked slots satisfying the request's hard constraints, best first"""
+        return self.optimizer.solve(request, num_suggestions)
     
 
     
\ No newline at end of file
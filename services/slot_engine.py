@@ -0,0 +1,117 @@
+from datetime import datetime, timedelta
+from typing import Iterable, List, Optional, Sequence, Tuple
+import numpy as np
+from models.meeting import TimeSlot
+
+class SlotEngine:
+    """Minute-resolution availability grid for free-slot search.
+
+    Busy intervals (from any number of calendars) are rasterised into a boolean
+    occupancy array over the search window and combined with a business-hours mask;
+    feasible start times for a duration are then found with one vectorised
+    sliding-window sum, so multi-day, multi-calendar searches are plain array work.
+    """
+
+    def __init__(self, timezone, business_hours: Optional[Tuple[int, int]] = None,
+                 weekdays_only: bool = False):
+        self.timezone = timezone
+        self.business_hours = business_hours  # (start_hour, end_hour) in local time, or None for all day
+        self.weekdays_only = weekdays_only
+
+    def _localize(self, value: datetime) -> datetime:
+        return self.timezone.localize(value) if value.tzinfo is None else value
+
+    def window(self, start: datetime, end: datetime) -> Tuple[float, int]:
+        """Start epoch (floored to the minute) and length in minutes of [start, end)"""
+        start_epoch = self._localize(start).timestamp() // 60 * 60
+        minutes = max(0, int(-(-(self._localize(end).timestamp() - start_epoch) // 60)))
+        return start_epoch, minutes
+
+    def occupancy(self, busy: Iterable[Tuple[float, float]], start_epoch: float, minutes: int) -> np.ndarray:
+        """Boolean array, True for every minute of the window covered by a busy interval"""
+        intervals = np.asarray(list(busy), dtype=np.float64).reshape(-1, 2)
+        if not len(intervals):
+            return np.zeros(minutes, dtype=bool)
+        # Any minute an event touches counts as busy
+        starts = np.clip(np.floor((intervals[:, 0] - start_epoch) / 60), 0, minutes).astype(np.int64)
+        ends = np.clip(np.ceil((intervals[:, 1] - start_epoch) / 60), 0, minutes).astype(np.int64)
+        edges = np.zeros(minutes + 1, dtype=np.int32)
+        np.add.at(edges, starts, 1)
+        np.add.at(edges, ends, -1)
+        return np.cumsum(edges[:minutes]) > 0
+
+    def combined_occupancy(self, busy_streams: Sequence[Iterable[Tuple[float, float]]],
+                           start_epoch: float, minutes: int) -> np.ndarray:
+        """Occupancy for several calendars at once (busy if any of them is busy)"""
+        # Overlapping intervals just raise the count, so one raster over all streams suffices
+        return self.occupancy([interval for busy in busy_streams for interval in busy], start_epoch, minutes)
+
+    def open_mask(self, start_epoch: float, minutes: int) -> np.ndarray:
+        """True for minutes inside business hours (and on weekdays, if configured)"""
+        if self.business_hours is None and not self.weekdays_only:
+            return np.ones(minutes, dtype=bool)
+        mask = np.zeros(minutes, dtype=bool)
+        start_hour, end_hour = self.business_hours or (0, 24)
+        first_day = datetime.fromtimestamp(start_epoch, self.timezone).date() - timedelta(days=1)
+        last_day = datetime.fromtimestamp(start_epoch + minutes * 60, self.timezone).date()
+        day = first_day
+        while day <= last_day:
+            if not (self.weekdays_only and day.weekday() >= 5):
+                midnight = datetime(day.year, day.month, day.day)
+                # Localise each day separately so DST changes keep local business hours
+                open_at = self.timezone.localize(midnight + timedelta(hours=start_hour)).timestamp()
+                close_at = self.timezone.localize(midnight + timedelta(hours=end_hour)).timestamp()
+                lo = int(np.clip((open_at - start_epoch) // 60, 0, minutes))
+                hi = int(np.clip((close_at - start_epoch) // 60, 0, minutes))
+                mask[lo:hi] = True
+            day += timedelta(days=1)
+        return mask
+
+    def feasible_starts(self, blocked: np.ndarray, duration_minutes: int, step_minutes: int = 1,
+                        start_epoch: float = 0.0) -> np.ndarray:
+        """Minute offsets at which `duration_minutes` fits without touching a blocked minute.
+
+        Starts are restricted to multiples of step_minutes on the local clock (e.g. :00, :15, ...).
+        """
+        minutes = len(blocked)
+        if duration_minutes <= 0 or duration_minutes > minutes:
+            return np.empty(0, dtype=np.int64)
+        prefix = np.concatenate(([0], np.cumsum(blocked, dtype=np.int32)))
+        window_busy = prefix[duration_minutes:] - prefix[:-duration_minutes]
+        offsets = np.flatnonzero(window_busy == 0)
+        if step_minutes > 1 and len(offsets):
+            local_minute = self._local_minute_of_day(start_epoch)
+            offsets = offsets[(offsets + local_minute) % step_minutes == 0]
+        return offsets
+
+    def _local_minute_of_day(self, epoch: float) -> int:
+        local = datetime.fromtimestamp(epoch, self.timezone)
+        return local.hour * 60 + local.minute
+
+    def free_starts(self, busy_streams: Sequence[Iterable[Tuple[float, float]]], start: datetime, end: datetime,
+                    duration: timedelta, step_minutes: int = 15) -> np.ndarray:
+        """Epochs of every feasible start in [start, end) across all busy streams"""
+        start_epoch, minutes = self.window(start, end)
+        blocked = self.combined_occupancy(busy_streams, start_epoch, minutes) | ~self.open_mask(start_epoch, minutes)
+        duration_minutes = int(-(-duration.total_seconds() // 60))
+        offsets = self.feasible_starts(blocked, duration_minutes, step_minutes, start_epoch)
+        return start_epoch + offsets.astype(np.float64) * 60
+
+    @staticmethod
+    def spread(starts: np.ndarray, count: int, step_seconds: float) -> List[float]:
+        """Pick up to `count` starts, preferring the first start of each free run before
+        filling in later starts from the same runs, in time order"""
+        if not len(starts):
+            return []
+        run_heads = np.concatenate(([True], np.diff(starts) > step_seconds))
+        chosen = list(starts[run_heads][:count])
+        if len(chosen) < count:
+            chosen = sorted(chosen + list(starts[~run_heads][:count - len(chosen)]))
+        return [float(epoch) for epoch in chosen]
+
+    def to_slots(self, epochs: Iterable[float], duration: timedelta) -> List[TimeSlot]:
+        slots = []
+        for epoch in epochs:
+            start_time = datetime.fromtimestamp(epoch, self.timezone)
+            slots.append(TimeSlot(start_time, start_time + duration))
+        return slots
@@ -0,0 +1,96 @@
+import asyncio
+import copy
+import re
+from typing import Any, Awaitable, Callable, Dict, Optional
+
+# Import our tracing system
+from config.logger import logger
+
+class SpeculativeClassifier:
+    """Classifies partial transcripts while the user is still speaking.
+
+    on_partial() may be called from the recording thread; each new partial transcript
+    replaces (and cancels) the previous speculation. Once a classification is ready, its
+    prefetch (calendar range, likely reply audio) starts straight away. resolve() is
+    called with the final transcript: if it says the same thing as the speculated one,
+    the speculative result is used, otherwise the speculation is cancelled.
+    """
+
+    def __init__(self, classify: Callable[[str], Awaitable[Optional[Dict[str, Any]]]],
+                 prefetch: Optional[Callable[[str, Dict[str, Any]], Awaitable[None]]] = None, min_words: int = 2):
+        self.classify = classify  # transcript -> classification result
+        self.prefetch = prefetch  # (transcript, copy of its result) -> None
+        self.min_words = min_words
+        self.confirmed = 0
+        self.discarded = 0
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._key: Optional[str] = None
+        self._task: Optional[asyncio.Task] = None
+        self._prefetch_task: Optional[asyncio.Task] = None
+
+    def begin(self):
+        """Start a new utterance; must be called on the event loop"""
+        self.cancel()
+        self._loop = asyncio.get_running_loop()
+
+    def on_partial(self, text: str):
+        if self._loop is not None:
+            self._loop.call_soon_threadsafe(self._speculate, text)
+
+    async def resolve(self, final_text: str) -> Optional[Dict[str, Any]]:
+        """The speculative classification if it was for final_text, else None"""
+        task, key = self._task, self._key
+        self._task, self._key = None, None
+        if task is None:
+            return None
+        if key != self.normalize(final_text):
+            task.cancel()
+            self.cancel()  # and its prefetch
+            self.discarded += 1
+            return None
+        try:
+            result = await task
+        except Exception as e:
+            logger.warning(f"Speculative classification failed: {e}")
+            return None
+        if result is not None:
+            self.confirmed += 1
+            logger.debug(f"Using speculative classification for '{final_text}'")
+        return copy.deepcopy(result)
+
+    def cancel(self):
+        for task in (self._task, self._prefetch_task):
+            if task is not None:
+                task.cancel()
+        self._task, self._key, self._prefetch_task = None, None, None
+
+    @staticmethod
+    def normalize(text: str) -> str:
+        """Transcripts that differ only in case or punctuation mean the same thing"""
+        return ' '.join(re.sub(r"[^\w\s']", ' ', text.lower()).split())
+
+    def _speculate(self, text: str):
+        key = self.normalize(text)
+        if len(key.split()) < self.min_words or key == self._key:
+            return
+        if self._task is not None:
+            self._task.cancel()
+            self.discarded += 1
+        self._key = key
+        self._task = asyncio.create_task(self._run(text))
+
+    async def _run(self, text: str) -> Optional[Dict[str, Any]]:
+        result = await self.classify(text)
+        if result is not None and self.prefetch is not None:
+            if self._prefetch_task is not None:
+                self._prefetch_task.cancel()
+            self._prefetch_task = asyncio.create_task(self._prefetch(text, copy.deepcopy(result)))
+        return result
+
+    async def _prefetch(self, text: str, result: Dict[str, Any]):
+        try:
+            await self.prefetch(text, result)
+        except asyncio.CancelledError:
+            raise
+        except Exception as e:
+            logger.warning(f"Speculative prefetch failed: {e}")
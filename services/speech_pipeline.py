@@ -0,0 +1,106 @@
+import asyncio
+import re
+from typing import Awaitable, Callable, List, Optional
+
+# Import our tracing system
+from config.logger import logger
+
+# Words whose trailing period does not end a sentence
+ABBREVIATIONS = {'mr', 'mrs', 'ms', 'dr', 'prof', 'sr', 'jr', 'st', 'vs', 'etc', 'e.g', 'i.e', 'a.m', 'p.m', 'approx', 'min', 'mins', 'no'}
+BOUNDARY_RE = re.compile(r'[.!?]+["\')\]]*(?=\s)|\n+')
+MIN_SENTENCE_LENGTH = 3  # shorter fragments are merged into the next sentence
+
+class SentenceSegmenter:
+    """Splits text arriving in chunks into whole sentences as soon as each one is complete.
+
+    A sentence ends at ., ! or ? followed by whitespace (so "3.5" and "a.m." mid-stream
+    are not split) or at a line break (bullet lists); the text after the last boundary is
+    held back until more arrives or flush() is called.
+    """
+
+    def __init__(self):
+        self._buffer = ''
+
+    def feed(self, text: str) -> List[str]:
+        self._buffer += text
+        sentences = []
+        start = 0
+        for match in BOUNDARY_RE.finditer(self._buffer):
+            if match.group(0)[0] == '.' and self._is_abbreviation(self._buffer[start:match.start()]):
+                continue
+            sentence = self._buffer[start:match.end()].strip()
+            if len(sentence) < MIN_SENTENCE_LENGTH:
+                continue
+            sentences.append(sentence)
+            start = match.end()
+        self._buffer = self._buffer[start:]
+        return [sentence for sentence in sentences if any(char.isalnum() for char in sentence)]
+
+    def flush(self) -> List[str]:
+        rest, self._buffer = self._buffer.strip(), ''
+        return [rest] if any(char.isalnum() for char in rest) else []
+
+    @staticmethod
+    def _is_abbreviation(text: str) -> bool:
+        words = text.split()
+        return bool(words) and words[-1].lower().rstrip('.') in ABBREVIATIONS
+
+    @classmethod
+    def split(cls, text: str) -> List[str]:
+        segmenter = cls()
+        return segmenter.feed(text) + segmenter.flush()
+
+class SpeechPipeline:
+    """Speaks sentences in order while later ones are still being produced.
+
+    say() queues a sentence and returns immediately. One task synthesizes queued sentences
+    to audio files and another plays them, so the next sentence is synthesized while the
+    current one is playing and the first one is heard as soon as it is ready.
+    """
+
+    def __init__(self, synthesize: Callable[[str], Awaitable[Optional[str]]], play: Callable[[str], Awaitable[None]]):
+        self.synthesize = synthesize  # sentence -> audio file path, or None if synthesis failed
+        self.play = play
+        self.spoken = 0  # sentences queued so far
+        self._sentences: asyncio.Queue = asyncio.Queue()
+        self._audio: asyncio.Queue = asyncio.Queue()
+        self._tasks = [asyncio.create_task(self._synthesize_loop()), asyncio.create_task(self._play_loop())]
+
+    def say(self, sentence: str):
+        self.spoken += 1
+        self._sentences.put_nowait(sentence)
+
+    async def finish(self):
+        """Wait until everything queued has been played"""
+        self._sentences.put_nowait(None)
+        await asyncio.gather(*self._tasks, return_exceptions=True)
+
+    def cancel(self):
+        for task in self._tasks:
+            task.cancel()
+
+    async def _synthesize_loop(self):
+        try:
+            while True:
+                sentence = await self._sentences.get()
+                if sentence is None:
+                    break
+                try:
+                    path = await self.synthesize(sentence)
+                except Exception as e:
+                    logger.warning(f"TTS failed for '{sentence}': {e}")
+                    path = None
+                if path:
+                    self._audio.put_nowait(path)
+        finally:
+            self._audio.put_nowait(None)
+
+    async def _play_loop(self):
+        while True:
+            path = await self._audio.get()
+            if path is None:
+                break
+            try:
+                await self.play(path)
+            except Exception as e:
+                logger.warning(f"Audio playback failed for {path}: {e}")
@@ -0,0 +1,249 @@
+import functools
+import re
+from datetime import date, datetime, timedelta
+from typing import Any, Dict, Optional, Tuple
+import pytz
+from dateutil import parser as date_parser
+from dateutil.relativedelta import relativedelta, MO, TU, WE, TH, FR, SA, SU
+from config.settings import Config
+from models.scheduling import TemporalExpression
+
+# Import our tracing system
+from config.logger import logger
+
+WEEKDAYS = {
+    'monday': MO, 'tuesday': TU, 'wednesday': WE, 'thursday': TH,
+    'friday': FR, 'saturday': SA, 'sunday': SU,
+}
+TIMEZONES = {
+    'EST': 'US/Eastern', 'EDT': 'US/Eastern', 'EASTERN': 'US/Eastern',
+    'CST': 'US/Central', 'CDT': 'US/Central', 'CENTRAL': 'US/Central',
+    'MST': 'US/Mountain', 'MDT': 'US/Mountain', 'MOUNTAIN': 'US/Mountain',
+    'PST': 'US/Pacific', 'PDT': 'US/Pacific', 'PACIFIC': 'US/Pacific',
+    'UTC': 'UTC', 'GMT': 'GMT', 'BST': 'Europe/London', 'CET': 'Europe/Paris',
+    'CEST': 'Europe/Paris', 'IST': 'Asia/Kolkata', 'JST': 'Asia/Tokyo', 'AEST': 'Australia/Sydney',
+}
+NUMBER_WORDS = {'a': 1, 'an': 1, 'one': 1, 'two': 2, 'three': 3, 'four': 4, 'five': 5, 'six': 6,
+                'ten': 10, 'fifteen': 15, 'twenty': 20, 'thirty': 30, 'forty five': 45, 'ninety': 90}
+MONTHS = r'(?:jan(?:uary)?|feb(?:ruary)?|mar(?:ch)?|apr(?:il)?|may|june?|july?|aug(?:ust)?|sep(?:t(?:ember)?)?|oct(?:ober)?|nov(?:ember)?|dec(?:ember)?)'
+NUMBER = r'(?:\d+(?:\.\d+)?|an?|one|two|three|four|five|six|ten|fifteen|twenty|thirty|forty five|ninety)'
+
+DATE_RANGE_RE = re.compile(r"\b(this|next) week\b(?!'?s? ?(?:mon|tue|wed|thu|fri|sat|sun))")
+RELATIVE_DAY_RE = re.compile(r"\b(today|tonight|tomorrow|day after tomorrow|yesterday)\b")
+DAYS_AHEAD_RE = re.compile(r"\bin (\d+|a|one|two|three|four|five|six) days?\b|\b(\d+) days? from (?:now|today)\b")
+WEEKDAY_RE = re.compile(r"\b(?:(this|next|coming|on|every) )?(monday|tuesday|wednesday|thursday|friday|saturday|sunday)s?"
+                        r"(?P<next_week> next week)?\b")
+CALENDAR_DATE_RE = re.compile(rf"\b(?:\d{{1,2}}(?:st|nd|rd|th)?(?: of)? {MONTHS}|{MONTHS} \d{{1,2}}(?:st|nd|rd|th)?)(?:,? \d{{4}})?\b"
+                              r"|\b\d{4}-\d{2}-\d{2}\b|\b\d{1,2}/\d{1,2}(?:/\d{2,4})?\b")
+ORDINAL_DAY_RE = re.compile(r"\bthe (\d{1,2})(?:st|nd|rd|th)\b")
+TIME_RE = r"(?:\d{1,2}(?::\d{2})?\s*(?:am|pm|a\.m\.|p\.m\.)?|noon|midnight)"
+TIME_RANGE_RE = re.compile(rf"\b(?:from |between )?(?P<start>{TIME_RE})\s*(?:to|until|till|through|-|–|and)\s*(?P<end>{TIME_RE})(?!\w)")
+TIME_AT_RE = re.compile(rf"\b(?:at|@|around|by)\s*(?P<time>{TIME_RE})(?!\w)"
+                        r"|\b(?P<bare>\d{1,2}(?::\d{2})?\s*(?:am|pm|a\.m\.|p\.m\.)|\d{1,2}:\d{2}|noon|midnight)(?!\w)")
+CLOCK_RE = re.compile(r"(\d{1,2})(?::(\d{2}))?\s*(am|pm)?")
+DAY_PART_RE = re.compile(r"\b(?:in the (morning|afternoon|evening)|(tonight))\b")
+DURATION_RE = re.compile(rf"\b(?:for )?(?P<count>{NUMBER})[ -]?(?P<unit>hours?|hrs?|minutes?|mins?)(?P<half> and a half)?\b"
+                         r"|\b(?:for )?(?P<half_hour>half an hour)\b")
+TIMEZONE_RE = re.compile(r"\b(" + '|'.join(sorted(TIMEZONES, key=len, reverse=True)) + r")(?: (?:standard |daylight )?time)?\b",
+                         re.IGNORECASE)
+
+class TemporalParser:
+    """Resolves spoken date/time expressions without the LLM.
+
+    Handles relative days ("tomorrow", "in 3 days"), weekdays ("next friday"), calendar and
+    ordinal dates ("20th june", "the 3rd"), clock times and ranges ("3 to 4pm"), durations
+    ("for an hour and a half") and timezone abbreviations. Phrases are resolved against today
+    in Config.DEFAULT_TIMEZONE; results are memoized per (phrase, reference date), so the cache
+    turns over naturally at midnight.
+    """
+
+    def __init__(self, timezone: Optional[str] = None, cache_size: int = 512):
+        self.config = Config()
+        self.timezone = pytz.timezone(timezone or self.config.DEFAULT_TIMEZONE)
+        self._parse_cached = functools.lru_cache(maxsize=cache_size)(self._parse)
+
+    def today(self) -> date:
+        return datetime.now(self.timezone).date()
+
+    def parse(self, text: str, reference: Optional[date] = None, default_date: Optional[date] = None) -> TemporalExpression:
+        """Resolve text relative to reference (default: today); default_date is used for
+        times given without a day, e.g. "3pm" while completing a meeting on a known date"""
+        normalized = ' '.join(text.lower().split())
+        return self._parse_cached(normalized, reference or self.today(), default_date)
+
+    def fields(self, text: str, reference: Optional[date] = None, default_date: Optional[date] = None) -> Dict[str, Any]:
+        """The classifier's extracted_data fields (ISO strings) that text determines"""
+        expression = self.parse(text, reference, default_date)
+        data = {}
+        if expression.date_range:
+            data['date_range'] = expression.date_range
+        if expression.date:
+            data['query_date'] = expression.date.strftime('%Y-%m-%d')
+        if expression.start:
+            data['start_datetime'] = expression.start.isoformat()
+        elif expression.date:
+            # Midnight marks "day known, time still missing" for check_mandatory_fields
+            data['start_datetime'] = expression.date.isoformat()
+        if expression.end:
+            data['end_datetime'] = expression.end.isoformat()
+        if expression.duration_minutes:
+            data['duration_minutes'] = expression.duration_minutes
+        if expression.timezone:
+            data['timezone'] = expression.timezone
+        return data
+
+    def cache_info(self):
+        return self._parse_cached.cache_info()
+
+    def _parse(self, text: str, reference: date, default_date: Optional[date]) -> TemporalExpression:
+        today = datetime(reference.year, reference.month, reference.day)
+        date_range = None
+        week = DATE_RANGE_RE.search(text)
+        if week:
+            date_range = f"{week.group(1)}_week"
+
+        day = self._date(text, today)
+        duration = self._duration(text)
+        tz_name, tz = self._timezone(text)
+
+        base = day
+        if base is None and default_date is not None:
+            base = datetime(default_date.year, default_date.month, default_date.day)
+        # A bare time ("3pm") is on default_date, else today; date stays None as no day was named
+        start, end = self._times(text, base or today)
+        if day is not None:
+            # "friday next week" names a day, not the whole week
+            date_range = None
+        if start is not None and tz is not None:
+            start = tz.localize(start)
+            end = tz.localize(end) if end is not None else None
+        if start is not None and end is not None and duration is None:
+            duration = int((end - start).total_seconds() // 60)
+
+        expression = TemporalExpression(day, start, end, duration, tz_name, date_range)
+        logger.debug(f"Resolved '{text}' -> {expression}")
+        return expression
+
+    def _date(self, text: str, today: datetime) -> Optional[datetime]:
+        match = RELATIVE_DAY_RE.search(text)
+        if match:
+            offsets = {'today': 0, 'tonight': 0, 'tomorrow': 1, 'day after tomorrow': 2, 'yesterday': -1}
+            return today + timedelta(days=offsets[match.group(1)])
+        match = DAYS_AHEAD_RE.search(text)
+        if match:
+            count = match.group(1) or match.group(2)
+            return today + timedelta(days=int(count) if count.isdigit() else NUMBER_WORDS[count])
+        match = CALENDAR_DATE_RE.search(text)
+        if match:
+            try:
+                day = date_parser.parse(match.group(0), default=today, dayfirst=False).replace(
+                    hour=0, minute=0, second=0, microsecond=0)
+            except (ValueError, OverflowError):
+                day = None
+            if day is not None:
+                # Dates without a year are the next one to come: "20th june" said in october is next june
+                if day < today and not re.search(r'\d{4}', match.group(0)):
+                    day += relativedelta(years=1)
+                return day
+        match = WEEKDAY_RE.search(text)
+        if match:
+            weekday = WEEKDAYS[match.group(2)]
+            if match.group('next_week'):
+                monday = today + relativedelta(days=7, weekday=MO(-1))
+                return monday + relativedelta(weekday=weekday(+1))
+            if match.group(1) != 'next':
+                # "friday", "this friday", "every friday": the next one, today included
+                return today + relativedelta(weekday=weekday(+1))
+            day = today + relativedelta(days=1, weekday=weekday(+1))
+            if day.isocalendar()[:2] == today.isocalendar()[:2]:
+                # "next friday" said on a Monday means the friday of next week
+                day += timedelta(days=7)
+            return day
+        match = ORDINAL_DAY_RE.search(text)
+        if match:
+            # "the 3rd": this month, or next month once it has passed
+            number = int(match.group(1))
+            for months_ahead in (0, 1, 2):
+                candidate = today + relativedelta(months=months_ahead)
+                try:
+                    candidate = candidate.replace(day=number)
+                except ValueError:
+                    continue
+                if candidate >= today:
+                    return candidate
+        return None
+
+    @classmethod
+    def _times(cls, text: str, day: datetime) -> Tuple[Optional[datetime], Optional[datetime]]:
+        part = DAY_PART_RE.search(text)
+        default_meridiem = None
+        if part:
+            default_meridiem = 'am' if part.group(1) == 'morning' else 'pm'
+
+        match = TIME_RANGE_RE.search(text)
+        if match and cls._has_clock(match.group('start'), match.group('end')):
+            end_meridiem = cls._meridiem(match.group('end')) or default_meridiem
+            start = cls._clock(match.group('start'), day, cls._meridiem(match.group('start')) or end_meridiem)
+            end = cls._clock(match.group('end'), day, end_meridiem)
+            if start and end and start > end:
+                # "11 to 1pm": the start is still in the morning
+                start -= timedelta(hours=12)
+            if start and end and start < end:
+                return start, end
+        match = TIME_AT_RE.search(text)
+        if match:
+            value = match.group('time') or match.group('bare')
+            return cls._clock(value, day, cls._meridiem(value) or default_meridiem), None
+        return None, None
+
+    @staticmethod
+    def _has_clock(*values: str) -> bool:
+        # "2 to 3" alone is too ambiguous (counts, durations); require am/pm, a colon or noon
+        return any(re.search(r'[ap]\.?m|:|noon|midnight', value) for value in values)
+
+    @staticmethod
+    def _meridiem(value: str) -> Optional[str]:
+        match = re.search(r'([ap])\.?m\.?', value)
+        return f"{match.group(1)}m" if match else None
+
+    @staticmethod
+    def _clock(value: str, day: datetime, meridiem: Optional[str]) -> Optional[datetime]:
+        value = value.replace('.', '').strip()
+        if value == 'noon':
+            return day.replace(hour=12)
+        if value == 'midnight':
+            return day
+        match = CLOCK_RE.fullmatch(value)
+        if not match:
+            return None
+        hour, minute = int(match.group(1)), int(match.group(2) or 0)
+        if hour > 23 or minute > 59 or (meridiem and not 1 <= hour <= 12):
+            return None
+        if meridiem:
+            hour = hour % 12 + (12 if meridiem == 'pm' else 0)
+        elif 1 <= hour <= 7:
+            # "at 3" during a working day means 3pm
+            hour += 12
+        return day.replace(hour=hour, minute=minute)
+
+    @staticmethod
+    def _duration(text: str) -> Optional[int]:
+        match = DURATION_RE.search(text)
+        if not match:
+            return None
+        if match.group('half_hour'):
+            return 30
+        count = match.group('count')
+        amount = float(count) if count[0].isdigit() else NUMBER_WORDS[count]
+        if match.group('half'):
+            amount += 0.5
+        minutes = amount * 60 if match.group('unit').startswith('h') else amount
+        return int(round(minutes)) or None
+
+    @staticmethod
+    def _timezone(text: str) -> Tuple[Optional[str], Optional[Any]]:
+        match = TIMEZONE_RE.search(text)
+        if not match:
+            return None, None
+        name = match.group(1).upper()
+        return name, pytz.timezone(TIMEZONES[name])
@@ -9,11 +9,12 @@ setup(
         "google-api-python-client==2.108.0",
         "google-auth-httplib2==0.1.1",
         "google-auth-oauthlib==1.1.0",
-        "google-generativeai==0.3.2",
+        "google-generativeai==0.8.3",
         "python-dateutil==2.8.2",
         "pytz==2023.3",
         "colorama==0.4.6",
         "python-dotenv==1.0.0",
+        "numpy>=1.24",
     ],
     python_requires=">=3.8",
 )
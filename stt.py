@@ -256,8 +256,12 @@ class RealTimeSTT:
             self.audio_queue.put(in_data)
         return (None, pyaudio.paContinue)
     
-    def start_recording(self, duration=None, silence_threshold=None, silence_duration=3.0, auto_calibrate=True):
-        """Start real-time recording and transcription with adaptive silence detection"""
+    def start_recording(self, duration=None, silence_threshold=None, silence_duration=3.0, auto_calibrate=True, on_partial=None):
+        """Start real-time recording and transcription with adaptive silence detection.
+        
+        on_partial(text) is called from a worker thread with a quick transcript of the
+        audio so far whenever the speaker pauses, before the silence timeout ends the recording.
+        """
         if duration is not None:
             print(f"Starting real-time transcription for {duration} seconds...")
         else:
@@ -322,6 +326,7 @@ class RealTimeSTT:
         consecutive_silence_chunks = 0
         required_silence_chunks = int((silence_duration * self.sample_rate) / self.chunk_size)
         silence_countdown_active = False
+        partial_thread = None
         
         print(f"🎯 Required {required_silence_chunks} consecutive silent chunks to stop")
         
@@ -363,6 +368,11 @@ class RealTimeSTT:
                             if not silence_countdown_active and consecutive_silence_chunks >= 10:  # Wait for 10 chunks to avoid false starts
                                 silence_countdown_active = True
                                 print(f"\n⏸️ Sustained silence detected, will stop after {silence_duration}s...")
+                                # The speaker has paused: what they said so far is unlikely to change
+                                if on_partial and (partial_thread is None or not partial_thread.is_alive()):
+                                    partial_thread = threading.Thread(
+                                        target=self._transcribe_partial, args=(list(audio_data), on_partial), daemon=True)
+                                    partial_thread.start()
                             
                             # Check if we've reached the required silence duration
                             if consecutive_silence_chunks >= required_silence_chunks:
@@ -442,17 +452,30 @@ class RealTimeSTT:
             return result
         return None
     
+    def _transcribe_partial(self, audio_data, on_partial):
+        """Fast greedy transcription of the audio recorded so far, passed to on_partial"""
+        try:
+            audio_float = np.frombuffer(b''.join(audio_data), dtype=np.int16).astype(np.float32) / 32768.0
+            audio_float = self._resample_audio_if_needed(audio_float, target_rate=16000)
+            segments, _ = self.stt.model.transcribe(audio_float, beam_size=1, temperature=0, vad_filter=True)
+            text = "".join(segment.text for segment in segments).strip()
+            if text:
+                on_partial(text)
+        except Exception as e:
+            print(f"\n⚠️ Partial transcription failed: {e}")
+    
     def start_recording_with_silence_detection(self, silence_threshold=0.05, silence_duration=3.0):
         """Convenience method for recording with custom silence detection parameters"""
         return self.start_recording(duration=None, silence_threshold=silence_threshold, silence_duration=silence_duration)
     
-    def start_recording_for_public_environment(self):
+    def start_recording_for_public_environment(self, on_partial=None):
         """Optimized settings for noisy public environments with auto-calibration"""
         return self.start_recording(
             duration=None, 
             silence_threshold=None,  # Use auto-calibration for better noise handling
             silence_duration=1.5,    # Shorter duration for public environments
-            auto_calibrate=True
+            auto_calibrate=True,
+            on_partial=on_partial
         )
     
     def _find_supported_sample_rate(self):
@@ -0,0 +1,69 @@
+#!/usr/bin/env python3
+"""
+Meeting index coverage tests - freshness of overlapping refreshed ranges
+Run with `python test_meeting_index.py` or pytest
+"""
+
+import sys
+import os
+import time
+from datetime import datetime, timedelta
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+import pytz
+from services.meeting_index import MeetingIndex
+
+TIMEZONE = pytz.timezone('UTC')
+SUNDAY = TIMEZONE.localize(datetime(2026, 10, 18))
+MONDAY = SUNDAY + timedelta(days=1)
+
+def test_shifted_range_takes_new_timestamp():
+    """A refresh overlapping an older range is fresh; only the older range's leftover part is stale"""
+    index = MeetingIndex(TIMEZONE)
+    index.replace_range(SUNDAY, SUNDAY + timedelta(days=15), [], indexed_at=time.time() - 3600)
+    index.replace_range(MONDAY, MONDAY + timedelta(days=15), [])
+
+    assert index.covers(MONDAY, MONDAY + timedelta(days=1), max_age=120)
+    assert index.covers(MONDAY, MONDAY + timedelta(days=15), max_age=120)
+    assert not index.covers(SUNDAY, MONDAY, max_age=120)
+    assert index.covers(SUNDAY, MONDAY + timedelta(days=15))
+
+def test_nested_range_takes_new_timestamp():
+    """A refresh inside an older range is fresh, the older range on both sides of it is not"""
+    index = MeetingIndex(TIMEZONE)
+    index.replace_range(SUNDAY, SUNDAY + timedelta(days=15), [], indexed_at=time.time() - 3600)
+    index.replace_range(MONDAY, MONDAY + timedelta(days=2), [])
+
+    assert index.covers(MONDAY, MONDAY + timedelta(days=2), max_age=120)
+    assert not index.covers(SUNDAY, MONDAY + timedelta(days=1), max_age=120)
+    assert not index.covers(MONDAY + timedelta(days=1), MONDAY + timedelta(days=3), max_age=120)
+    assert index.covers(SUNDAY, SUNDAY + timedelta(days=15))
+
+def test_prefetch_refresh_is_cached_after_window_moves():
+    """After the prefetch window start moves forward, the new refresh is served from the index"""
+    from services.calendar_prefetcher import CalendarPrefetcher
+
+    class FakeCalendarManager:
+        timezone = TIMEZONE
+
+        def __init__(self):
+            self.meeting_index = MeetingIndex(TIMEZONE)
+
+        def refresh_range(self, start, end):
+            self.meeting_index.replace_range(start, end, [])
+            return True
+
+    manager = FakeCalendarManager()
+    prefetcher = CalendarPrefetcher(manager)
+    start, end = prefetcher.window()
+    # The previous window started a day earlier and was refreshed a while ago
+    manager.meeting_index.replace_range(start - timedelta(days=1), end - timedelta(days=1), [],
+                                        indexed_at=time.time() - 3600)
+    assert prefetcher.refresh()
+    assert manager.meeting_index.covers(start, end, max_age=prefetcher.config.PREFETCH_MAX_AGE_SECONDS)
+
+if __name__ == "__main__":
+    for test in (test_shifted_range_takes_new_timestamp, test_nested_range_takes_new_timestamp,
+                 test_prefetch_refresh_is_cached_after_window_moves):
+        test()
+        print(f"✅ {test.__name__}")